@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+离线解析基准测试
+
+对 fixtures/manifest.json 中登记的已录制 HTML 逐个平台运行爬虫的
+`parse_content`，统计吞吐（docs/s、MB/s）、p50/p99 延迟以及峰值内存，
+并可输出 JSON 结果、与历史基线对比，用于在上线前发现解析性能或结果回归。
+
+用法:
+    # 录制缺失的 fixture，并用线上页面替换标记为 synthetic 的脱敏页面（需要网络）
+    python -m benchmarks.parse_benchmark --record
+    # 运行基准测试并保存结果
+    python -m benchmarks.parse_benchmark --output bench.json
+    # 与基线对比，吞吐下降超过 20% 时以非零状态码退出
+    python -m benchmarks.parse_benchmark --baseline bench.json --max-regression 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import logging
+import platform as platform_module
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+MANIFEST_PATH = FIXTURES_DIR / "manifest.json"
+
+# 平台 -> 爬虫类
+CRAWLERS: Dict[str, str] = {
+    "wechat": "news_crawler.wechat_news:WeChatNewsCrawler",
+    "toutiao": "news_crawler.toutiao_news:ToutiaoNewsCrawler",
+    "netease": "news_crawler.netease_news:NeteaseNewsCrawler",
+    "sohu": "news_crawler.sohu_news:SohuNewsCrawler",
+    "tencent": "news_crawler.tencent_news:TencentNewsCrawler",
+    "detik": "news_crawler.detik_news:DetikNewsCrawler",
+    "naver": "news_crawler.naver_news:NaverNewsCrawler",
+    "lenny": "news_crawler.lennysnewsletter:LennysNewsletterCrawler",
+    "quora": "news_crawler.quora:QuoraAnswerCrawler",
+    "bbc": "news_crawler.bbc_news:BBCNewsCrawler",
+    "cnn": "news_crawler.cnn_news:CNNNewsCrawler",
+}
+
+
+@dataclass
+class Fixture:
+    """一份已录制的文章 HTML"""
+    platform: str
+    url: str
+    file: str
+    expected: Dict[str, object] = field(default_factory=dict)
+    # 离线环境下按解析器结构生成的脱敏页面，--record 时会被线上页面替换
+    synthetic: bool = False
+
+    @property
+    def path(self) -> Path:
+        return FIXTURES_DIR / self.file
+
+
+@dataclass
+class PlatformResult:
+    """单个平台的基准测试结果"""
+    platform: str
+    status: str = "ok"
+    docs: int = 0
+    iterations: int = 0
+    total_bytes: int = 0
+    docs_per_sec: float = 0.0
+    mb_per_sec: float = 0.0
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    peak_memory_kb: float = 0.0
+    missing: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+
+def load_manifest(platforms: Optional[List[str]] = None) -> Dict[str, List[Fixture]]:
+    """读取 fixture 清单，可按平台过滤"""
+    manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    fixtures: Dict[str, List[Fixture]] = {}
+    for name, entries in manifest["platforms"].items():
+        if platforms and name not in platforms:
+            continue
+        fixtures[name] = [Fixture(platform=name, **entry) for entry in entries]
+    return fixtures
+
+
+def create_crawler(platform: str, url: str):
+    """实例化平台爬虫，并关闭解析过程中的 INFO 日志以免干扰计时"""
+    module_name, class_name = CRAWLERS[platform].split(":")
+    crawler_class = getattr(importlib.import_module(module_name), class_name)
+    crawler = crawler_class(url, save_path=None)
+    crawler.logger.setLevel(logging.WARNING)
+    return crawler
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """最近秩法计算百分位数"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def check_expected(fixture: Fixture, news_item) -> Optional[str]:
+    """校验解析结果与清单中记录的期望值是否一致"""
+    expected_title = fixture.expected.get("title")
+    if expected_title is not None and news_item.title != expected_title:
+        return f"{fixture.file}: title {news_item.title!r} != {expected_title!r}"
+    expected_contents = fixture.expected.get("contents")
+    if expected_contents is not None and len(news_item.contents) != expected_contents:
+        return (
+            f"{fixture.file}: {len(news_item.contents)} contents, "
+            f"expected {expected_contents}"
+        )
+    return None
+
+
+def bench_platform(
+    platform: str, fixtures: List[Fixture], iterations: int, warmup: int
+) -> PlatformResult:
+    """对单个平台的所有 fixture 进行计时和内存测量"""
+    result = PlatformResult(platform=platform)
+    documents = []
+    for fixture in fixtures:
+        if not fixture.path.exists():
+            result.missing.append(fixture.file)
+            continue
+        html = fixture.path.read_text(encoding="utf-8")
+        documents.append((fixture, create_crawler(platform, fixture.url), html))
+
+    if not documents:
+        result.status = "missing"
+        return result
+
+    latencies: List[float] = []
+    for fixture, crawler, html in documents:
+        try:
+            news_item = crawler.parse_content(html)
+        except Exception as exc:
+            result.errors.append(f"{fixture.file}: {exc!r}")
+            continue
+        mismatch = check_expected(fixture, news_item)
+        if mismatch:
+            result.errors.append(mismatch)
+
+        for _ in range(warmup):
+            crawler.parse_content(html)
+        size = len(html.encode("utf-8"))
+        for _ in range(iterations):
+            started = time.perf_counter()
+            crawler.parse_content(html)
+            latencies.append(time.perf_counter() - started)
+            result.total_bytes += size
+        result.docs += 1
+
+        # tracemalloc 会显著拖慢解析，因此与计时分开单独跑一次
+        tracemalloc.start()
+        try:
+            crawler.parse_content(html)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result.peak_memory_kb = max(result.peak_memory_kb, peak / 1024)
+
+    if result.errors:
+        result.status = "error"
+    total_seconds = sum(latencies)
+    result.iterations = len(latencies)
+    if total_seconds > 0:
+        result.docs_per_sec = len(latencies) / total_seconds
+        result.mb_per_sec = result.total_bytes / total_seconds / (1024 * 1024)
+    result.p50_ms = percentile(latencies, 50) * 1000
+    result.p99_ms = percentile(latencies, 99) * 1000
+    return result
+
+
+def record_fixtures(
+    fixtures: Dict[str, List[Fixture]], overwrite: bool = False
+) -> None:
+    """抓取线上页面并保存为 fixture（需要网络），同时记录期望的解析结果"""
+    manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    for platform, items in fixtures.items():
+        for index, fixture in enumerate(items):
+            if fixture.path.exists() and not overwrite and not fixture.synthetic:
+                continue
+            crawler = create_crawler(platform, fixture.url)
+            try:
+                html = crawler.fetch_content()
+                news_item = crawler.parse_content(html)
+            except Exception as exc:
+                print(f"[skip] {platform} {fixture.url}: {exc}", file=sys.stderr)
+                continue
+            fixture.path.parent.mkdir(parents=True, exist_ok=True)
+            fixture.path.write_text(html, encoding="utf-8")
+            entry = manifest["platforms"][platform][index]
+            entry["expected"] = {
+                "title": news_item.title,
+                "contents": len(news_item.contents),
+            }
+            entry.pop("synthetic", None)
+            print(f"[recorded] {platform} {fixture.file}")
+    MANIFEST_PATH.write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def compare_with_baseline(
+    results: List[PlatformResult], baseline_path: Path, max_regression: float
+) -> List[str]:
+    """与基线结果对比，返回吞吐下降超过阈值的平台说明"""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {item["platform"]: item for item in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get(result.platform)
+        if not before or result.status == "missing" or not before.get("docs_per_sec"):
+            continue
+        change = result.docs_per_sec / before["docs_per_sec"] - 1
+        if change < -max_regression:
+            regressions.append(
+                f"{result.platform}: {before['docs_per_sec']:.1f} -> "
+                f"{result.docs_per_sec:.1f} docs/s ({change:+.1%})"
+            )
+    return regressions
+
+
+def print_table(results: List[PlatformResult]) -> None:
+    header = f"{'platform':<10}{'status':<9}{'docs':>5}{'docs/s':>10}{'MB/s':>8}{'p50 ms':>9}{'p99 ms':>9}{'peak KB':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r.platform:<10}{r.status:<9}{r.docs:>5}{r.docs_per_sec:>10.1f}"
+            f"{r.mb_per_sec:>8.2f}{r.p50_ms:>9.2f}{r.p99_ms:>9.2f}{r.peak_memory_kb:>10.0f}"
+        )
+        for error in r.errors:
+            print(f"  ! {error}")
+        if r.missing:
+            print(f"  - {len(r.missing)} fixture(s) missing, run with --record")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline parse_content benchmark")
+    parser.add_argument("platforms", nargs="*", help="只测试指定平台（默认全部）")
+    parser.add_argument("-n", "--iterations", type=int, default=20, help="每个 fixture 的计时次数")
+    parser.add_argument("--warmup", type=int, default=2, help="每个 fixture 的预热次数")
+    parser.add_argument("-o", "--output", type=Path, help="将结果写入 JSON 文件")
+    parser.add_argument("--baseline", type=Path, help="用于对比的历史 JSON 结果")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="允许的吞吐下降比例")
+    parser.add_argument("--record", action="store_true", help="抓取缺失或 synthetic 的 fixture（需要网络）")
+    parser.add_argument("--overwrite", action="store_true", help="与 --record 一起使用，重新录制已有 fixture")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.platforms) - set(CRAWLERS)
+    if unknown:
+        parser.error(f"unknown platform(s): {', '.join(sorted(unknown))}")
+
+    fixtures = load_manifest(args.platforms)
+    if args.record:
+        record_fixtures(fixtures, overwrite=args.overwrite)
+        fixtures = load_manifest(args.platforms)
+
+    results = [
+        bench_platform(name, items, args.iterations, args.warmup)
+        for name, items in fixtures.items()
+    ]
+    print_table(results)
+
+    if args.output:
+        payload = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform_module.python_version(),
+            "machine": platform_module.platform(),
+            "iterations": args.iterations,
+            "results": [asdict(r) for r in results],
+        }
+        args.output.write_text(
+            json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+
+    exit_code = 1 if any(r.status == "error" for r in results) else 0
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+响应序列化基准测试
+
+对比一篇文章从爬虫返回的 NewsItem 到 API 响应 JSON 的两种路径：
+
+- legacy: model_dump() -> 旧版 dict 模型 -> to_dict() -> jsonable_encoder -> json.dumps
+  （旧版适配器 + FastAPI response_model 的做法，每次请求复制多份 dict 树）
+- direct: pydantic_core.to_json() 直接输出 UTF-8 字节并拼接到响应中（当前做法）
+
+统计每种路径的单次耗时、tracemalloc 峰值内存以及中间拷贝（峰值减去最终输出）占用的内存。
+
+用法:
+    python -m benchmarks.serialize_benchmark
+    python -m benchmarks.serialize_benchmark --contents 2000 -n 50
+    python -m benchmarks.serialize_benchmark --fixture quora/best-life-advice.html --platform quora
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from news_crawler.core.models import ContentItem, ContentType, NewsItem, NewsMetaInfo
+
+from .parse_benchmark import FIXTURES_DIR, create_crawler, load_manifest, percentile
+
+
+def synthetic_item(contents: int) -> NewsItem:
+    """构造一篇包含指定数量内容块的长文章（约 1/5 为图片）"""
+    items = []
+    for index in range(contents):
+        if index % 5 == 4:
+            items.append(
+                ContentItem(
+                    type=ContentType.IMAGE,
+                    content=f"https://mmbiz.qpic.cn/mmbiz_jpg/{index:08d}/640?wx_fmt=jpeg",
+                )
+            )
+        else:
+            items.append(ContentItem(type=ContentType.TEXT, content=f"第 {index} 段正文。" * 12))
+    return NewsItem(
+        title="序列化基准测试文章",
+        news_url="https://mp.weixin.qq.com/s/benchmark",
+        news_id="benchmark",
+        meta_info=NewsMetaInfo(author_name="benchmark", publish_time="2024-01-01 00:00:00"),
+        contents=items,
+    )
+
+
+def fixture_item(platform: str, file: str) -> NewsItem:
+    """解析一份已录制的 fixture"""
+    fixture = next(
+        (item for item in load_manifest([platform]).get(platform, []) if item.file == file),
+        None,
+    )
+    if fixture is None:
+        raise SystemExit(f"fixture {file!r} not found for platform {platform!r}")
+    html = (FIXTURES_DIR / fixture.file).read_text(encoding="utf-8")
+    return create_crawler(platform, fixture.url).parse_content(html)
+
+
+def legacy_serialize(news_item: NewsItem) -> bytes:
+    """复现旧版路径：两次 dict 转换 + jsonable_encoder + json.dumps"""
+    from fastapi.encoders import jsonable_encoder
+
+    data = news_item.model_dump()
+    meta_info = data.get("meta_info", {})
+    # 旧版 news_extractor_core.models.NewsItem(data).to_dict()
+    legacy = {
+        "title": data.get("title", ""),
+        "news_url": data.get("news_url", ""),
+        "news_id": data.get("news_id", ""),
+        "meta_info": meta_info,
+        "contents": data.get("contents", []),
+        "texts": data.get("texts", []),
+        "images": data.get("images", []),
+        "videos": data.get("videos", []),
+    }
+    response = {"status": "success", "data": legacy, "platform": "benchmark"}
+    return json.dumps(jsonable_encoder(response), ensure_ascii=False).encode("utf-8")
+
+
+def direct_serialize(news_item: NewsItem) -> bytes:
+    """当前路径：Pydantic 直接输出 JSON 并拼接到响应中"""
+    from news_extractor_core.models import dump_news_item_json
+
+    head = json.dumps({"status": "success", "platform": "benchmark"}, ensure_ascii=False).encode("utf-8")
+    return b"".join((head[:-1], b', "data": ', dump_news_item_json(news_item), b"}"))
+
+
+def measure(func: Callable[[NewsItem], bytes], news_item: NewsItem, iterations: int) -> Dict[str, Any]:
+    """计时并单独测量一次峰值内存"""
+    func(news_item)
+    latencies: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func(news_item)
+        latencies.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        output = func(news_item)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "peak_kb": peak / 1024,
+        "transient_kb": (peak - retained) / 1024,
+        "output_kb": len(output) / 1024,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="NewsItem response serialization benchmark")
+    parser.add_argument("--contents", type=int, default=500, help="合成文章的内容块数量")
+    parser.add_argument("--platform", help="使用 fixture 时的平台名称")
+    parser.add_argument("--fixture", help="使用已录制 fixture（相对 fixtures 目录的路径）代替合成文章")
+    parser.add_argument("-n", "--iterations", type=int, default=20, help="计时次数")
+    args = parser.parse_args(argv)
+
+    if args.fixture:
+        if not args.platform:
+            parser.error("--fixture requires --platform")
+        news_item = fixture_item(args.platform, args.fixture)
+    else:
+        news_item = synthetic_item(args.contents)
+
+    legacy = json.loads(legacy_serialize(news_item))["data"]
+    direct = json.loads(direct_serialize(news_item))["data"]
+    if legacy != direct:
+        print("ERROR: legacy and direct outputs differ", file=sys.stderr)
+        return 1
+
+    results = {
+        "legacy": measure(legacy_serialize, news_item, args.iterations),
+        "direct": measure(direct_serialize, news_item, args.iterations),
+    }
+    print(f"contents: {len(news_item.contents)}")
+    print(f"{'path':<8}{'p50 ms':>9}{'p99 ms':>9}{'peak KB':>10}{'temp KB':>10}{'out KB':>9}")
+    for name, r in results.items():
+        print(
+            f"{name:<8}{r['p50_ms']:>9.2f}{r['p99_ms']:>9.2f}{r['peak_kb']:>10.0f}"
+            f"{r['transient_kb']:>10.0f}{r['output_kb']:>9.0f}"
+        )
+    legacy_temp = results["legacy"]["transient_kb"]
+    if legacy_temp:
+        saved = 1 - results["direct"]["transient_kb"] / legacy_temp
+        print(f"intermediate allocations saved: {saved:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
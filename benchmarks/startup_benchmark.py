@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+启动耗时基准测试
+
+在全新的子进程中以 `python -X importtime` 导入后端 / MCP 入口模块，解析 importtime
+输出，统计入口模块的累计导入耗时、被导入的爬虫模块数量以及自身耗时最高的模块。
+加上 --eager 时会在导入后预加载所有已启用的适配器，用来对比按需导入与全部导入的差异。
+
+用法:
+    python -m benchmarks.startup_benchmark
+    python -m benchmarks.startup_benchmark --eager
+    python -m benchmarks.startup_benchmark --platforms wechat,toutiao --eager
+    python -m benchmarks.startup_benchmark -n 10 --top 15
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+TARGETS: Dict[str, str] = {
+    "backend": "news_extractor_backend.main",
+    "mcp": "news_extractor_mcp.server",
+    "core": "news_extractor_core.services",
+}
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportSample:
+    """一次子进程导入的解析结果"""
+    total_us: int = 0
+    modules: int = 0
+    crawler_modules: List[str] = field(default_factory=list)
+    self_us: Dict[str, int] = field(default_factory=dict)
+
+
+def run_once(module: str, eager: bool, platforms: Optional[str]) -> ImportSample:
+    """在新进程中导入模块并解析 -X importtime 输出"""
+    code = f"import {module}"
+    if eager:
+        code += "; from news_extractor_core.services.extractor import ADAPTERS; ADAPTERS.preload()"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    if platforms is not None:
+        env["ENABLED_PLATFORMS"] = platforms
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    sample = ImportSample()
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        sample.modules += 1
+        sample.self_us[name] = int(self_us)
+        if not indent.strip(" ") and len(indent) == 1:
+            # 顶层导入：累加得到整个导入过程的耗时
+            sample.total_us += int(cumulative_us)
+        if name.startswith("news_crawler.") and name.count(".") == 1 and name != "news_crawler.core":
+            sample.crawler_modules.append(name)
+    return sample
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold import-time benchmark (python -X importtime)")
+    parser.add_argument("targets", nargs="*", default=["backend", "mcp"], help=f"入口: {', '.join(TARGETS)}")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="每个入口的子进程次数（取中位数）")
+    parser.add_argument("--eager", action="store_true", help="导入后预加载所有已启用的适配器")
+    parser.add_argument("--platforms", help="设置 ENABLED_PLATFORMS，例如 wechat,toutiao")
+    parser.add_argument("--top", type=int, default=10, help="显示自身耗时最高的 N 个模块")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(sorted(unknown))}")
+
+    for target in args.targets:
+        module = TARGETS[target]
+        samples = [run_once(module, args.eager, args.platforms) for _ in range(args.runs)]
+        median_ms = statistics.median(s.total_us for s in samples) / 1000
+        last = samples[-1]
+        mode = "eager" if args.eager else "lazy"
+        print(f"{target} ({module}, {mode}): median {median_ms:.1f} ms over {args.runs} runs, "
+              f"{last.modules} modules")
+        crawlers = ", ".join(sorted(last.crawler_modules)) or "none"
+        print(f"  crawler packages imported: {crawlers}")
+        print("  slowest modules (self time):")
+        for name, self_us in sorted(last.self_us.items(), key=lambda item: -item[1])[: args.top]:
+            print(f"    {self_us / 1000:>8.1f} ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
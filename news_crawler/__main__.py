@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+批量抓取命令行
+
+用法:
+    python -m news_crawler urls.txt --save-path data/
+    cat urls.jsonl | python -m news_crawler - --fetch-concurrency 64
+"""
+import argparse
+import json
+import logging
+import sys
+from typing import List, Optional
+
+from news_crawler.core.pipeline import CrawlPipeline, PlatformResolver
+from news_crawler.core.politeness import HostPolicy, configure_politeness
+from news_crawler.core.retry import configure_retry_budget
+from news_crawler.core.sinks import SINKS, open_sink
+from news_crawler.core.store import ArticleStore
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m news_crawler",
+        description="Crawl a list of article URLs (one per line or JSONL, '-' for stdin)."
+    )
+    parser.add_argument("source", help="URL file or '-' for stdin")
+    parser.add_argument("--save-path", default="data/", help="Output directory")
+    parser.add_argument(
+        "--format",
+        choices=sorted(SINKS),
+        default="json",
+        help=(
+            "json: one file per article; jsonl: rotated gzip JSON Lines; "
+            "parquet: columnar files (needs pyarrow); sqlite: article store with upserts"
+        ),
+    )
+    parser.add_argument("--rotate-mb", type=int, default=256, help="Rotate JSONL files after this many MB")
+    parser.add_argument("--no-compress", action="store_true", help="Write plain .jsonl instead of .jsonl.gz")
+    parser.add_argument(
+        "--skip-existing", action="store_true", help="With --format sqlite, do not re-crawl stored articles"
+    )
+    parser.add_argument("--row-group-size", type=int, default=10_000, help="Parquet rows per row group")
+    parser.add_argument("--fetch-concurrency", type=int, default=32)
+    parser.add_argument("--parse-concurrency", type=int, default=None)
+    parser.add_argument("--sink-concurrency", type=int, default=1)
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--report-interval", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    # 与 API 服务使用同一组环境变量（HOST_RATE_LIMIT、RETRY_BUDGET_RATIO 等）配置按站点限速和重试预算
+    from news_extractor_core import config
+
+    politeness = HostPolicy(
+        rate=config.HOST_RATE_LIMIT,
+        burst=config.HOST_BURST,
+        max_in_flight=config.HOST_MAX_IN_FLIGHT,
+    )
+    configure_politeness(politeness, enabled=config.POLITENESS_ENABLED)
+    configure_retry_budget(config.RETRY_BUDGET_RATIO, config.RETRY_BUDGET_MIN)
+    if args.format == "jsonl":
+        sink = open_sink(
+            "jsonl", args.save_path, max_bytes=args.rotate_mb * 1024 * 1024, compress=not args.no_compress
+        )
+    elif args.format == "parquet":
+        sink = open_sink("parquet", args.save_path, row_group_size=args.row_group_size)
+    else:
+        sink = open_sink(args.format, args.save_path)
+    pipeline = CrawlPipeline(
+        resolver=PlatformResolver(args.save_path),
+        sink=sink,
+        skip_if=sink.seen if args.skip_existing and isinstance(sink, ArticleStore) else None,
+        fetch_concurrency=args.fetch_concurrency,
+        parse_concurrency=args.parse_concurrency,
+        sink_concurrency=args.sink_concurrency,
+        queue_size=args.queue_size,
+        report_interval=args.report_interval,
+        politeness=politeness if config.POLITENESS_ENABLED else None,
+    )
+    with sink:
+        snapshot = pipeline.run(args.source)
+    print(json.dumps(snapshot, indent=2))
+    return 0 if not any(stage["failed"] for stage in snapshot["stages"].values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
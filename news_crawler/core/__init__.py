@@ -4,7 +4,67 @@ Core primitives shared by all news crawler implementations.
 """
 
 from .base import BaseNewsCrawler
-from .fetchers import CurlCffiFetcher, FetchRequest, FetchStrategy, RequestsFetcher
+from .cache import CacheEntry, CachingFetcher, ResponseCache
+from .context import HtmlSource, ParseContext
+from .executor import (
+    BoundedExecutor,
+    ExecutorSaturated,
+    WorkTiming,
+    configure_parse_executor,
+    get_parse_executor,
+    run_in_parse_executor,
+    start_timing,
+)
+from .fetchers import (
+    AsyncCurlCffiFetcher,
+    AsyncFetchStrategy,
+    AsyncRequestsFetcher,
+    AsyncSessionPool,
+    CurlCffiFetcher,
+    FetchArchive,
+    FetchError,
+    FetchRequest,
+    FetchResponse,
+    FetchStrategy,
+    LatencyModel,
+    PoolConfig,
+    RecordingFetcher,
+    ReplayFetcher,
+    RequestsFetcher,
+    SessionPool,
+    aclose_pools,
+    close_pools,
+    configure_pools,
+)
+from .parse_pool import (
+    OFFLINE_FETCHER,
+    OfflineFetcher,
+    ProcessParsePool,
+    configure_parse_pool,
+    get_parse_pool,
+)
+from .pipeline import (
+    CrawlPipeline,
+    PlatformResolver,
+    StageStats,
+    UrlRecord,
+    iter_urls,
+    save_json_sink,
+)
+from .politeness import (
+    HostPolicy,
+    PolitenessScheduler,
+    configure_politeness,
+    get_politeness,
+    parse_retry_after,
+)
+from .retry import (
+    RetryBudget,
+    RetryPolicy,
+    configure_retry_budget,
+    get_retry_budget,
+    is_retryable,
+)
 from .models import (
     DEFAULT_USER_AGENT,
     ContentItem,
@@ -14,18 +74,77 @@ from .models import (
     RequestHeaders,
 )
 from .protocols import ContentParser
+from .sinks import ArticleSink, JsonFileSink, JsonlSink, ParquetSink, open_sink
+from .store import ArticleStore, content_hash
+from .urls import canonical_url
 
 __all__ = [
+    "ArticleSink",
+    "ArticleStore",
+    "AsyncCurlCffiFetcher",
+    "AsyncFetchStrategy",
+    "AsyncRequestsFetcher",
+    "AsyncSessionPool",
     "BaseNewsCrawler",
+    "BoundedExecutor",
+    "CacheEntry",
+    "CachingFetcher",
     "ContentItem",
     "ContentParser",
     "ContentType",
+    "CrawlPipeline",
     "CurlCffiFetcher",
     "DEFAULT_USER_AGENT",
+    "ExecutorSaturated",
+    "FetchArchive",
+    "FetchError",
     "FetchRequest",
+    "FetchResponse",
     "FetchStrategy",
+    "HostPolicy",
+    "HtmlSource",
+    "JsonFileSink",
+    "JsonlSink",
+    "LatencyModel",
     "NewsItem",
     "NewsMetaInfo",
+    "OFFLINE_FETCHER",
+    "OfflineFetcher",
+    "ParquetSink",
+    "ParseContext",
+    "PlatformResolver",
+    "PolitenessScheduler",
+    "PoolConfig",
+    "ProcessParsePool",
+    "RecordingFetcher",
+    "ReplayFetcher",
     "RequestHeaders",
     "RequestsFetcher",
+    "ResponseCache",
+    "RetryBudget",
+    "RetryPolicy",
+    "SessionPool",
+    "StageStats",
+    "UrlRecord",
+    "WorkTiming",
+    "aclose_pools",
+    "canonical_url",
+    "close_pools",
+    "configure_parse_executor",
+    "configure_parse_pool",
+    "configure_politeness",
+    "configure_pools",
+    "configure_retry_budget",
+    "content_hash",
+    "get_parse_executor",
+    "get_parse_pool",
+    "get_politeness",
+    "get_retry_budget",
+    "is_retryable",
+    "iter_urls",
+    "open_sink",
+    "parse_retry_after",
+    "run_in_parse_executor",
+    "save_json_sink",
+    "start_timing",
 ]
@@ -1,16 +1,28 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Type
+from typing import Any, Dict, Optional, Type
 
-from tenacity import Retrying, stop_after_attempt, wait_fixed
+from tenacity import AsyncRetrying, RetryCallState, Retrying, stop_after_attempt
 
-from .fetchers import CurlCffiFetcher, FetchRequest, FetchStrategy, RequestsFetcher
+from .context import HtmlSource, ParseContext
+from .executor import run_in_parse_executor
+from .fetchers import (
+    AsyncFetchStrategy,
+    AsyncRequestsFetcher,
+    FetchRequest,
+    FetchStrategy,
+    RequestsFetcher,
+)
 from .models import ContentItem, NewsItem, NewsMetaInfo, RequestHeaders
+from .parse_pool import OFFLINE_FETCHER, get_parse_pool
+from .retry import RetryPolicy, get_retry_budget
+from .sinks import ArticleSink
 
 
 class BaseNewsCrawler(ABC):
@@ -19,28 +31,44 @@ class BaseNewsCrawler(ABC):
 
     Subclasses implement platform-specific parsing while reusing the shared
     fetching, validation, and persistence logic.
+
+    Crawling is split into a fetch stage (`fetch_content` / `afetch_content`,
+    the only code allowed to do network I/O) and a pure parse stage
+    (`parse_content`), which depends only on the HTML, the URL and
+    `parse_state()`. That lets the parse stage run in another process, see
+    `for_parsing` and `ProcessParsePool`.
     """
 
+    # Platform id (see news_extractor_core.platforms); keys stored articles.
+    platform: str = ""
     headers_model: Type[RequestHeaders] = RequestHeaders
     fetch_strategy: Type[FetchStrategy] = RequestsFetcher
+    async_fetch_strategy: Type[AsyncFetchStrategy] = AsyncRequestsFetcher
     fetch_attempts: int = 3
     fetch_wait_seconds: float = 1.0
     fetch_timeout: float = 15.0
+    # Overrides the backoff derived from fetch_attempts / fetch_wait_seconds.
+    retry_policy: Optional[RetryPolicy] = None
     persist_by_default: bool = True
+    # Set to False if parse_content needs state that parse_state() cannot carry.
+    parse_in_process: bool = True
 
     def __init__(
         self,
         new_url: str,
-        save_path: str = "data/",
+        save_path: Optional[str] = "data/",
         headers: Optional[RequestHeaders] = None,
         fetcher: Optional[FetchStrategy] = None,
+        async_fetcher: Optional[AsyncFetchStrategy] = None,
     ):
         self.new_url = new_url
         self.url = new_url  # Compatibility with legacy usages
-        self.save_path = Path(save_path)
+        # None means "never touch the filesystem" (API / in-memory extraction).
+        self.save_path: Optional[Path] = Path(save_path) if save_path is not None else None
         self.headers_model_instance = headers or self.headers_model()
         self.headers = self.headers_model_instance.to_http_headers()
         self.fetcher = fetcher or self.create_fetcher()
+        self.async_fetcher = async_fetcher or self.create_async_fetcher()
         self.logger = logging.getLogger(self.__class__.__name__)
         if not self.logger.handlers:
             handler = logging.StreamHandler()
@@ -67,26 +95,105 @@ class BaseNewsCrawler(ABC):
             timeout=self.fetch_timeout,
         )
 
+    def get_retry_policy(self) -> RetryPolicy:
+        """Retry policy for this crawler; set `retry_policy` on a subclass to override."""
+        if self.retry_policy is not None:
+            return self.retry_policy
+        return RetryPolicy(attempts=self.fetch_attempts, base_delay=self.fetch_wait_seconds)
+
+    def _retry_options(self) -> dict:
+        """tenacity arguments: retry only retriable errors, within the shared budget."""
+        policy = self.get_retry_policy()
+        budget = get_retry_budget()
+        budget.record_request()
+
+        def should_retry(retry_state: RetryCallState) -> bool:
+            exc = retry_state.outcome.exception() if retry_state.outcome else None
+            if exc is None or retry_state.attempt_number >= policy.attempts:
+                return False
+            if not policy.should_retry(exc):
+                return False
+            if not budget.try_spend():
+                self.logger.warning("Retry budget exhausted, giving up on %s: %s", self.new_url, exc)
+                return False
+            return True
+
+        def wait(retry_state: RetryCallState) -> float:
+            exc = retry_state.outcome.exception() if retry_state.outcome else None
+            return policy.delay(retry_state.attempt_number, exc)
+
+        def before_sleep(retry_state: RetryCallState) -> None:
+            self.logger.info(
+                "Retrying %s in %.2fs after %r",
+                self.new_url,
+                retry_state.next_action.sleep if retry_state.next_action else 0.0,
+                retry_state.outcome.exception() if retry_state.outcome else None,
+            )
+
+        return {
+            "stop": stop_after_attempt(policy.attempts),
+            "wait": wait,
+            "retry": should_retry,
+            "before_sleep": before_sleep,
+            "reraise": True,
+        }
+
     def fetch_content(self) -> str:
-        """Fetch remote HTML with retry semantics."""
+        """Fetch remote HTML, retrying transient failures with backoff."""
         request = self.build_fetch_request()
-        retryer = Retrying(
-            stop=stop_after_attempt(self.fetch_attempts),
-            wait=wait_fixed(self.fetch_wait_seconds),
-            reraise=True,
-        )
+        retryer = Retrying(**self._retry_options())
         return retryer(self._fetch_once, request)
 
     def _fetch_once(self, request: FetchRequest) -> str:
         self.logger.info("Start to fetch content from %s", request.url)
         return self.fetcher.fetch(request)
 
+    def create_async_fetcher(self) -> AsyncFetchStrategy:
+        """Instantiate the async fetch strategy used for this crawler."""
+        return self.async_fetch_strategy()
+
+    async def afetch_content(self) -> str:
+        """Fetch remote HTML on the running event loop, retrying transient failures."""
+        request = self.build_fetch_request()
+        retryer = AsyncRetrying(**self._retry_options())
+        return await retryer(self._afetch_once, request)
+
+    async def _afetch_once(self, request: FetchRequest) -> str:
+        self.logger.info("Start to fetch content from %s", request.url)
+        return await self.async_fetcher.afetch(request)
+
     # ---------------------------------------------------------------------- #
     # Parsing
     # ---------------------------------------------------------------------- #
+    def create_parse_context(self, html: HtmlSource) -> ParseContext:
+        """Wrap the fetched HTML so every sub-parser shares one parsed tree."""
+        return ParseContext.of(html)
+
     @abstractmethod
-    def parse_content(self, html: str) -> NewsItem:
-        """Convert raw HTML into a NewsItem."""
+    def parse_content(self, html: HtmlSource) -> NewsItem:
+        """Convert raw HTML (or a ParseContext wrapping it) into a NewsItem."""
+
+    async def aparse_content(self, html: HtmlSource) -> NewsItem:
+        """
+        Run `parse_content` off the event loop: in the process parse pool when
+        one is installed, otherwise in the parse executor (threads).
+        """
+        pool = get_parse_pool()
+        if pool is not None and self.parse_in_process:
+            return await pool.aparse(self, html)
+        return await run_in_parse_executor(self.parse_content, self.create_parse_context(html))
+
+    def parse_state(self) -> Dict[str, Any]:
+        """Picklable attributes, besides the URL, that `parse_content` relies on."""
+        return {}
+
+    @classmethod
+    def for_parsing(cls, new_url: str, state: Optional[Dict[str, Any]] = None) -> "BaseNewsCrawler":
+        """Build a network-less instance that can only run the parse stage."""
+        crawler = cls(new_url, save_path=None, fetcher=OFFLINE_FETCHER, async_fetcher=OFFLINE_FETCHER)
+        for name, value in (state or {}).items():
+            setattr(crawler, name, value)
+        return crawler
 
     # ---------------------------------------------------------------------- #
     # Validation & persistence
@@ -98,22 +205,55 @@ class BaseNewsCrawler(ABC):
 
     def save_as_json(self, news_item: NewsItem) -> Path:
         """Persist the NewsItem as JSON."""
-        self.save_path.mkdir(parents=True, exist_ok=True)
-        path = self.save_path / f"{self.get_article_id()}.json"
+        path = Path(self.get_save_json_path())
+        path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(
             json.dumps(news_item.to_dict(), ensure_ascii=False, indent=4),
             encoding="utf-8",
         )
         return path
 
-    def run(self, persist: Optional[bool] = None) -> NewsItem:
-        """Full crawling pipeline."""
-        should_persist = self.persist_by_default if persist is None else persist
+    def should_persist(self, persist: Optional[bool] = None) -> bool:
+        """Resolve the persist flag; crawlers without a save_path never persist by default."""
+        if persist is None:
+            return self.persist_by_default and self.save_path is not None
+        return persist
+
+    def persist_item(self, news_item: NewsItem, sink: Optional[ArticleSink] = None) -> None:
+        """Write the article to `sink`, or to the per-article JSON file by default."""
+        if sink is not None:
+            sink.write(news_item, self)
+        else:
+            self.save_as_json(news_item)
+
+    def run(self, persist: Optional[bool] = None, sink: Optional[ArticleSink] = None) -> NewsItem:
+        """
+        Full crawling pipeline.
+
+        `sink` replaces the per-article JSON file (e.g. a shared JsonlSink);
+        passing one persists the article unless `persist` is False.
+        """
+        if sink is not None and persist is None:
+            persist = True
+        should_persist = self.should_persist(persist)
         html = self.fetch_content()
-        news_item = self.parse_content(html)
+        news_item = self.parse_content(self.create_parse_context(html))
         self.validate_item(news_item)
         if should_persist:
-            self.save_as_json(news_item)
+            self.persist_item(news_item, sink)
+        self.logger.info("Success to get content from %s", self.new_url)
+        return news_item
+
+    async def arun(self, persist: Optional[bool] = None, sink: Optional[ArticleSink] = None) -> NewsItem:
+        """Full crawling pipeline driven by the running event loop; see `run()`."""
+        if sink is not None and persist is None:
+            persist = True
+        should_persist = self.should_persist(persist)
+        html = await self.afetch_content()
+        news_item = await self.aparse_content(html)
+        self.validate_item(news_item)
+        if should_persist:
+            await asyncio.to_thread(self.persist_item, news_item, sink)
         self.logger.info("Success to get content from %s", self.new_url)
         return news_item
 
@@ -126,6 +266,8 @@ class BaseNewsCrawler(ABC):
 
     def get_save_json_path(self) -> str:
         """Compute the output path for the JSON artifact."""
+        if self.save_path is None:
+            raise ValueError("Crawler was created with save_path=None and cannot persist")
         return str(self.save_path / f"{self.get_article_id()}.json")
 
     def compose_news_item(
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+from .fetchers import (
+    AsyncFetchStrategy,
+    FetchArchive,
+    FetchRequest,
+    FetchResponse,
+    FetchStrategy,
+    _afetch_response,
+    _fetch_response,
+)
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+# Headers added by the cache itself to revalidate an entry; they must not
+# change the key of the entry being revalidated.
+_CONDITIONAL_HEADERS = frozenset({"if-none-match", "if-modified-since"})
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    lowered = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lowered:
+            return value
+    return None
+
+
+def _expires_in(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds until the `Expires` header, 0 for past or invalid dates, None if absent."""
+    value = _header(headers, "Expires")
+    if value is None:
+        return None
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@dataclass
+class CacheEntry:
+    """A cached response plus the metadata needed to revalidate it."""
+
+    response: FetchResponse
+    expires_at: float
+    # Lifetime granted again after a successful revalidation.
+    ttl: float = 0.0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    size: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.size = len(self.response.text.encode("utf-8"))
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+@dataclass
+class CacheStats:
+    """Counters exposed by `ResponseCache.stats()`."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stores: int = 0
+    evictions: int = 0
+    disk_hits: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        lookups = self.hits + self.revalidated + self.misses
+        data["hit_ratio"] = (
+            round((self.hits + self.revalidated) / lookups, 4) if lookups else 0.0
+        )
+        return data
+
+
+class ResponseCache:
+    """
+    Two-tier HTTP response cache.
+
+    The memory tier is an LRU bounded by the total size of the cached bodies.
+    The optional disk tier stores one JSON file per request and is consulted
+    on memory misses, so cached pages survive restarts. Expired entries are
+    kept as long as they carry an `ETag` or `Last-Modified` validator, so the
+    next fetch can be a cheap conditional GET instead of a full download.
+
+    Responses are only served without revalidation for the lifetime granted
+    by `Cache-Control: max-age` or `Expires`, capped at `ttl`. Responses
+    without freshness information are stored only when they carry a
+    validator, unless `heuristic` is set, in which case they live for `ttl`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 300.0,
+        disk_dir: Union[str, Path, None] = None,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+        heuristic: bool = False,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.heuristic = heuristic
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._disk_writes = 0
+
+    @staticmethod
+    def key_for(request: FetchRequest) -> str:
+        """
+        Cache key of `request`: the archive key plus everything that can make
+        the origin answer differently (headers, cookies and impersonation).
+        """
+        headers = sorted(
+            (name.lower(), value)
+            for name, value in (request.headers or {}).items()
+            if name.lower() not in _CONDITIONAL_HEADERS
+        )
+        payload = json.dumps(
+            [
+                FetchArchive.key_for(request),
+                headers,
+                sorted((request.cookies or {}).items()),
+                request.impersonate or request.extras.get("impersonate"),
+            ],
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------ #
+    # Lookup
+    # ------------------------------------------------------------------ #
+    def get_memory(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for `key` (fresh or stale) from memory or disk."""
+        entry = self.get_memory(key)
+        if entry is None and self.disk_dir is not None:
+            entry = self._load_disk(key)
+            if entry is not None:
+                with self._lock:
+                    self._stats.disk_hits += 1
+                self._store_memory(key, entry)
+        return entry
+
+    # ------------------------------------------------------------------ #
+    # Mutation
+    # ------------------------------------------------------------------ #
+    def entry_for(self, response: FetchResponse) -> Optional[CacheEntry]:
+        """Build a cache entry for `response`, or None when it must not be cached."""
+        if response.status_code != 200:
+            return None
+        cache_control = _header(response.headers, "Cache-Control") or ""
+        if "no-store" in cache_control.lower():
+            return None
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            ttl = min(self.ttl, float(match.group(1)))
+        else:
+            expires_in = _expires_in(response.headers)
+            if expires_in is not None:
+                ttl = min(self.ttl, expires_in)
+            else:
+                ttl = self.ttl if self.heuristic else 0.0
+        if "no-cache" in cache_control.lower():
+            ttl = 0.0
+        etag = _header(response.headers, "ETag")
+        last_modified = _header(response.headers, "Last-Modified")
+        if ttl <= 0 and not (etag or last_modified):
+            return None
+        return CacheEntry(
+            response=response,
+            expires_at=time.time() + ttl,
+            ttl=ttl,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        self._store_memory(key, entry)
+        with self._lock:
+            self._stats.stores += 1
+        if self.disk_dir is not None:
+            self._save_disk(key, entry)
+
+    def refresh(self, key: str, entry: CacheEntry) -> None:
+        """Extend the lifetime of an entry that the origin revalidated (304)."""
+        entry.expires_at = time.time() + entry.ttl
+        self.put(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._stats.entries = len(self._entries)
+            self._stats.bytes = self._bytes
+            return self._stats.to_dict()
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self._stats, outcome, getattr(self._stats, outcome) + 1)
+
+    def _store_memory(self, key: str, entry: CacheEntry) -> None:
+        size = entry.size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._stats.evictions += 1
+
+    # ------------------------------------------------------------------ #
+    # Disk tier
+    # ------------------------------------------------------------------ #
+    def _disk_path(self, key: str) -> Path:
+        assert self.disk_dir is not None
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _load_disk(self, key: str) -> Optional[CacheEntry]:
+        path = self._disk_path(key)
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.debug("Ignoring unreadable cache file %s", path, exc_info=True)
+            return None
+        entry = CacheEntry(
+            response=FetchResponse(**record["response"]),
+            expires_at=record["expires_at"],
+            ttl=record.get("ttl", 0.0),
+            etag=record.get("etag"),
+            last_modified=record.get("last_modified"),
+        )
+        if not entry.fresh and not entry.revalidatable:
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def _save_disk(self, key: str, entry: CacheEntry) -> None:
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(
+                json.dumps(
+                    {
+                        "response": asdict(entry.response),
+                        "expires_at": entry.expires_at,
+                        "ttl": entry.ttl,
+                        "etag": entry.etag,
+                        "last_modified": entry.last_modified,
+                    },
+                    ensure_ascii=False,
+                ),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("Failed to write cache file %s", path, exc_info=True)
+            return
+        with self._lock:
+            self._disk_writes += 1
+            should_prune = self._disk_writes % 100 == 0
+        if should_prune:
+            self.prune_disk()
+
+    def prune_disk(self) -> None:
+        """Delete the least recently written files once the disk budget is exceeded."""
+        if self.disk_dir is None or not self.disk_dir.exists():
+            return
+        files = []
+        total = 0
+        for path in self.disk_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.disk_max_bytes:
+            return
+        files.sort()
+        target = self.disk_max_bytes * 0.9
+        for _, size, path in files:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class CachingFetcher(FetchStrategy, AsyncFetchStrategy):
+    """
+    Wrap any sync or async fetch strategy with a `ResponseCache`.
+
+    Fresh entries are served without a request. Stale entries that carry
+    validators are revalidated with `If-None-Match` / `If-Modified-Since`,
+    and a 304 answer reuses the cached body. Only GET requests are cached.
+    """
+
+    def __init__(self, inner: Any, cache: Optional[ResponseCache] = None):
+        self.inner = inner
+        self.cache = cache or ResponseCache()
+
+    @staticmethod
+    def _conditional(request: FetchRequest, entry: CacheEntry) -> FetchRequest:
+        headers = dict(request.headers or {})
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return dataclasses.replace(request, headers=headers)
+
+    def _lookup(
+        self, request: FetchRequest, entry: Optional[CacheEntry], conditional: bool
+    ):
+        """Return (cached response or None, request to send)."""
+        if entry is None:
+            self.cache.record("misses")
+            return None, request
+        if entry.fresh:
+            self.cache.record("hits")
+            return entry.response, request
+        # Strategies that only expose fetch()/afetch() raise on a 304, so they
+        # always get an unconditional request.
+        if entry.revalidatable and conditional:
+            return None, self._conditional(request, entry)
+        self.cache.record("misses")
+        return None, request
+
+    def _complete(
+        self,
+        key: str,
+        entry: Optional[CacheEntry],
+        response: FetchResponse,
+        conditional: bool,
+    ) -> FetchResponse:
+        if response.status_code == 304 and entry is not None:
+            self.cache.record("revalidated")
+            self.cache.refresh(key, entry)
+            return entry.response
+        if entry is not None and entry.revalidatable and conditional:
+            # The conditional request did not match; count it as a miss.
+            self.cache.record("misses")
+        new_entry = self.cache.entry_for(response)
+        if new_entry is not None:
+            self.cache.put(key, new_entry)
+        return response
+
+    def fetch(self, request: FetchRequest) -> str:
+        return self.fetch_response(request).raise_for_status()
+
+    def fetch_response(self, request: FetchRequest) -> FetchResponse:
+        if request.method.upper() != "GET":
+            return _fetch_response(self.inner, request)
+        key = self.cache.key_for(request)
+        entry = self.cache.get(key)
+        conditional = hasattr(self.inner, "fetch_response")
+        cached, outgoing = self._lookup(request, entry, conditional)
+        if cached is not None:
+            return cached
+        response = _fetch_response(self.inner, outgoing)
+        return self._complete(key, entry, response, conditional)
+
+    async def afetch(self, request: FetchRequest) -> str:
+        return (await self.afetch_response(request)).raise_for_status()
+
+    async def afetch_response(self, request: FetchRequest) -> FetchResponse:
+        if request.method.upper() != "GET":
+            return await _afetch_response(self.inner, request)
+        key = self.cache.key_for(request)
+        entry = self.cache.get_memory(key)
+        if entry is None and self.cache.disk_dir is not None:
+            entry = await asyncio.to_thread(self.cache.get, key)
+        conditional = hasattr(self.inner, "afetch_response")
+        cached, outgoing = self._lookup(request, entry, conditional)
+        if cached is not None:
+            return cached
+        response = await _afetch_response(self.inner, outgoing)
+        if self.cache.disk_dir is not None:
+            return await asyncio.to_thread(
+                self._complete, key, entry, response, conditional
+            )
+        return self._complete(key, entry, response, conditional)
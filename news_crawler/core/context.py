@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class ParseContext:
+    """
+    Per-document parse state shared by the title, meta and content parsers.
+
+    The HTML is tokenized into an lxml tree at most once (on first access to
+    `selector`), and any other expensive derived data can be memoized with
+    `memo()` so that every parser working on the same page reuses it.
+    """
+
+    __slots__ = ("html", "_selector", "_memo")
+
+    def __init__(self, html: str):
+        self.html = html
+        self._selector: Any = None
+        self._memo: Dict[str, Any] = {}
+
+    @classmethod
+    def of(cls, source: "HtmlSource") -> "ParseContext":
+        """Return `source` if it already is a context, otherwise wrap it."""
+        if isinstance(source, ParseContext):
+            return source
+        return cls(source)
+
+    @property
+    def selector(self) -> Any:
+        """The parsel Selector for the document, built on first use."""
+        if self._selector is None:
+            from parsel import Selector  # lazy import
+
+            self._selector = Selector(text=self.html)
+        return self._selector
+
+    def memo(self, key: str, factory: Callable[[], T]) -> T:
+        """Compute `factory()` once per document and cache it under `key`."""
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = factory()
+            return value
+
+
+HtmlSource = Union[str, ParseContext]
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ExecutorSaturated(RuntimeError):
+    """Raised instead of queueing more work once a bounded executor is full."""
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        super().__init__(f"{name} executor is saturated ({limit} tasks pending)")
+
+
+@dataclass
+class WorkTiming:
+    """Time one logical request spent waiting for and running in executors."""
+
+    queued: float = 0.0
+    running: float = 0.0
+    tasks: int = 0
+
+
+# Set by callers (e.g. an HTTP middleware) that want per-request timings;
+# every task submitted from that context adds to the same WorkTiming.
+_current_timing: contextvars.ContextVar[Optional[WorkTiming]] = contextvars.ContextVar(
+    "news_crawler_work_timing", default=None
+)
+
+
+def start_timing() -> WorkTiming:
+    """Start collecting executor timings for the current context."""
+    timing = WorkTiming()
+    _current_timing.set(timing)
+    return timing
+
+
+class BoundedExecutor(ThreadPoolExecutor):
+    """
+    Thread pool with a cap on pending work.
+
+    At most `max_workers` tasks run at once and at most `max_queue` more may
+    wait; further submissions raise `ExecutorSaturated` immediately so callers
+    can shed load instead of building an unbounded backlog.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue: int = 64, name: str = "parse"):
+        super().__init__(max_workers=max_workers, thread_name_prefix=f"news-crawler-{name}")
+        self.name = name
+        self.max_queue = max_queue
+        self._pending = 0
+        self._running = 0
+        self._count_lock = threading.Lock()
+        # Counters
+        self.completed = 0
+        self.rejected = 0
+        self.queued_seconds = 0.0
+        self.running_seconds = 0.0
+        self.max_queued_seconds = 0.0
+
+    @property
+    def limit(self) -> int:
+        return self._max_workers + self.max_queue
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> "Future[T]":
+        with self._count_lock:
+            if self._pending >= self.limit:
+                self.rejected += 1
+                raise ExecutorSaturated(self.name, self.limit)
+            self._pending += 1
+        timing = _current_timing.get()
+        submitted = time.perf_counter()
+
+        def run() -> T:
+            started = time.perf_counter()
+            with self._count_lock:
+                self._running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                finished = time.perf_counter()
+                with self._count_lock:
+                    self._running -= 1
+                    self._pending -= 1
+                    self.completed += 1
+                    self.queued_seconds += started - submitted
+                    self.running_seconds += finished - started
+                    self.max_queued_seconds = max(self.max_queued_seconds, started - submitted)
+                if timing is not None:
+                    timing.queued += started - submitted
+                    timing.running += finished - started
+                    timing.tasks += 1
+
+        try:
+            future = super().submit(run)
+        except BaseException:
+            self._release_pending()
+            raise
+        # A task cancelled while still queued never reaches `run`
+        future.add_done_callback(lambda f: f.cancelled() and self._release_pending())
+        return future
+
+    def _release_pending(self) -> None:
+        with self._count_lock:
+            self._pending -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._count_lock:
+            completed = self.completed
+            return {
+                "workers": self._max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "completed": completed,
+                "rejected": self.rejected,
+                "avg_queued_ms": round(self.queued_seconds / completed * 1000, 2) if completed else 0.0,
+                "max_queued_ms": round(self.max_queued_seconds * 1000, 2),
+                "avg_running_ms": round(self.running_seconds / completed * 1000, 2) if completed else 0.0,
+            }
+
+
+_parse_executor: Optional[Executor] = None
+_parse_lock = threading.Lock()
+
+
+def get_parse_executor() -> Optional[Executor]:
+    """Executor used for parsing; None means the event loop's default executor."""
+    return _parse_executor
+
+
+def configure_parse_executor(executor: Optional[Executor]) -> None:
+    """Install the executor used by `aparse_content` and `run_in_parse_executor`.
+
+    The previously installed executor is shut down without waiting.
+    """
+    global _parse_executor
+    with _parse_lock:
+        previous, _parse_executor = _parse_executor, executor
+    if previous is not None and previous is not executor:
+        previous.shutdown(wait=False)
+
+
+async def run_in_parse_executor(fn: Callable[..., T], *args: Any) -> T:
+    """Run CPU-bound `fn(*args)` off the event loop in the parse executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_parse_executor(), functools.partial(fn, *args))
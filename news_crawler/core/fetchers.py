@@ -1,9 +1,31 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import http.cookiejar
+import inspect
+import json
 import logging
-from dataclasses import dataclass, field
-from typing import Mapping, MutableMapping, Optional, Protocol
+import os
+import random
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Protocol,
+    Union,
+)
+
+from .politeness import get_politeness, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +46,192 @@ class FetchRequest:
     extras: MutableMapping[str, object] = field(default_factory=dict)
 
 
+# Statuses worth retrying: timeouts, rate limiting and transient server errors.
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class FetchError(RuntimeError):
+    """A fetch that did not produce usable content, classified for retries."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        url: Optional[str] = None,
+        status_code: Optional[int] = None,
+        retryable: bool = False,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.url = url
+        self.status_code = status_code
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+@dataclass
+class FetchResponse:
+    """Result of an HTTP fetch, kept independent of the client library."""
+
+    url: str
+    status_code: int
+    text: str
+    headers: Mapping[str, str] = field(default_factory=dict)
+    # Wall-clock seconds spent waiting for the response.
+    elapsed: float = 0.0
+
+    def raise_for_status(self) -> str:
+        """Return the body, or raise `FetchError` if the server did not answer with 200."""
+        if self.status_code != 200:
+            raise FetchError(
+                f"Failed to fetch content: {self.status_code}",
+                url=self.url,
+                status_code=self.status_code,
+                retryable=self.status_code in RETRYABLE_STATUSES,
+                retry_after=parse_retry_after(self.headers),
+            )
+        return self.text
+
+
+@dataclass
+class PoolConfig:
+    """Sizing of the process-wide HTTP session pools."""
+
+    # Number of distinct hosts kept in the connection cache.
+    pool_connections: int = 16
+    # Maximum number of keep-alive connections per host.
+    pool_maxsize: int = 32
+    # Block instead of opening overflow connections once a host is saturated.
+    pool_block: bool = False
+
+
+class SessionPool:
+    """
+    Thread-safe pool of long-lived HTTP sessions.
+
+    Each thread gets its own session (neither `requests` nor `curl_cffi`
+    sessions are safe to share across threads) while the underlying
+    connection pool is shared where the client library allows it. Cookies
+    returned by servers are dropped after every request so pooled sessions
+    behave like the stateless module-level `request()` helpers.
+
+    Sessions of threads that have exited are retired (passed to `retire`,
+    which closes them by default) whenever a new session is created, so
+    short-lived threads do not accumulate sessions.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[PoolConfig], Any],
+        retire: Optional[Callable[[Any], None]] = None,
+    ):
+        self._factory = factory
+        self._retire = retire or _close_session
+        self._config = PoolConfig()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: Dict[threading.Thread, Any] = {}
+
+    @property
+    def config(self) -> PoolConfig:
+        return self._config
+
+    def configure(self, config: PoolConfig) -> None:
+        """Apply new sizing; existing sessions are closed and rebuilt lazily."""
+        self.close()
+        self._config = config
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self) -> Any:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._factory(self._config)
+            with self._lock:
+                dead = [thread for thread in self._sessions if not thread.is_alive()]
+                retired = [self._sessions.pop(thread) for thread in dead]
+                self._sessions[threading.current_thread()] = session
+            self._local.session = session
+            for stale in retired:
+                self._retire_quietly(stale)
+        return session
+
+    def _retire_quietly(self, session: Any) -> None:
+        try:
+            self._retire(session)
+        except Exception:  # pragma: no cover - best effort cleanup
+            logger.debug("Failed to close pooled session", exc_info=True)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+            self._local = threading.local()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:  # pragma: no cover - best effort cleanup
+                logger.debug("Failed to close pooled session", exc_info=True)
+
+
+def _close_session(session: Any) -> None:
+    session.close()
+
+
+class AsyncSessionPool:
+    """
+    Pool of async HTTP clients, one per running event loop.
+
+    Async clients are bound to the loop that created them, so a client is
+    created lazily the first time a loop fetches and is then shared by every
+    coroutine on that loop.
+    """
+
+    def __init__(self, factory: Callable[[PoolConfig], Any]):
+        self._factory = factory
+        self._config = PoolConfig()
+        self._lock = threading.Lock()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def config(self) -> PoolConfig:
+        return self._config
+
+    def configure(self, config: PoolConfig) -> None:
+        """Apply new sizing to clients created from now on."""
+        with self._lock:
+            self._config = config
+            self._clients = weakref.WeakKeyDictionary()
+
+    def get(self) -> Any:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(loop)
+                if client is None:
+                    client = self._factory(self._config)
+                    self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the client bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is None:
+            return
+        close = getattr(client, "aclose", None) or client.close
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:  # pragma: no cover - best effort cleanup
+            logger.debug("Failed to close pooled async client", exc_info=True)
+
+
 class FetchStrategy(Protocol):
     """Strategy interface for fetching raw content."""
 
@@ -31,36 +239,242 @@ class FetchStrategy(Protocol):
         ...
 
 
+class AsyncFetchStrategy(Protocol):
+    """Strategy interface for fetching raw content on an event loop."""
+
+    async def afetch(self, request: FetchRequest) -> str:
+        ...
+
+
+def _to_fetch_response(request: FetchRequest, response: Any, elapsed: float) -> FetchResponse:
+    return FetchResponse(
+        url=str(getattr(response, "url", None) or request.url),
+        status_code=response.status_code,
+        text=response.text,
+        headers=dict(response.headers),
+        elapsed=elapsed,
+    )
+
+
+_requests_adapter_lock = threading.Lock()
+_requests_adapter: Any = None
+
+
+def _create_requests_session(config: PoolConfig) -> Any:
+    global _requests_adapter
+    import requests  # lazy import
+    from requests.adapters import HTTPAdapter
+
+    with _requests_adapter_lock:
+        # A single adapter (urllib3 PoolManager) is shared by every thread's
+        # session, so keep-alive connections are reused process-wide.
+        if _requests_adapter is None:
+            _requests_adapter = HTTPAdapter(
+                pool_connections=config.pool_connections,
+                pool_maxsize=config.pool_maxsize,
+                pool_block=config.pool_block,
+            )
+        adapter = _requests_adapter
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _retire_requests_session(session: Any) -> None:
+    # The adapter is shared with the sessions of live threads; closing the
+    # session as is would drop their keep-alive connections too.
+    session.adapters.clear()
+    session.close()
+
+
+def _close_requests_adapter() -> None:
+    global _requests_adapter
+    with _requests_adapter_lock:
+        adapter, _requests_adapter = _requests_adapter, None
+    if adapter is not None:
+        adapter.close()
+
+
+def _create_curl_session(config: PoolConfig) -> Any:
+    try:
+        from curl_cffi import requests as curl_requests
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("curl_cffi is required for this fetcher") from exc
+    from curl_cffi import CurlOpt
+
+    # libcurl keeps the connection cache and TLS session ids on the handle,
+    # so a per-thread session gives keep-alive plus TLS resumption.
+    return curl_requests.Session(
+        curl_options={CurlOpt.MAXCONNECTS: config.pool_connections}
+    )
+
+
 class RequestsFetcher(FetchStrategy):
     """Default fetcher implemented with the `requests` library."""
 
+    pool = SessionPool(_create_requests_session, retire=_retire_requests_session)
+
     def fetch(self, request: FetchRequest) -> str:
-        from requests import request as http_request  # lazy import
-
-        response = http_request(
-            method=request.method,
-            url=request.url,
-            headers=request.headers,
-            timeout=request.timeout,
-            allow_redirects=request.allow_redirects,
-            params=request.params,
-            data=request.data,
-            cookies=request.cookies,
-        )
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch content: {response.status_code}")
-        response.encoding = response.encoding or "utf-8"
-        return response.text
+        return self.fetch_response(request).raise_for_status()
+
+    def fetch_response(self, request: FetchRequest) -> FetchResponse:
+        session = self.pool.get()
+        with get_politeness().slot(request.url) as slot:
+            started = time.perf_counter()
+            try:
+                response = session.request(
+                    method=request.method,
+                    url=request.url,
+                    headers=request.headers,
+                    timeout=request.timeout,
+                    allow_redirects=request.allow_redirects,
+                    params=request.params,
+                    data=request.data,
+                    cookies=request.cookies,
+                )
+            finally:
+                session.cookies.clear()
+            response.encoding = response.encoding or "utf-8"
+            result = _to_fetch_response(request, response, time.perf_counter() - started)
+            slot.record(result)
+        return result
 
 
 class CurlCffiFetcher(FetchStrategy):
     """Fetcher backed by curl_cffi for high-fidelity browser impersonation."""
 
+    pool = SessionPool(_create_curl_session)
+
     def fetch(self, request: FetchRequest) -> str:
-        try:
-            from curl_cffi import requests as curl_requests
-        except ImportError as exc:  # pragma: no cover - optional dependency
-            raise RuntimeError("curl_cffi is required for this fetcher") from exc
+        return self.fetch_response(request).raise_for_status()
+
+    def fetch_response(self, request: FetchRequest) -> FetchResponse:
+        session = self.pool.get()
+
+        kwargs = {
+            "headers": request.headers,
+            "timeout": request.timeout,
+            "allow_redirects": request.allow_redirects,
+            "params": request.params,
+            "data": request.data,
+            "cookies": request.cookies,
+        }
+        impersonate = request.impersonate or request.extras.get("impersonate")
+        if impersonate:
+            kwargs["impersonate"] = impersonate
+
+        with get_politeness().slot(request.url) as slot:
+            started = time.perf_counter()
+            try:
+                response = session.request(
+                    method=request.method,
+                    url=request.url,
+                    **kwargs,
+                )
+            finally:
+                session.cookies.clear()
+            response.encoding = response.encoding or "utf-8"
+            result = _to_fetch_response(request, response, time.perf_counter() - started)
+            slot.record(result)
+        return result
+
+
+class _DiscardingCookieJar(http.cookiejar.CookieJar):
+    """Cookie jar that never stores anything, for clients shared by many requests."""
+
+    def set_cookie(self, cookie: http.cookiejar.Cookie) -> None:
+        return None
+
+
+def _with_cookie_header(
+    headers: Mapping[str, str] | None, cookies: Mapping[str, str] | None
+) -> Mapping[str, str] | None:
+    """Send per-request cookies as a header instead of through a client jar."""
+    if not cookies:
+        return headers
+    merged = dict(headers or {})
+    pairs = [f"{name}={value}" for name, value in cookies.items()]
+    existing = next((key for key in merged if key.lower() == "cookie"), None)
+    if existing is not None:
+        pairs.insert(0, merged.pop(existing))
+    merged["Cookie"] = "; ".join(pairs)
+    return merged
+
+
+def _create_httpx_client(config: PoolConfig) -> Any:
+    try:
+        import httpx
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("httpx is required for this fetcher") from exc
+
+    max_connections = config.pool_connections * config.pool_maxsize
+    # The client is shared by every coroutine on the loop, so it must not
+    # keep cookies: one request's Set-Cookie would leak into the others.
+    return httpx.AsyncClient(
+        cookies=_DiscardingCookieJar(),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    )
+
+
+def _create_async_curl_session(config: PoolConfig) -> Any:
+    try:
+        from curl_cffi import requests as curl_requests
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("curl_cffi is required for this fetcher") from exc
+    from curl_cffi import CurlOpt
+
+    # Shared by every coroutine on the loop: response cookies are never
+    # stored on the session; curl_cffi sends per-request cookies from a
+    # temporary copy. (`discard_cookies` would do the same but only exists
+    # in newer curl_cffi releases than the pinned one.)
+    return curl_requests.AsyncSession(
+        max_clients=config.pool_maxsize,
+        cookies=_DiscardingCookieJar(),
+        curl_options={CurlOpt.MAXCONNECTS: config.pool_connections},
+    )
+
+
+class AsyncRequestsFetcher(AsyncFetchStrategy):
+    """Async counterpart of `RequestsFetcher`, implemented with `httpx`."""
+
+    pool = AsyncSessionPool(_create_httpx_client)
+
+    async def afetch(self, request: FetchRequest) -> str:
+        return (await self.afetch_response(request)).raise_for_status()
+
+    async def afetch_response(self, request: FetchRequest) -> FetchResponse:
+        client = self.pool.get()
+        async with get_politeness().aslot(request.url) as slot:
+            started = time.perf_counter()
+            response = await client.request(
+                method=request.method,
+                url=request.url,
+                headers=_with_cookie_header(request.headers, request.cookies),
+                params=request.params,
+                data=request.data,
+                timeout=request.timeout,
+                follow_redirects=request.allow_redirects,
+            )
+            result = _to_fetch_response(request, response, time.perf_counter() - started)
+            slot.record(result)
+        return result
+
+
+class AsyncCurlCffiFetcher(AsyncFetchStrategy):
+    """Async counterpart of `CurlCffiFetcher`."""
+
+    pool = AsyncSessionPool(_create_async_curl_session)
+
+    async def afetch(self, request: FetchRequest) -> str:
+        return (await self.afetch_response(request)).raise_for_status()
+
+    async def afetch_response(self, request: FetchRequest) -> FetchResponse:
+        session = self.pool.get()
 
         kwargs = {
             "headers": request.headers,
@@ -74,12 +488,280 @@ class CurlCffiFetcher(FetchStrategy):
         if impersonate:
             kwargs["impersonate"] = impersonate
 
-        response = curl_requests.request(
-            method=request.method,
-            url=request.url,
-            **kwargs,
+        async with get_politeness().aslot(request.url) as slot:
+            started = time.perf_counter()
+            response = await session.request(
+                method=request.method,
+                url=request.url,
+                **kwargs,
+            )
+            response.encoding = response.encoding or "utf-8"
+            result = _to_fetch_response(request, response, time.perf_counter() - started)
+            slot.record(result)
+        return result
+
+
+def _fetch_response(fetcher: Any, request: FetchRequest) -> FetchResponse:
+    """Fetch through any sync strategy, preferring the full response."""
+    if hasattr(fetcher, "fetch_response"):
+        return fetcher.fetch_response(request)
+    started = time.perf_counter()
+    text = fetcher.fetch(request)
+    return FetchResponse(
+        url=request.url,
+        status_code=200,
+        text=text,
+        elapsed=time.perf_counter() - started,
+    )
+
+
+async def _afetch_response(fetcher: Any, request: FetchRequest) -> FetchResponse:
+    """Async counterpart of `_fetch_response`; sync-only strategies run in a thread."""
+    if hasattr(fetcher, "afetch_response"):
+        return await fetcher.afetch_response(request)
+    if not hasattr(fetcher, "afetch"):
+        return await asyncio.to_thread(_fetch_response, fetcher, request)
+    started = time.perf_counter()
+    text = await fetcher.afetch(request)
+    return FetchResponse(
+        url=request.url,
+        status_code=200,
+        text=text,
+        elapsed=time.perf_counter() - started,
+    )
+
+
+class FetchArchive:
+    """
+    On-disk archive of recorded responses.
+
+    Every request is stored as one JSON file named after a hash of its method,
+    URL, query params and form data, so concurrent recorders never contend on
+    a shared index and archives can be merged by copying directories.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Optional[FetchResponse]] = {}
+
+    @classmethod
+    def of(cls, archive: Union["FetchArchive", str, Path]) -> "FetchArchive":
+        return archive if isinstance(archive, FetchArchive) else cls(archive)
+
+    @staticmethod
+    def key_for(request: FetchRequest) -> str:
+        payload = json.dumps(
+            [
+                request.method.upper(),
+                request.url,
+                sorted((request.params or {}).items()),
+                sorted((request.data or {}).items()),
+            ],
+            ensure_ascii=False,
         )
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch content: {response.status_code}")
-        response.encoding = response.encoding or "utf-8"
-        return response.text
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def save(self, request: FetchRequest, response: FetchResponse) -> Path:
+        key = self.key_for(request)
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "request": {
+                "method": request.method.upper(),
+                "url": request.url,
+                "params": dict(request.params or {}),
+                "data": dict(request.data or {}),
+            },
+            "response": asdict(response),
+            "recorded_at": time.time(),
+        }
+        # Write then rename so readers never observe a partial file.
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._cache[key] = response
+        return path
+
+    def load(self, request: FetchRequest) -> Optional[FetchResponse]:
+        key = self.key_for(request)
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+        path = self.path_for(key)
+        response = None
+        if path.exists():
+            record = json.loads(path.read_text(encoding="utf-8"))
+            response = FetchResponse(**record["response"])
+        with self._lock:
+            self._cache[key] = response
+        return response
+
+
+@dataclass
+class LatencyModel:
+    """
+    Delay applied to replayed responses.
+
+    Modes: ``none`` (serve instantly), ``recorded`` (the original latency
+    multiplied by `scale`), ``fixed`` (`seconds` per response) and
+    ``lognormal`` (synthetic latency with median `seconds` and shape `sigma`).
+    """
+
+    mode: str = "none"
+    seconds: float = 0.0
+    scale: float = 1.0
+    sigma: float = 0.5
+    seed: Optional[int] = None
+    _random: random.Random = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.mode not in ("none", "recorded", "fixed", "lognormal"):
+            raise ValueError(f"Unknown latency mode: {self.mode}")
+        self._random = random.Random(self.seed)
+
+    @classmethod
+    def parse(cls, spec: Union["LatencyModel", str, float, None]) -> "LatencyModel":
+        """
+        Build a model from a compact spec such as ``recorded``, ``recorded:0.5``,
+        ``fixed:0.2`` or ``lognormal:0.3:0.6`` (median seconds, sigma).
+        """
+        if isinstance(spec, LatencyModel):
+            return spec
+        if spec is None or spec == "":
+            return cls()
+        if isinstance(spec, (int, float)):
+            return cls(mode="fixed", seconds=float(spec))
+        mode, *args = spec.split(":")
+        values = [float(arg) for arg in args]
+        if mode == "recorded":
+            return cls(mode=mode, scale=values[0] if values else 1.0)
+        if mode == "fixed":
+            return cls(mode=mode, seconds=values[0] if values else 0.0)
+        if mode == "lognormal":
+            median = values[0] if values else 0.2
+            sigma = values[1] if len(values) > 1 else 0.5
+            return cls(mode=mode, seconds=median, sigma=sigma)
+        return cls(mode=mode)
+
+    def delay(self, response: FetchResponse) -> float:
+        if self.mode == "recorded":
+            return max(0.0, response.elapsed * self.scale)
+        if self.mode == "fixed":
+            return self.seconds
+        if self.mode == "lognormal" and self.seconds > 0:
+            return self._random.lognormvariate(0.0, self.sigma) * self.seconds
+        return 0.0
+
+
+class RecordingFetcher(FetchStrategy, AsyncFetchStrategy):
+    """
+    Fetch through `inner` and store every response (body, status, headers and
+    timing) in a `FetchArchive` for later replay.
+
+    `inner` may be a sync or an async strategy; the matching entry point is
+    used, and sync-only strategies are run in a thread when awaited.
+    """
+
+    def __init__(
+        self,
+        archive: Union[FetchArchive, str, Path],
+        inner: Optional[Any] = None,
+    ):
+        self.archive = FetchArchive.of(archive)
+        self.inner = inner
+
+    def fetch(self, request: FetchRequest) -> str:
+        return self.fetch_response(request).raise_for_status()
+
+    def fetch_response(self, request: FetchRequest) -> FetchResponse:
+        response = _fetch_response(self.inner or RequestsFetcher(), request)
+        self.archive.save(request, response)
+        return response
+
+    async def afetch(self, request: FetchRequest) -> str:
+        return (await self.afetch_response(request)).raise_for_status()
+
+    async def afetch_response(self, request: FetchRequest) -> FetchResponse:
+        response = await _afetch_response(self.inner or AsyncRequestsFetcher(), request)
+        await asyncio.to_thread(self.archive.save, request, response)
+        return response
+
+
+class ReplayFetcher(FetchStrategy, AsyncFetchStrategy):
+    """
+    Serve responses from a `FetchArchive` without touching the network.
+
+    Responses are delayed according to `latency` so load tests see realistic
+    concurrency. Requests missing from the archive go to `fallback` when one
+    is given and raise otherwise.
+    """
+
+    def __init__(
+        self,
+        archive: Union[FetchArchive, str, Path],
+        latency: Union[LatencyModel, str, float, None] = None,
+        fallback: Optional[Any] = None,
+    ):
+        self.archive = FetchArchive.of(archive)
+        self.latency = LatencyModel.parse(latency)
+        self.fallback = fallback
+
+    def _lookup(self, request: FetchRequest) -> Optional[FetchResponse]:
+        response = self.archive.load(request)
+        if response is None and self.fallback is None:
+            raise FetchError(
+                f"No recorded response for {request.method} {request.url}",
+                url=request.url,
+            )
+        return response
+
+    def fetch(self, request: FetchRequest) -> str:
+        return self.fetch_response(request).raise_for_status()
+
+    def fetch_response(self, request: FetchRequest) -> FetchResponse:
+        response = self._lookup(request)
+        if response is None:
+            return _fetch_response(self.fallback, request)
+        delay = self.latency.delay(response)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    async def afetch(self, request: FetchRequest) -> str:
+        return (await self.afetch_response(request)).raise_for_status()
+
+    async def afetch_response(self, request: FetchRequest) -> FetchResponse:
+        response = await asyncio.to_thread(self._lookup, request)
+        if response is None:
+            return await _afetch_response(self.fallback, request)
+        delay = self.latency.delay(response)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
+
+
+def configure_pools(config: PoolConfig) -> None:
+    """Resize the shared session pools used by the built-in fetchers."""
+    _close_requests_adapter()
+    RequestsFetcher.pool.configure(config)
+    CurlCffiFetcher.pool.configure(config)
+    AsyncRequestsFetcher.pool.configure(config)
+    AsyncCurlCffiFetcher.pool.configure(config)
+
+
+def close_pools() -> None:
+    """Close every pooled session; call on application shutdown."""
+    RequestsFetcher.pool.close()
+    CurlCffiFetcher.pool.close()
+    _close_requests_adapter()
+
+
+async def aclose_pools() -> None:
+    """Close the async clients bound to the running event loop."""
+    await AsyncRequestsFetcher.pool.aclose()
+    await AsyncCurlCffiFetcher.pool.aclose()
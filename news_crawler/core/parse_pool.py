@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import wait as wait_all
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple, Type, Union
+
+from .context import HtmlSource, ParseContext
+from .executor import ExecutorSaturated, _current_timing
+from .fetchers import FetchRequest
+from .models import NewsItem
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .base import BaseNewsCrawler
+
+logger = logging.getLogger(__name__)
+
+# Documents at least this large (UTF-8 bytes) are handed to the worker through
+# shared memory instead of being pickled through the executor's pipe.
+SHARED_MEMORY_THRESHOLD = 256 * 1024
+
+# Either the HTML itself or (shared memory block name, size in bytes).
+_Payload = Union[str, Tuple[str, int]]
+
+
+class OfflineFetcher:
+    """Fetch strategy for crawlers rebuilt in a parse worker: parsing must not touch the network."""
+
+    def fetch(self, request: FetchRequest) -> str:
+        raise RuntimeError(f"Network access is not available in the parse stage ({request.url})")
+
+    async def afetch(self, request: FetchRequest) -> str:
+        return self.fetch(request)
+
+
+OFFLINE_FETCHER = OfflineFetcher()
+
+
+# ---------------------------------------------------------------------- #
+# Worker side
+# ---------------------------------------------------------------------- #
+_crawler_classes: Dict[str, Type["BaseNewsCrawler"]] = {}
+
+
+def _crawler_class(path: str) -> Type["BaseNewsCrawler"]:
+    cls = _crawler_classes.get(path)
+    if cls is None:
+        module_name, _, qualname = path.partition(":")
+        obj: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+        cls = _crawler_classes[path] = obj
+    return cls
+
+
+def _warm_worker(modules: Tuple[str, ...]) -> None:
+    """Process initializer: import crawler modules before the first document arrives."""
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            logger.warning("Failed to preload %s in parse worker", name, exc_info=True)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _read_payload(payload: _Payload) -> str:
+    if isinstance(payload, str):
+        return payload
+    name, size = payload
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return str(block.buf[:size], "utf-8")
+    finally:
+        block.close()
+
+
+def _parse_in_worker(
+    class_path: str, new_url: str, state: Dict[str, Any], payload: _Payload
+) -> Tuple[NewsItem, float]:
+    started = time.perf_counter()
+    crawler = _crawler_class(class_path).for_parsing(new_url, state)
+    html = _read_payload(payload)
+    news_item = crawler.parse_content(crawler.create_parse_context(html))
+    return news_item, time.perf_counter() - started
+
+
+# ---------------------------------------------------------------------- #
+# Parent side
+# ---------------------------------------------------------------------- #
+class ProcessParsePool:
+    """
+    Warm pool of processes running `BaseNewsCrawler.parse_content`.
+
+    Parsing is CPU bound and holds the GIL, so threads cannot use more than
+    one core. Workers are started up front with the crawler modules already
+    imported; for every document only the crawler class path, URL, the
+    crawler's `parse_state()` and the HTML cross the process boundary (large
+    documents through shared memory) and a NewsItem comes back.
+
+    Like `BoundedExecutor`, at most `workers + max_queue` documents may be
+    pending; beyond that `ExecutorSaturated` is raised.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        preload: Iterable[str] = (),
+        max_queue: int = 64,
+        shared_memory_threshold: int = SHARED_MEMORY_THRESHOLD,
+        start_method: str = "spawn",
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.preload = tuple(preload)
+        self.max_queue = max_queue
+        self.shared_memory_threshold = shared_memory_threshold
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        # Counters
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.restarts = 0
+        self.shared_memory_docs = 0
+        self.bytes_sent = 0
+        self.parse_seconds = 0.0
+        self.overhead_seconds = 0.0
+
+    @property
+    def limit(self) -> int:
+        return self.workers + self.max_queue
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context(self.start_method),
+                        initializer=_warm_worker,
+                        initargs=(self.preload,),
+                    )
+        return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """Drop a pool whose worker died; the next call starts a fresh one."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self.restarts += 1
+        logger.warning("Parse worker died, restarting the process parse pool")
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def start(self) -> None:
+        """Spawn every worker and wait until they have imported the preload modules."""
+        executor = self._get_executor()
+        wait_all([executor.submit(_ping) for _ in range(self.workers)])
+
+    def _reserve(self) -> None:
+        with self._lock:
+            if self._pending >= self.limit:
+                self.rejected += 1
+                raise ExecutorSaturated("process parse", self.limit)
+            self._pending += 1
+
+    def _payload(self, html: str) -> Tuple[_Payload, Optional[shared_memory.SharedMemory]]:
+        if len(html) * 4 < self.shared_memory_threshold:
+            # Certainly below the threshold whatever the encoding; pickle it.
+            self.bytes_sent += len(html)
+            return html, None
+        data = html.encode("utf-8")
+        self.bytes_sent += len(data)
+        if len(data) < self.shared_memory_threshold:
+            return html, None
+        block = shared_memory.SharedMemory(create=True, size=len(data))
+        block.buf[: len(data)] = data
+        self.shared_memory_docs += 1
+        return (block.name, len(data)), block
+
+    def _submit(self, crawler: "BaseNewsCrawler", html: HtmlSource) -> "Future[Tuple[NewsItem, float]]":
+        """
+        Queue one document. The pending slot and the shared memory block are
+        released when the worker is done with it (`_finished`), not when the
+        caller stops waiting, so a cancelled caller never frees them early.
+        """
+        self._reserve()
+        started = time.perf_counter()
+        block = None
+        try:
+            cls = type(crawler)
+            payload, block = self._payload(ParseContext.of(html).html)
+            args = (f"{cls.__module__}:{cls.__qualname__}", crawler.new_url, crawler.parse_state(), payload)
+            executor = self._get_executor()
+            try:
+                future = executor.submit(_parse_in_worker, *args)
+            except BrokenProcessPool:
+                self._discard(executor)
+                executor = self._get_executor()
+                future = executor.submit(_parse_in_worker, *args)
+        except BaseException:
+            self._release(block)
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(functools.partial(self._finished, started, block, executor))
+        return future
+
+    def _finished(
+        self,
+        started: float,
+        block: Optional[shared_memory.SharedMemory],
+        executor: ProcessPoolExecutor,
+        future: "Future[Tuple[NewsItem, float]]",
+    ) -> None:
+        """Done callback of every submitted document (runs in the executor's thread)."""
+        self._release(block)
+        exc = None if future.cancelled() else future.exception()
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled() or exc is not None:
+                self.failed += 1
+            else:
+                parse_seconds = future.result()[1]
+                self.completed += 1
+                self.parse_seconds += parse_seconds
+                self.overhead_seconds += max(0.0, time.perf_counter() - started - parse_seconds)
+        if isinstance(exc, BrokenProcessPool):
+            self._discard(executor)
+
+    @staticmethod
+    def _record_timing(started: float, result: Tuple[NewsItem, float]) -> None:
+        """Add the document's queue / parse time to the caller's WorkTiming."""
+        timing = _current_timing.get()
+        if timing is not None:
+            parse_seconds = result[1]
+            timing.queued += max(0.0, time.perf_counter() - started - parse_seconds)
+            timing.running += parse_seconds
+            timing.tasks += 1
+
+    @staticmethod
+    def _release(block: Optional[shared_memory.SharedMemory]) -> None:
+        if block is not None:
+            block.close()
+            block.unlink()
+
+    def parse(self, crawler: "BaseNewsCrawler", html: HtmlSource) -> NewsItem:
+        """Parse `html` with `crawler`'s parser in a worker process (blocking)."""
+        started = time.perf_counter()
+        result = self._submit(crawler, html).result()
+        self._record_timing(started, result)
+        return result[0]
+
+    async def aparse(self, crawler: "BaseNewsCrawler", html: HtmlSource) -> NewsItem:
+        """Async counterpart of `parse()`."""
+        started = time.perf_counter()
+        result = await asyncio.wrap_future(self._submit(crawler, html))
+        self._record_timing(started, result)
+        return result[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            completed = self.completed
+            return {
+                "workers": self.workers,
+                "started": self._executor is not None,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "completed": completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "restarts": self.restarts,
+                "shared_memory_docs": self.shared_memory_docs,
+                "mb_sent": round(self.bytes_sent / 1024 / 1024, 2),
+                "avg_parse_ms": round(self.parse_seconds / completed * 1000, 2) if completed else 0.0,
+                "avg_overhead_ms": round(self.overhead_seconds / completed * 1000, 2) if completed else 0.0,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_parse_pool: Optional[ProcessParsePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> Optional[ProcessParsePool]:
+    """Process pool used by `BaseNewsCrawler.aparse_content`, if one is installed."""
+    return _parse_pool
+
+
+def configure_parse_pool(pool: Optional[ProcessParsePool]) -> None:
+    """Install (or with None, remove) the process parse pool; the previous pool is shut down."""
+    global _parse_pool
+    with _pool_lock:
+        previous, _parse_pool = _parse_pool, pool
+    if previous is not None and previous is not pool:
+        previous.shutdown()
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Union,
+)
+
+from .executor import ExecutorSaturated
+from .models import NewsItem
+from .politeness import HostPolicy, configure_politeness, get_politeness
+from .sinks import ArticleSink
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .base import BaseNewsCrawler
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's input queue; one per downstream worker.
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class UrlRecord:
+    """One line of pipeline input: a URL and, optionally, its platform."""
+
+    url: str
+    platform: Optional[str] = None
+
+
+UrlSource = Union[str, Path, TextIO, Iterable[Union[str, UrlRecord]]]
+# Sync callables run in a worker thread, async ones on the loop.
+Resolver = Callable[[UrlRecord], Union[Optional["BaseNewsCrawler"], Awaitable[Optional["BaseNewsCrawler"]]]]
+SkipIf = Callable[["BaseNewsCrawler"], Union[bool, Awaitable[bool]]]
+# An ArticleSink (JSONL, Parquet, ...) or any callable with the same signature.
+Sink = Callable[["BaseNewsCrawler", NewsItem], Any]
+
+
+def _parse_line(line: str) -> Optional[UrlRecord]:
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        data = json.loads(line)
+        return UrlRecord(data["url"], data.get("platform"))
+    return UrlRecord(line)
+
+
+def iter_urls(source: UrlSource) -> Iterator[UrlRecord]:
+    """
+    Yield UrlRecords from `source` lazily.
+
+    `source` may be a path ("-" for stdin), an open text file or any iterable
+    of URLs / UrlRecords. Lines are either a bare URL or a JSON object with a
+    "url" and optional "platform" key (JSONL); blank lines and lines starting
+    with "#" are skipped.
+    """
+    if isinstance(source, (str, Path)):
+        if str(source) == "-":
+            yield from iter_urls(sys.stdin)
+            return
+        with open(source, encoding="utf-8") as handle:
+            yield from iter_urls(handle)
+        return
+    for entry in source:
+        if isinstance(entry, UrlRecord):
+            yield entry
+            continue
+        try:
+            record = _parse_line(entry)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Skipping malformed input line: %.200s", entry)
+            continue
+        if record is not None:
+            yield record
+
+
+async def _call(func: Callable[..., Any], *args: Any) -> Any:
+    """Await async callables; run sync ones in a thread so they never block the loop."""
+    if inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(getattr(func, "__call__", None)):
+        return await func(*args)
+    return await asyncio.to_thread(func, *args)
+
+
+class PlatformResolver:
+    """
+    Default resolver: detect the platform from the URL and build its crawler
+    through the adapters of `news_extractor_core`, so the configured fetch
+    mode and response cache apply. Imported lazily; pass your own resolver
+    to use the pipeline without `news_extractor_core`.
+    """
+
+    def __init__(self, save_path: Optional[str] = "data/"):
+        self.save_path = Path(save_path) if save_path is not None else None
+        self._registry = None
+        # The pipeline calls resolvers from several worker threads at once.
+        self._lock = threading.Lock()
+
+    def __call__(self, record: UrlRecord) -> Optional["BaseNewsCrawler"]:
+        try:
+            from news_extractor_core.adapters.registry import AdapterRegistry
+            from news_extractor_core.platforms import detect_platform
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("news_extractor_core is required for platform detection") from exc
+        if self._registry is None:
+            with self._lock:
+                if self._registry is None:
+                    self._registry = AdapterRegistry()
+        platform = record.platform or detect_platform(record.url)
+        adapter = self._registry.get(platform) if platform else None
+        if adapter is None:
+            return None
+        crawler = adapter.build_crawler(record.url)
+        # Adapters build crawlers for in-memory extraction (save_path=None).
+        crawler.save_path = self.save_path
+        return crawler
+
+
+def save_json_sink(crawler: "BaseNewsCrawler", news_item: NewsItem) -> None:
+    """Default sink: the crawler's own per-article JSON file."""
+    if crawler.should_persist():
+        crawler.save_as_json(news_item)
+
+
+@dataclass
+class StageStats:
+    """Live counters of one pipeline stage."""
+
+    name: str
+    workers: int
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    in_flight: int = 0
+    busy_seconds: float = 0.0
+    # Time spent blocked handing results to a full downstream queue.
+    blocked_seconds: float = 0.0
+
+    def to_dict(self, elapsed: float, queued: Optional[int] = None) -> Dict[str, Any]:
+        done = self.completed + self.failed
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queued": queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "per_sec": round(self.completed / elapsed, 2) if elapsed > 0 else 0.0,
+            "avg_ms": round(self.busy_seconds / done * 1000, 2) if done else 0.0,
+            "utilization": round(self.busy_seconds / (elapsed * self.workers), 3) if elapsed > 0 else 0.0,
+            "blocked_seconds": round(self.blocked_seconds, 2),
+        }
+
+
+@dataclass
+class _Job:
+    record: UrlRecord
+    crawler: Optional["BaseNewsCrawler"] = None
+    html: Optional[str] = None
+    news_item: Optional[NewsItem] = None
+
+
+class CrawlPipeline:
+    """
+    Streaming fetch -> parse -> sink runner for large URL lists.
+
+    Each stage has its own worker count and hands work to the next one through
+    a bounded queue, so a slow stage (an origin, the parse executor, the disk)
+    stalls the stages before it instead of letting work pile up in memory. At
+    most about `fetch + parse + sink + 3 * queue_size` articles are held at
+    once, whatever the length of the input.
+
+    Per-host rate limits come from the politeness scheduler inside the
+    fetchers; if the application has not enabled it, `arun()` does so with
+    the `politeness` policy (pass None to crawl unthrottled).
+    `fetch_concurrency` only caps the total number of requests in flight. Parsing goes through `aparse_content`, i.e. the parse executor or
+    the process parse pool.
+
+    Failures are logged, counted and passed to `on_error`; they never stop
+    the pipeline. An `ArticleSink` is flushed, not closed, when the run ends.
+    URLs for which `skip_if(crawler)` is true (e.g. `ArticleStore.seen`) are
+    counted as skipped without being fetched. `resolver` and `skip_if` may be
+    sync (run in a worker thread, since they import adapters or query a
+    store) or async callables.
+    """
+
+    def __init__(
+        self,
+        resolver: Optional[Resolver] = None,
+        sink: Optional[Sink] = None,
+        fetch_concurrency: int = 32,
+        parse_concurrency: Optional[int] = None,
+        sink_concurrency: int = 1,
+        queue_size: int = 256,
+        validate: bool = True,
+        skip_if: Optional[SkipIf] = None,
+        on_error: Optional[Callable[[UrlRecord, str, BaseException], Any]] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        report_interval: float = 10.0,
+        politeness: Optional[HostPolicy] = HostPolicy(),
+    ):
+        self.resolver = resolver or PlatformResolver()
+        self.sink = sink or save_json_sink
+        self.queue_size = queue_size
+        self.validate = validate
+        self.skip_if = skip_if
+        self.on_error = on_error
+        self.on_progress = on_progress or self._log_progress
+        self.report_interval = report_interval
+        self.politeness = politeness
+        self.fetch = StageStats("fetch", fetch_concurrency)
+        self.parse = StageStats("parse", parse_concurrency or os.cpu_count() or 1)
+        self.store = StageStats("sink", sink_concurrency)
+        self.read = 0
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    # ------------------------------------------------------------------ #
+    # Counters
+    # ------------------------------------------------------------------ #
+    def snapshot(self) -> Dict[str, Any]:
+        """Current per-stage counters, queue depths and throughput."""
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished or time.perf_counter()) - self._started
+        queues = {name: queue.qsize() for name, queue in self._queues.items()}
+        return {
+            "elapsed_seconds": round(elapsed, 2),
+            "read": self.read,
+            "stages": {
+                stage.name: stage.to_dict(elapsed, queues.get(stage.name))
+                for stage in (self.fetch, self.parse, self.store)
+            },
+        }
+
+    @staticmethod
+    def _log_progress(snapshot: Dict[str, Any]) -> None:
+        stages = snapshot["stages"]
+        logger.info(
+            "pipeline %.0fs read=%d %s",
+            snapshot["elapsed_seconds"],
+            snapshot["read"],
+            " ".join(
+                f"{name}={stage['completed']}/{stage['failed']}err"
+                f"({stage['per_sec']}/s, q={stage['queued']}, busy={stage['utilization']:.0%})"
+                for name, stage in stages.items()
+            ),
+        )
+
+    def _fail(self, stage: StageStats, job: _Job, exc: BaseException) -> None:
+        stage.failed += 1
+        logger.warning("%s failed for %s: %r", stage.name, job.record.url, exc)
+        if self.on_error is not None:
+            self.on_error(job.record, stage.name, exc)
+
+    # ------------------------------------------------------------------ #
+    # Stages
+    # ------------------------------------------------------------------ #
+    async def _feed(self, source: Iterable[UrlRecord], out: asyncio.Queue) -> None:
+        iterator = iter(source)
+
+        def next_batch() -> List[UrlRecord]:
+            # Reading (possibly from stdin) happens off the loop, in batches.
+            batch = []
+            for record in iterator:
+                batch.append(record)
+                if len(batch) >= 256:
+                    break
+            return batch
+
+        while True:
+            batch = await asyncio.to_thread(next_batch)
+            if not batch:
+                return
+            for record in batch:
+                self.read += 1
+                await out.put(_Job(record))
+
+    async def _put(self, stage: StageStats, out: asyncio.Queue, job: _Job) -> None:
+        if out.full():
+            started = time.perf_counter()
+            await out.put(job)
+            stage.blocked_seconds += time.perf_counter() - started
+        else:
+            out.put_nowait(job)
+
+    async def _fetch_worker(self, inbox: asyncio.Queue, out: asyncio.Queue) -> None:
+        while (job := await inbox.get()) is not _DONE:
+            stage = self.fetch
+            stage.in_flight += 1
+            started = time.perf_counter()
+            try:
+                job.crawler = await _call(self.resolver, job.record)
+                if job.crawler is None:
+                    stage.skipped += 1
+                    logger.warning("No crawler for %s, skipping", job.record.url)
+                    continue
+                if self.skip_if is not None and await _call(self.skip_if, job.crawler):
+                    stage.skipped += 1
+                    continue
+                job.html = await job.crawler.afetch_content()
+            except Exception as exc:
+                self._fail(stage, job, exc)
+                continue
+            finally:
+                stage.in_flight -= 1
+                stage.busy_seconds += time.perf_counter() - started
+            stage.completed += 1
+            await self._put(stage, out, job)
+
+    async def _parse_worker(self, inbox: asyncio.Queue, out: asyncio.Queue) -> None:
+        while (job := await inbox.get()) is not _DONE:
+            stage = self.parse
+            stage.in_flight += 1
+            started = time.perf_counter()
+            try:
+                job.news_item = await self._parse(job)
+                job.html = None
+                if self.validate:
+                    job.crawler.validate_item(job.news_item)
+            except Exception as exc:
+                self._fail(stage, job, exc)
+                continue
+            finally:
+                stage.in_flight -= 1
+                stage.busy_seconds += time.perf_counter() - started
+            stage.completed += 1
+            await self._put(stage, out, job)
+
+    @staticmethod
+    async def _parse(job: _Job) -> NewsItem:
+        delay = 0.01
+        while True:
+            try:
+                return await job.crawler.aparse_content(job.html)
+            except ExecutorSaturated:
+                # Shared with other callers (e.g. the API); wait for room.
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.5)
+
+    async def _sink_worker(self, inbox: asyncio.Queue) -> None:
+        while (job := await inbox.get()) is not _DONE:
+            stage = self.store
+            stage.in_flight += 1
+            started = time.perf_counter()
+            try:
+                await asyncio.to_thread(self.sink, job.crawler, job.news_item)
+            except Exception as exc:
+                self._fail(stage, job, exc)
+                continue
+            finally:
+                stage.in_flight -= 1
+                stage.busy_seconds += time.perf_counter() - started
+            stage.completed += 1
+
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.report_interval)
+            self.on_progress(self.snapshot())
+
+    @staticmethod
+    async def _drain(workers: List["asyncio.Task[None]"], out: Optional[asyncio.Queue], count: int) -> None:
+        await asyncio.gather(*workers)
+        if out is not None:
+            for _ in range(count):
+                await out.put(_DONE)
+
+    async def arun(self, source: UrlSource) -> Dict[str, Any]:
+        """Crawl every URL in `source`; returns the final `snapshot()`."""
+        if self.politeness is not None and not get_politeness().enabled:
+            configure_politeness(self.politeness, enabled=True)
+        fetch_q: asyncio.Queue = asyncio.Queue(self.queue_size)
+        parse_q: asyncio.Queue = asyncio.Queue(self.queue_size)
+        sink_q: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self._queues = {"fetch": fetch_q, "parse": parse_q, "sink": sink_q}
+        self._started, self._finished = time.perf_counter(), None
+
+        fetchers = [asyncio.create_task(self._fetch_worker(fetch_q, parse_q)) for _ in range(self.fetch.workers)]
+        parsers = [asyncio.create_task(self._parse_worker(parse_q, sink_q)) for _ in range(self.parse.workers)]
+        sinks = [asyncio.create_task(self._sink_worker(sink_q)) for _ in range(self.store.workers)]
+        feeder = asyncio.create_task(self._feed(iter_urls(source), fetch_q))
+        reporter = asyncio.create_task(self._report()) if self.report_interval > 0 else None
+        tasks = [feeder, *fetchers, *parsers, *sinks, *([reporter] if reporter else [])]
+        try:
+            # Each stage is closed once every worker of the previous one is done.
+            await asyncio.gather(
+                self._drain([feeder], fetch_q, len(fetchers)),
+                self._drain(fetchers, parse_q, len(parsers)),
+                self._drain(parsers, sink_q, len(sinks)),
+                self._drain(sinks, None, 0),
+            )
+        finally:
+            self._finished = time.perf_counter()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if isinstance(self.sink, ArticleSink):
+            await asyncio.to_thread(self.sink.flush)
+        snapshot = self.snapshot()
+        if isinstance(self.sink, ArticleSink):
+            snapshot["sink"] = self.sink.stats()
+        self.on_progress(snapshot)
+        return snapshot
+
+    def run(self, source: UrlSource) -> Dict[str, Any]:
+        """Blocking wrapper around `arun()`."""
+        return asyncio.run(self.arun(source))
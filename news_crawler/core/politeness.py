@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Phrases found on the captcha / "unusual traffic" pages served by the
+# supported sites. They are only checked on short error bodies, see HostPolicy.
+DEFAULT_BLOCK_MARKERS: Tuple[str, ...] = (
+    "环境异常",
+    "完成验证后即可继续访问",
+    "访问过于频繁",
+    "请输入验证码",
+    "安全验证",
+    "captcha",
+    "unusual traffic",
+)
+
+# Path fragments of the verification pages sites redirect to when they
+# challenge a client; landing on one counts as a block whatever the status.
+DEFAULT_CHALLENGE_PATHS: Tuple[str, ...] = (
+    "captcha",
+    "antispider",
+)
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    lowered = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lowered:
+            return value
+    return None
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Return the `Retry-After` delay in seconds (delta or HTTP date), if any."""
+    value = _header(headers or {}, "Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """Politeness limits applied to one origin."""
+
+    # Steady-state request rate (requests per second) and bucket size.
+    rate: float = 2.0
+    burst: float = 4.0
+    # Concurrent requests allowed against the host.
+    max_in_flight: int = 4
+    # Multiplicative decrease on a block signal, slow recovery on success.
+    slowdown_factor: float = 0.5
+    recovery_factor: float = 1.1
+    min_rate: float = 0.05
+    # Pause after a block signal; doubles with every consecutive block.
+    block_penalty: float = 5.0
+    max_penalty: float = 300.0
+    # Statuses that always mean "slow down".
+    block_statuses: Tuple[int, ...] = (429,)
+    # Statuses that mean a block only when the body is an anti-bot page; a
+    # plain 403 or 503 is an ordinary error and is left to the retry policy.
+    marker_statuses: Tuple[int, ...] = (403, 429, 503)
+    block_markers: Tuple[str, ...] = DEFAULT_BLOCK_MARKERS
+    challenge_paths: Tuple[str, ...] = DEFAULT_CHALLENGE_PATHS
+    # Captcha pages are small; long bodies are real pages that may
+    # legitimately mention one of the markers.
+    marker_max_chars: int = 32 * 1024
+
+    def is_blocked(self, response: Any) -> bool:
+        """Whether `response` (a FetchResponse) looks like rate limiting or an anti-bot page."""
+        if response.status_code in self.block_statuses:
+            return True
+        path = urlsplit(response.url or "").path.lower()
+        if any(fragment in path for fragment in self.challenge_paths):
+            return True
+        if response.status_code not in self.marker_statuses:
+            return False
+        text = response.text or ""
+        if len(text) > self.marker_max_chars:
+            return False
+        lowered = text.lower()
+        return any(marker in lowered for marker in self.block_markers)
+
+
+class _HostState:
+    """Token bucket plus in-flight accounting for one host."""
+
+    def __init__(self, host: str, policy: HostPolicy):
+        self.host = host
+        self.policy = policy
+        self.rate = policy.rate
+        self.tokens = policy.burst
+        self.updated = time.monotonic()
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.strikes = 0
+        self.cond = threading.Condition()
+        self.async_waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = []
+        # Counters
+        self.requests = 0
+        self.blocked = 0
+        self.waited = 0.0
+
+    def try_acquire(self, now: float) -> float:
+        """Take a slot and a token; return 0.0 on success, else how long to wait."""
+        if self.rate > 0:
+            self.tokens = min(self.policy.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.policy.max_in_flight > 0 and self.in_flight >= self.policy.max_in_flight:
+            return math.inf
+        if self.rate > 0 and self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+        self.tokens -= 1
+        self.in_flight += 1
+        self.requests += 1
+        return 0.0
+
+    def feedback(self, response: Any) -> None:
+        policy = self.policy
+        if policy.is_blocked(response):
+            self.blocked += 1
+            self.strikes += 1
+            self.rate = max(policy.min_rate, self.rate * policy.slowdown_factor)
+            penalty = policy.block_penalty * 2 ** (self.strikes - 1)
+            retry_after = parse_retry_after(response.headers)
+            if retry_after is not None:
+                penalty = max(penalty, retry_after)
+            penalty = min(penalty, policy.max_penalty)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + penalty)
+            self.tokens = 0.0
+            logger.warning(
+                "Host %s answered %s looking like a block; pausing %.1fs, rate now %.2f/s",
+                self.host,
+                response.status_code,
+                penalty,
+                self.rate,
+            )
+        elif response.status_code < 400:
+            self.strikes = 0
+            self.rate = min(policy.rate, self.rate * policy.recovery_factor)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "rate": round(self.rate, 3),
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "blocked": self.blocked,
+            "paused_for": round(max(0.0, self.blocked_until - time.monotonic()), 1),
+            "waited_seconds": round(self.waited, 3),
+        }
+
+
+class HostSlot:
+    """Handle returned by `PolitenessScheduler.slot()`; report the response through it."""
+
+    __slots__ = ("response",)
+
+    def __init__(self) -> None:
+        self.response: Any = None
+
+    def record(self, response: Any) -> None:
+        self.response = response
+
+
+class PolitenessScheduler:
+    """
+    Process-wide per-host request scheduler.
+
+    Every request first waits for its host's token bucket (steady rate plus
+    burst) and for a free in-flight slot. Responses feed back into the host
+    state: a 429, an anti-bot error page or a redirect to a verification page
+    halves the host's rate and pauses it
+    (honouring `Retry-After`, doubling on consecutive blocks), and successful
+    responses slowly restore the configured rate. Retries issued while a host
+    is paused simply wait instead of hitting the site again.
+    """
+
+    def __init__(
+        self,
+        default: Optional[HostPolicy] = None,
+        overrides: Optional[Mapping[str, HostPolicy]] = None,
+        enabled: bool = True,
+    ):
+        self.default = default or HostPolicy()
+        self.overrides: Dict[str, HostPolicy] = dict(overrides or {})
+        self.enabled = enabled
+        self._states: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        default: Optional[HostPolicy] = None,
+        overrides: Optional[Mapping[str, HostPolicy]] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        """Replace the policies; per-host state is rebuilt on the next request."""
+        with self._lock:
+            if default is not None:
+                self.default = default
+            if overrides is not None:
+                self.overrides = dict(overrides)
+            if enabled is not None:
+                self.enabled = enabled
+            self._states = {}
+
+    def set_policy(self, host: str, policy: HostPolicy) -> None:
+        """Use `policy` for `host` and its subdomains."""
+        with self._lock:
+            self.overrides[host.lower()] = policy
+            self._states = {
+                name: state for name, state in self._states.items()
+                if not (name == host or name.endswith("." + host))
+            }
+
+    def policy_for(self, host: str) -> HostPolicy:
+        """Most specific override for `host` (exact host, then parent domains)."""
+        candidate = host
+        while candidate:
+            policy = self.overrides.get(candidate)
+            if policy is not None:
+                return policy
+            _, _, candidate = candidate.partition(".")
+        return self.default
+
+    def _state(self, url: str) -> Optional[_HostState]:
+        if not self.enabled:
+            return None
+        host = (urlsplit(url).hostname or "").rstrip(".")
+        if not host:
+            return None
+        state = self._states.get(host)
+        if state is None:
+            with self._lock:
+                state = self._states.get(host)
+                if state is None:
+                    state = self._states[host] = _HostState(host, self.policy_for(host))
+        return state
+
+    # ------------------------------------------------------------------ #
+    # Acquire / release
+    # ------------------------------------------------------------------ #
+    def _acquire(self, state: _HostState) -> None:
+        started = time.monotonic()
+        with state.cond:
+            while True:
+                wait = state.try_acquire(time.monotonic())
+                if wait == 0.0:
+                    break
+                state.cond.wait(None if wait == math.inf else wait)
+            state.waited += time.monotonic() - started
+
+    async def _aacquire(self, state: _HostState) -> None:
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        while True:
+            with state.cond:
+                wait = state.try_acquire(time.monotonic())
+                if wait == 0.0:
+                    state.waited += time.monotonic() - started
+                    return
+                if wait == math.inf:
+                    waiter: "asyncio.Future[None]" = loop.create_future()
+                    state.async_waiters.append((loop, waiter))
+            if wait == math.inf:
+                await waiter
+            else:
+                await asyncio.sleep(wait)
+
+    def _release(self, state: _HostState, response: Any) -> None:
+        with state.cond:
+            state.in_flight -= 1
+            if response is not None:
+                state.feedback(response)
+            waiters, state.async_waiters = state.async_waiters, []
+            state.cond.notify_all()
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[HostSlot]:
+        """Block until a request to `url`'s host is allowed, then hold the slot."""
+        handle = HostSlot()
+        state = self._state(url)
+        if state is None:
+            yield handle
+            return
+        self._acquire(state)
+        try:
+            yield handle
+        finally:
+            self._release(state, handle.response)
+
+    @asynccontextmanager
+    async def aslot(self, url: str) -> AsyncIterator[HostSlot]:
+        """Async counterpart of `slot()`."""
+        handle = HostSlot()
+        state = self._state(url)
+        if state is None:
+            yield handle
+            return
+        await self._aacquire(state)
+        try:
+            yield handle
+        finally:
+            self._release(state, handle.response)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            states = list(self._states.values())
+        return {
+            "enabled": self.enabled,
+            "hosts": {state.host: state.snapshot() for state in states},
+        }
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# Off until an application opts in (the extractor service does so at startup),
+# so library use and tests are not throttled by a scheduler they never configured.
+_scheduler = PolitenessScheduler(enabled=False)
+
+
+def get_politeness() -> PolitenessScheduler:
+    """The process-wide scheduler consulted by the built-in fetchers."""
+    return _scheduler
+
+
+def configure_politeness(
+    default: Optional[HostPolicy] = None,
+    overrides: Optional[Mapping[str, HostPolicy]] = None,
+    enabled: Optional[bool] = None,
+) -> None:
+    """Replace the policies of the process-wide scheduler."""
+    _scheduler.configure(default, overrides, enabled)
+
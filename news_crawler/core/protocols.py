@@ -3,11 +3,12 @@ from __future__ import annotations
 
 from typing import Protocol, Sequence
 
+from .context import HtmlSource
 from .models import ContentItem
 
 
 class ContentParser(Protocol):
-    """Parses raw HTML into a sequence of content fragments."""
+    """Parses raw HTML (or a shared ParseContext) into content fragments."""
 
-    def parse(self, html_content: str) -> Sequence[ContentItem]:
+    def parse(self, html_content: HtmlSource) -> Sequence[ContentItem]:
         ...
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+
+from .fetchers import FetchError
+
+logger = logging.getLogger(__name__)
+
+# Exception class names (anywhere in the MRO) raised by requests, httpx and
+# curl_cffi for transport-level failures. Matching by name keeps the client
+# libraries optional.
+_TRANSIENT_ERROR_NAMES = frozenset(
+    {
+        "ConnectionError",
+        "ConnectTimeout",
+        "ReadTimeout",
+        "Timeout",
+        "TimeoutException",
+        "TransportError",
+        "NetworkError",
+        "RemoteProtocolError",
+        "ChunkedEncodingError",
+        "ContentDecodingError",
+        "CurlError",
+        "RequestsError",
+    }
+)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Classify an exception raised while fetching."""
+    if isinstance(exc, FetchError):
+        return exc.retryable
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    # Bad URLs, parse errors and programming errors never succeed on retry.
+    if isinstance(exc, (ValueError, TypeError, LookupError, AttributeError)):
+        return False
+    return any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter for retriable fetch failures."""
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    # Give up instead of sleeping when the server asks for a longer pause.
+    max_retry_after: float = 60.0
+
+    def should_retry(self, exc: BaseException) -> bool:
+        if not is_retryable(exc):
+            return False
+        retry_after = getattr(exc, "retry_after", None)
+        return not (
+            self.respect_retry_after
+            and retry_after is not None
+            and retry_after > self.max_retry_after
+        )
+
+    def delay(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """Seconds to sleep after failed attempt number `attempt` (1-based)."""
+        backoff = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        retry_after = getattr(exc, "retry_after", None)
+        if self.respect_retry_after and retry_after is not None:
+            backoff = max(backoff, retry_after)
+        return backoff
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries, relative to the number of original requests.
+
+    Within a sliding `window`, retries may not exceed `ratio` times the
+    requests made, plus a small `min_retries` allowance for low traffic. Once
+    the budget is spent, failures surface immediately instead of multiplying
+    the load on an origin that is already struggling.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "retries": 0, "exhausted": 0}
+
+    def configure(self, ratio: float, min_retries: int, window: Optional[float] = None) -> None:
+        with self._lock:
+            self.ratio = ratio
+            self.min_retries = min_retries
+            if window is not None:
+                self.window = window
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_request(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            self._requests.append(now)
+            self._stats["requests"] += 1
+
+    def try_spend(self) -> bool:
+        """Reserve one retry; False when the budget is exhausted."""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            allowed = self.min_retries + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                self._stats["exhausted"] += 1
+                return False
+            self._retries.append(now)
+            self._stats["retries"] += 1
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._trim(time.monotonic())
+            return {
+                **self._stats,
+                "window_requests": len(self._requests),
+                "window_retries": len(self._retries),
+            }
+
+
+_budget = RetryBudget()
+
+
+def get_retry_budget() -> RetryBudget:
+    """The retry budget shared by every crawler in the process."""
+    return _budget
+
+
+def configure_retry_budget(ratio: float, min_retries: int, window: Optional[float] = None) -> None:
+    """Resize the process-wide retry budget."""
+    _budget.configure(ratio, min_retries, window)
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+from .models import NewsItem
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .base import BaseNewsCrawler
+
+PathLike = Union[str, Path]
+
+
+class ArticleSink(ABC):
+    """
+    Destination for crawled articles.
+
+    Sinks are thread-safe and can be handed to `BaseNewsCrawler.run(sink=...)`
+    or to `CrawlPipeline(sink=...)` (they are callable with the pipeline's
+    `(crawler, news_item)` signature). Buffered sinks only guarantee that an
+    article is on disk after `flush()` or `close()`.
+    """
+
+    @abstractmethod
+    def write(self, news_item: NewsItem, crawler: Optional["BaseNewsCrawler"] = None) -> None:
+        """Store one article; `crawler` is the one that produced it, if any."""
+
+    def write_many(self, news_items: Iterable[NewsItem]) -> None:
+        for news_item in news_items:
+            self.write(news_item)
+
+    def flush(self) -> None:
+        """Make everything written so far durable / visible to readers."""
+
+    def close(self) -> None:
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+    def __call__(self, crawler: "BaseNewsCrawler", news_item: NewsItem) -> None:
+        self.write(news_item, crawler)
+
+    def __enter__(self) -> "ArticleSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class JsonFileSink(ArticleSink):
+    """One pretty-printed `<news_id>.json` per article (the historical format).
+
+    Without `directory` the crawler's own `save_as_json` (and save_path) is used.
+    """
+
+    def __init__(self, directory: Optional[PathLike] = None):
+        self.directory = Path(directory) if directory is not None else None
+        self.records = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, news_item: NewsItem, crawler: Optional["BaseNewsCrawler"] = None) -> None:
+        if self.directory is None:
+            if crawler is None:
+                raise ValueError("JsonFileSink without a directory needs the crawler")
+            crawler.save_as_json(news_item)
+        else:
+            name = news_item.news_id or (crawler.get_article_id() if crawler else None)
+            if not name:
+                raise ValueError(f"Article without news_id: {news_item.news_url}")
+            (self.directory / f"{name}.json").write_text(
+                json.dumps(news_item.to_dict(), ensure_ascii=False, indent=4),
+                encoding="utf-8",
+            )
+        self.records += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {"format": "json", "records": self.records}
+
+
+class _RotatingSink(ArticleSink):
+    """
+    Common part of the bulk sinks: numbered output files that are written as
+    `<name>.part` and renamed once complete, so readers only ever see whole
+    files. The pid is part of the name, several processes can share a directory.
+    """
+
+    format = ""
+    suffix = ""
+
+    def __init__(self, directory: PathLike, prefix: str = "articles"):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._part: Optional[Path] = None
+        self._sequence = 0
+        self.files: List[Path] = []
+        self.records = 0
+        self.bytes_written = 0
+
+    def _next_part(self) -> Path:
+        self._sequence += 1
+        name = f"{self.prefix}-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{self._sequence:05d}{self.suffix}"
+        self._part = self.directory / f"{name}.part"
+        return self._part
+
+    def _finish_part(self) -> None:
+        """Rename the current `.part` file to its final name (caller holds the lock)."""
+        if self._part is None:
+            return
+        final = self._part.with_suffix("")
+        os.replace(self._part, final)
+        self.bytes_written += final.stat().st_size
+        self.files.append(final)
+        self._part = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "format": self.format,
+                "records": self.records,
+                "files": len(self.files),
+                "mb_written": round(self.bytes_written / 1024 / 1024, 2),
+            }
+
+
+class JsonlSink(_RotatingSink):
+    """
+    Append-only JSON Lines, gzip-compressed by default, rotated by size.
+
+    Each line is `NewsItem.to_dict()` (the per-file JSON schema) without the
+    indentation. Files are rotated once about `max_bytes` have been written to
+    disk (compressed size); gzip members can be concatenated, so the output
+    also streams through `zcat` / `gzip.open` as a single corpus.
+    """
+
+    format = "jsonl"
+
+    def __init__(
+        self,
+        directory: PathLike,
+        prefix: str = "articles",
+        max_bytes: int = 256 * 1024 * 1024,
+        compress: bool = True,
+        compresslevel: int = 6,
+    ):
+        super().__init__(directory, prefix)
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.compresslevel = compresslevel
+        self.suffix = ".jsonl.gz" if compress else ".jsonl"
+        self._raw: Optional[io.BufferedWriter] = None
+        self._stream: Optional[Any] = None
+
+    def _open(self) -> None:
+        self._raw = open(self._next_part(), "wb", buffering=1024 * 1024)
+        if self.compress:
+            self._stream = gzip.GzipFile(filename="", mode="wb", fileobj=self._raw, compresslevel=self.compresslevel)
+        else:
+            self._stream = self._raw
+
+    def _close_file(self) -> None:
+        if self._stream is None:
+            return
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.close()
+        self._stream = self._raw = None
+        self._finish_part()
+
+    def write(self, news_item: NewsItem, crawler: Optional["BaseNewsCrawler"] = None) -> None:
+        line = news_item.model_dump_json(exclude_none=True).encode("utf-8") + b"\n"
+        with self._lock:
+            if self._stream is None:
+                self._open()
+            self._stream.write(line)
+            self.records += 1
+            if self._raw.tell() >= self.max_bytes:
+                self._close_file()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._stream is not None:
+                self._stream.flush()
+                self._raw.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_file()
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("pyarrow is required for the Parquet sink") from exc
+    return pyarrow
+
+
+def _parquet_schema(pa: Any) -> Any:
+    text_list = pa.list_(pa.string())
+    return pa.schema(
+        [
+            ("news_id", pa.string()),
+            ("news_url", pa.string()),
+            ("title", pa.string()),
+            ("subtitle", pa.string()),
+            ("author_name", pa.string()),
+            ("author_url", pa.string()),
+            ("publish_time", pa.string()),
+            (
+                "contents",
+                pa.list_(pa.struct([("type", pa.string()), ("content", pa.string()), ("desc", pa.string())])),
+            ),
+            ("texts", text_list),
+            ("images", text_list),
+            ("videos", text_list),
+            # Free-form dictionaries, kept as JSON text.
+            ("meta_extra", pa.string()),
+            ("extra", pa.string()),
+        ]
+    )
+
+
+def _parquet_row(news_item: NewsItem) -> Dict[str, Any]:
+    meta = news_item.meta_info
+    return {
+        "news_id": news_item.news_id,
+        "news_url": news_item.news_url,
+        "title": news_item.title,
+        "subtitle": news_item.subtitle,
+        "author_name": meta.author_name,
+        "author_url": meta.author_url,
+        "publish_time": meta.publish_time,
+        "contents": [
+            {"type": item.type.value, "content": item.content, "desc": item.desc} for item in news_item.contents
+        ],
+        "texts": news_item.texts,
+        "images": news_item.images,
+        "videos": news_item.videos,
+        "meta_extra": json.dumps(meta.extra, ensure_ascii=False, default=str) if meta.extra else None,
+        "extra": json.dumps(news_item.extra, ensure_ascii=False, default=str) if news_item.extra else None,
+    }
+
+
+class ParquetSink(_RotatingSink):
+    """
+    Columnar Parquet files for analytics; requires pyarrow.
+
+    Articles are buffered and written `row_group_size` at a time as one row
+    group; a file is closed and a new one started after `max_rows_per_file`
+    rows. `flush()` writes the buffered rows as a (smaller) row group.
+    """
+
+    format = "parquet"
+    suffix = ".parquet"
+
+    def __init__(
+        self,
+        directory: PathLike,
+        prefix: str = "articles",
+        row_group_size: int = 10_000,
+        max_rows_per_file: int = 1_000_000,
+        compression: str = "zstd",
+    ):
+        self._pa = _require_pyarrow()
+        super().__init__(directory, prefix)
+        self.row_group_size = row_group_size
+        self.max_rows_per_file = max_rows_per_file
+        self.compression = compression
+        self.schema = _parquet_schema(self._pa)
+        self._rows: List[Dict[str, Any]] = []
+        self._writer: Optional[Any] = None
+        self._rows_in_file = 0
+        self.row_groups = 0
+
+    def _write_row_group(self) -> None:
+        """Write the buffered rows (caller holds the lock)."""
+        if not self._rows:
+            return
+        table = self._pa.Table.from_pylist(self._rows, schema=self.schema)
+        self._rows = []
+        if self._writer is None:
+            self._writer = self._pa.parquet.ParquetWriter(
+                str(self._next_part()), self.schema, compression=self.compression
+            )
+        self._writer.write_table(table, row_group_size=table.num_rows)
+        self.row_groups += 1
+        self._rows_in_file += table.num_rows
+        if self._rows_in_file >= self.max_rows_per_file:
+            self._close_file()
+
+    def _close_file(self) -> None:
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+        self._rows_in_file = 0
+        self._finish_part()
+
+    def write(self, news_item: NewsItem, crawler: Optional["BaseNewsCrawler"] = None) -> None:
+        row = _parquet_row(news_item)
+        with self._lock:
+            self._rows.append(row)
+            self.records += 1
+            if len(self._rows) >= self.row_group_size:
+                self._write_row_group()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write_row_group()
+
+    def close(self) -> None:
+        with self._lock:
+            self._write_row_group()
+            self._close_file()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["row_groups"] = self.row_groups
+        return stats
+
+
+def _sqlite_sink(directory: PathLike, **options: Any) -> ArticleSink:
+    from .store import ArticleStore
+
+    return ArticleStore(Path(directory) / "articles.sqlite3", **options)
+
+
+SINKS = {
+    "json": JsonFileSink,
+    "jsonl": JsonlSink,
+    "parquet": ParquetSink,
+    "sqlite": _sqlite_sink,
+}
+
+
+def open_sink(format: str, directory: Optional[PathLike] = None, **options: Any) -> ArticleSink:
+    """Create a sink by name: "json", "jsonl", "parquet" or "sqlite" (an ArticleStore)."""
+    try:
+        sink_class = SINKS[format]
+    except KeyError:
+        raise ValueError(f"Unknown sink format {format!r}, expected one of: {', '.join(SINKS)}") from None
+    if directory is None and sink_class is not JsonFileSink:
+        raise ValueError(f"The {format} sink needs an output directory")
+    return sink_class(directory, **options)
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import hashlib
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from .models import NewsItem
+from .sinks import ArticleSink
+from .urls import canonical_url
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .base import BaseNewsCrawler
+
+logger = logging.getLogger(__name__)
+
+ArticleKey = Tuple[str, str]
+
+# Articles are keyed by the canonical URL: the ids the crawlers derive from
+# URLs are not unique across a platform. `articles_key` (platform, url_key)
+# also serves lookups by platform alone; `articles_platform_news_id` serves
+# lookups by article id.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    platform TEXT NOT NULL,
+    url_key TEXT NOT NULL,
+    news_id TEXT NOT NULL,
+    news_url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    publish_time TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    first_crawled REAL NOT NULL,
+    crawled_at REAL NOT NULL,
+    changed_at REAL NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS articles_key ON articles (platform, url_key);
+DROP INDEX IF EXISTS articles_news_id;
+CREATE INDEX IF NOT EXISTS articles_platform_news_id ON articles (platform, news_id);
+CREATE INDEX IF NOT EXISTS articles_publish_time ON articles (publish_time);
+CREATE INDEX IF NOT EXISTS articles_platform_publish_time ON articles (platform, publish_time);
+CREATE INDEX IF NOT EXISTS articles_content_hash ON articles (content_hash);
+"""
+
+# Re-crawling an article refreshes it; `changed_at` only moves when the
+# content hash differs. Expressions on the right see the old row.
+_UPSERT = """
+INSERT INTO articles (
+    platform, url_key, news_id, news_url, title, publish_time, content_hash,
+    first_crawled, crawled_at, changed_at, data
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (platform, url_key) DO UPDATE SET
+    news_id = excluded.news_id,
+    news_url = excluded.news_url,
+    title = excluded.title,
+    publish_time = excluded.publish_time,
+    content_hash = excluded.content_hash,
+    crawled_at = excluded.crawled_at,
+    changed_at = CASE WHEN content_hash = excluded.content_hash THEN changed_at ELSE excluded.changed_at END,
+    data = excluded.data
+"""
+
+
+def content_hash(news_item: NewsItem) -> str:
+    """Hash of the article text, shared by copies of an article published under different URLs."""
+    digest = hashlib.sha256(news_item.title.encode("utf-8"))
+    for text in news_item.texts:
+        digest.update(b"\x00")
+        digest.update(text.encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+class ArticleStore(ArticleSink):
+    """
+    SQLite article store keyed by (platform, canonical URL).
+
+    Every method taking a `url` accepts any variant of the article URL (http
+    or https, with tracking parameters, ...); it is normalized with
+    `canonical_url()` before the lookup. Deduplication (`put`, `seen`) is by
+    URL only; `seen_id()` / `get_by_id()` look articles up by the id the
+    crawler derived, which may match several stored URLs.
+
+    Writes are buffered and upserted `batch_size` at a time in one
+    transaction, by a background thread every `flush_interval` seconds (or
+    inline when `flush_interval` is 0), so `put()` is cheap enough to call
+    from an event loop. Reads see buffered articles immediately.
+
+    The database runs in WAL mode and reads go through a fixed pool of at
+    most `readers` connections, shared by whichever threads query the store,
+    so lookups are never blocked by a running batch. Existence checks are a
+    single probe of the (platform, url_key) index.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        readers: int = 4,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: Dict[ArticleKey, Tuple[Any, ...]] = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        self._writer.executescript(_SCHEMA)
+        self._idle_readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(readers)
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._closed = False
+        # Counters
+        self.written = 0
+        self.batches = 0
+        self.lookups = 0
+        self._wake = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, name="news-crawler-store", daemon=True)
+            self._flusher.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("PRAGMA temp_store=MEMORY")
+        db.execute("PRAGMA mmap_size=268435456")
+        db.execute("PRAGMA cache_size=-65536")
+        return db
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read connection; waits while all `readers` are in use."""
+        if self._closed:
+            raise RuntimeError("ArticleStore is closed")
+        with self._reader_slots:
+            try:
+                db = self._idle_readers.get_nowait()
+            except queue.Empty:
+                db = self._connect()
+                with self._readers_lock:
+                    self._readers.append(db)
+            try:
+                yield db
+            finally:
+                self._idle_readers.put(db)
+
+    def _read(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        with self._reader() as db:
+            return db.execute(sql, params).fetchall()
+
+    # ------------------------------------------------------------------ #
+    # Writes
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def platform_of(crawler: Optional["BaseNewsCrawler"], news_item: Optional[NewsItem] = None) -> str:
+        """The crawler's platform id, falling back to the URL's host name."""
+        if crawler is not None and crawler.platform:
+            return crawler.platform
+        url = crawler.new_url if crawler is not None else news_item.news_url if news_item is not None else ""
+        return urlsplit(url).hostname or ""
+
+    def put(self, news_item: NewsItem, platform: str, url: Optional[str] = None) -> None:
+        """Queue an upsert of `news_item` under (platform, url or news_item.news_url)."""
+        url = url or news_item.news_url
+        if not url:
+            raise ValueError(f"Article without news_url: {news_item.news_id}")
+        url_key = canonical_url(url)
+        now = time.time()
+        row = (
+            platform,
+            url_key,
+            news_item.news_id,
+            news_item.news_url,
+            news_item.title,
+            news_item.meta_info.publish_time,
+            content_hash(news_item),
+            now,
+            now,
+            now,
+            news_item.model_dump_json().encode("utf-8"),
+        )
+        with self._pending_lock:
+            self._pending[(platform, url_key)] = row
+            pending = len(self._pending)
+        if pending >= self.batch_size:
+            if self._flusher is None or pending >= self.batch_size * 4:
+                # No background thread, or it cannot keep up: write inline.
+                self.flush()
+            else:
+                self._wake.set()
+
+    def write(self, news_item: NewsItem, crawler: Optional["BaseNewsCrawler"] = None) -> None:
+        # Key by the requested URL so `seen()` can skip the article before it is fetched.
+        url = crawler.new_url if crawler is not None else None
+        self.put(news_item, self.platform_of(crawler, news_item), url)
+
+    def flush(self) -> None:
+        """Upsert every buffered article in one transaction."""
+        with self._write_lock:
+            with self._pending_lock:
+                rows = list(self._pending.values())
+            if not rows:
+                return
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                self._writer.executemany(_UPSERT, rows)
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            self._writer.execute("COMMIT")
+            with self._pending_lock:
+                # Keep entries re-queued while the batch was being written.
+                for row in rows:
+                    key = (row[0], row[1])
+                    if self._pending.get(key) is row:
+                        del self._pending[key]
+            self.written += len(rows)
+            self.batches += 1
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to write articles to %s", self.path)
+
+    def delete(self, platform: str, url: str) -> None:
+        url_key = canonical_url(url)
+        with self._pending_lock:
+            self._pending.pop((platform, url_key), None)
+        with self._write_lock:
+            self._writer.execute("DELETE FROM articles WHERE platform = ? AND url_key = ?", (platform, url_key))
+
+    # ------------------------------------------------------------------ #
+    # Reads
+    # ------------------------------------------------------------------ #
+    def _pending_row(self, platform: str, url_key: str) -> Optional[Tuple[Any, ...]]:
+        with self._pending_lock:
+            return self._pending.get((platform, url_key))
+
+    def crawled_at(self, platform: str, url: str) -> Optional[float]:
+        """When the article was last stored (epoch seconds), or None if it never was."""
+        self.lookups += 1
+        url_key = canonical_url(url)
+        row = self._pending_row(platform, url_key)
+        if row is not None:
+            return row[8]
+        rows = self._read("SELECT crawled_at FROM articles WHERE platform = ? AND url_key = ?", (platform, url_key))
+        return rows[0][0] if rows else None
+
+    def exists(self, platform: str, url: str, max_age: Optional[float] = None) -> bool:
+        """Whether the article is stored (and, with `max_age`, was crawled within that many seconds)."""
+        crawled_at = self.crawled_at(platform, url)
+        if crawled_at is None:
+            return False
+        return max_age is None or time.time() - crawled_at <= max_age
+
+    def seen(self, crawler: "BaseNewsCrawler", max_age: Optional[float] = None) -> bool:
+        """
+        `exists()` for the URL a crawler would fetch; usable as
+        `CrawlPipeline(skip_if=...)`. Matches by canonical URL only.
+        """
+        return self.exists(self.platform_of(crawler), crawler.new_url, max_age)
+
+    def _latest_by_id(self, platform: str, news_id: str) -> Optional[Tuple[float, bytes]]:
+        """(crawled_at, data) of the most recently crawled article with this id."""
+        self.lookups += 1
+        with self._pending_lock:
+            pending = [row for row in self._pending.values() if row[0] == platform and row[2] == news_id]
+        if pending:
+            row = max(pending, key=lambda row: row[8])
+            return row[8], row[10]
+        rows = self._read(
+            "SELECT crawled_at, data FROM articles WHERE platform = ? AND news_id = ? "
+            "ORDER BY crawled_at DESC LIMIT 1",
+            (platform, news_id),
+        )
+        return rows[0] if rows else None
+
+    def seen_id(self, platform: str, news_id: str, max_age: Optional[float] = None) -> bool:
+        """Whether any article with this id is stored (and crawled within `max_age` seconds)."""
+        latest = self._latest_by_id(platform, news_id)
+        if latest is None:
+            return False
+        return max_age is None or time.time() - latest[0] <= max_age
+
+    def get_by_id(self, platform: str, news_id: str, max_age: Optional[float] = None) -> Optional[NewsItem]:
+        """The most recently crawled article with this id; None if missing or older than `max_age`."""
+        latest = self._latest_by_id(platform, news_id)
+        if latest is None or (max_age is not None and time.time() - latest[0] > max_age):
+            return None
+        return NewsItem.model_validate_json(latest[1])
+
+    def get(self, platform: str, url: str, max_age: Optional[float] = None) -> Optional[NewsItem]:
+        """Load a stored article; None if missing or older than `max_age` seconds."""
+        self.lookups += 1
+        url_key = canonical_url(url)
+        row = self._pending_row(platform, url_key)
+        if row is not None:
+            crawled_at, data = row[8], row[10]
+        else:
+            rows = self._read(
+                "SELECT crawled_at, data FROM articles WHERE platform = ? AND url_key = ?", (platform, url_key)
+            )
+            if not rows:
+                return None
+            crawled_at, data = rows[0]
+        if max_age is not None and time.time() - crawled_at > max_age:
+            return None
+        return NewsItem.model_validate_json(data)
+
+    def find_by_hash(self, digest: str) -> List[ArticleKey]:
+        """(platform, url_key) of every stored article with this `content_hash`."""
+        self.flush()
+        rows = self._read("SELECT platform, url_key FROM articles WHERE content_hash = ?", (digest,))
+        return [tuple(row) for row in rows]
+
+    def duplicates_of(self, news_item: NewsItem) -> List[ArticleKey]:
+        """Stored articles with the same text as `news_item` (including itself, if stored)."""
+        return self.find_by_hash(content_hash(news_item))
+
+    def query(
+        self,
+        platform: Optional[str] = None,
+        published_after: Optional[str] = None,
+        published_before: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[NewsItem]:
+        """Articles ordered by publish_time (newest first); bounds compare as strings."""
+        self.flush()
+        clauses: List[str] = []
+        params: List[Any] = []
+        if platform is not None:
+            clauses.append("platform = ?")
+            params.append(platform)
+        if published_after is not None:
+            clauses.append("publish_time >= ?")
+            params.append(published_after)
+        if published_before is not None:
+            clauses.append("publish_time < ?")
+            params.append(published_before)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._read(f"SELECT data FROM articles {where} ORDER BY publish_time DESC LIMIT ?", (*params, limit))
+        return [NewsItem.model_validate_json(row[0]) for row in rows]
+
+    def count(self, platform: Optional[str] = None) -> int:
+        self.flush()
+        if platform is None:
+            return self._read("SELECT COUNT(*) FROM articles")[0][0]
+        return self._read("SELECT COUNT(*) FROM articles WHERE platform = ?", (platform,))[0][0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._pending_lock:
+            pending = len(self._pending)
+        return {
+            "format": "sqlite",
+            "path": str(self.path),
+            "records": self.written,
+            "pending": pending,
+            "batches": self.batches,
+            "lookups": self.lookups,
+        }
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._flusher is not None:
+            self._wake.set()
+            self._flusher.join()
+        self.flush()
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for db in readers:
+            db.close()
+        with self._write_lock:
+            self._writer.close()
+
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from; they never select
+# a different article, so they are dropped from the canonical form.
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "igshid",
+        "log_from",
+        "mc_cid",
+        "mc_eid",
+        "ocid",
+        "ref",
+        "ref_src",
+        "share_token",
+        "spm",
+        "wt_mc",
+        "yclid",
+    }
+)
+TRACKING_PREFIXES = ("utm_", "at_")
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize an article URL so that trivial variants map to one string.
+
+    The scheme and host are lowercased (http is folded into https), default
+    ports, the fragment, trailing slashes and tracking parameters are dropped
+    and the remaining query parameters are sorted. The path is otherwise kept
+    verbatim, so every path segment stays part of the identity.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    if scheme == "http":
+        scheme = "https"
+    host = (parts.hostname or "").rstrip(".")
+    netloc = host
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(parts.scheme.lower()):
+        netloc = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking(name)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
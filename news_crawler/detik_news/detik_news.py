@@ -6,16 +6,20 @@ from __future__ import annotations
 # description: 采集detik新闻详情
 
 from typing import List, Optional
+from urllib.parse import urlsplit
 
-from parsel import Selector
 from pydantic import Field
 
 from news_crawler.core import (
+    AsyncFetchStrategy,
     BaseNewsCrawler,
     ContentItem,
     ContentType,
+    FetchStrategy,
+    HtmlSource,
     NewsItem,
     NewsMetaInfo,
+    ParseContext,
     RequestHeaders as BaseRequestHeaders,
 )
 
@@ -29,20 +33,32 @@ class RequestHeaders(BaseRequestHeaders):
 
 
 class DetikNewsCrawler(BaseNewsCrawler):
+    platform = "detik"
+
     def __init__(
         self,
         new_url: str,
-        save_path: str = "data/",
+        save_path: Optional[str] = "data/",
         headers: Optional[RequestHeaders] = None,
+        fetcher: Optional[FetchStrategy] = None,
+        async_fetcher: Optional[AsyncFetchStrategy] = None,
     ):
         """初始化detik新闻详情爬虫
 
         Args:
             new_url (str): 新闻详情页url
-            save_path (str, optional): 保存路径. Defaults to "".
+            save_path (Optional[str]): 保存路径，为 None 时不落盘. Defaults to "data/".
             headers (RequestHeaders, optional): 请求头. Defaults to RequestHeaders().
+            fetcher (FetchStrategy, optional): 同步抓取策略. Defaults to fetch_strategy().
+            async_fetcher (AsyncFetchStrategy, optional): 异步抓取策略. Defaults to async_fetch_strategy().
         """
-        super().__init__(new_url, save_path, headers=headers)
+        super().__init__(
+            new_url,
+            save_path,
+            headers=headers,
+            fetcher=fetcher,
+            async_fetcher=async_fetcher,
+        )
 
     @property
     def get_base_url(self) -> str:
@@ -61,19 +77,17 @@ class DetikNewsCrawler(BaseNewsCrawler):
             str: 新闻详情页文章id
         """
         try:
-            route_path = self.new_url.replace(self.get_base_url, "")
-            news_id = route_path.split("/")[2].split("?")[0]
-            if news_id.endswith("/"):
-                news_id = news_id[:-1]
-            return news_id
+            # 路径形如 /<栏目>/d-<数字>/<标题>，与协议、域名和查询参数无关
+            segments = [segment for segment in urlsplit(self.new_url).path.split("/") if segment]
+            return segments[1]
         except Exception as exc:  # pragma: no cover - defensive branch
             raise ValueError("解析文章ID失败，请检查URL是否正确") from exc
 
-    def parse_html_to_news_meta(self, html_content: str) -> NewsMetaInfo:
+    def parse_html_to_news_meta(self, html_content: HtmlSource) -> NewsMetaInfo:
         """解析新闻详情页元信息
 
         Args:
-            html_content (str): 新闻详情页内容
+            html_content (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             NewsMetaInfo: 新闻元信息
@@ -81,7 +95,7 @@ class DetikNewsCrawler(BaseNewsCrawler):
         self.logger.info(
             "Start to parse html to news meta, news_url: %s", self.new_url
         )
-        sel = Selector(text=html_content)
+        sel = ParseContext.of(html_content).selector
 
         publish_time = sel.xpath("//article[@class='detail']//div[@class='detail__date']/text()").get() or ""
         author_name = sel.xpath("string(//article[@class='detail']//div[@class='detail__author'])").get() or ""
@@ -93,17 +107,17 @@ class DetikNewsCrawler(BaseNewsCrawler):
             author_url=author_url,
         )
 
-    def parse_html_to_news_media(self, html_content: str) -> List[ContentItem]:
+    def parse_html_to_news_media(self, html_content: HtmlSource) -> List[ContentItem]:
         """解析封面媒体信息，detik中标题下面的第一个栏目通常是图片或者视频，解析它
 
         Args:
-            html_content (str): 新闻详情页内容
+            html_content (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             List[ContentItem]: 新闻媒体信息
         """
         res = []
-        selector = Selector(text=html_content)
+        selector = ParseContext.of(html_content).selector
         poster_img = selector.xpath("//div[@class='detail__media']/figure[@class='detail__media-image']/img/@src").get()
         poster_video = selector.xpath("//div[@class='detail__media']/iframe/@src").get()
         poster_desc = selector.xpath(
@@ -114,23 +128,24 @@ class DetikNewsCrawler(BaseNewsCrawler):
             res.append(ContentItem(type=ContentType.VIDEO, content=poster_video, desc=poster_desc or poster_video))
         return res
 
-    def parse_html_to_news_content(self, html_content: str) -> List[ContentItem]:
+    def parse_html_to_news_content(self, html_content: HtmlSource) -> List[ContentItem]:
         """解析新闻详情页内容
 
         Args:
-            html_content (str): 新闻详情页内容
+            html_content (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             List[ContentItem]: 新闻内容
         """
         contents = []
+        ctx = ParseContext.of(html_content)
 
         # 先尝试解析封面媒体信息
-        media_contents = self.parse_html_to_news_media(html_content)
+        media_contents = self.parse_html_to_news_media(ctx)
         contents.extend(media_contents)
 
         # 再解析新闻正文
-        selector = Selector(text=html_content)
+        selector = ctx.selector
         elements = selector.xpath('//div[@class="detail__body-text itp_bodycontent"]/*')
         for element in elements:
             if element.root.tag == 'p':
@@ -163,14 +178,15 @@ class DetikNewsCrawler(BaseNewsCrawler):
 
         return contents
 
-    def parse_content(self, html: str) -> NewsItem:
-        selector = Selector(text=html)
+    def parse_content(self, html: HtmlSource) -> NewsItem:
+        ctx = ParseContext.of(html)
+        selector = ctx.selector
         title = selector.xpath("//h1/text()").get("").strip()
         if not title:
             raise ValueError("Failed to get title")
 
-        meta_info = self.parse_html_to_news_meta(html)
-        contents = self.parse_html_to_news_content(html)
+        meta_info = self.parse_html_to_news_meta(ctx)
+        contents = self.parse_html_to_news_content(ctx)
 
         return self.compose_news_item(
             title=title,
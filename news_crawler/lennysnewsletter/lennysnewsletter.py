@@ -11,11 +11,15 @@ from parsel import Selector
 from pydantic import Field
 
 from news_crawler.core import (
+    AsyncFetchStrategy,
     BaseNewsCrawler,
     ContentItem,
     ContentType,
+    FetchStrategy,
+    HtmlSource,
     NewsItem,
     NewsMetaInfo,
+    ParseContext,
     RequestHeaders as BaseRequestHeaders,
 )
 
@@ -36,17 +40,17 @@ class LennysNewsletterContentParser:
         """初始化新闻详情页内容解析器"""
         self._contents: List[ContentItem] = []
 
-    def parse_html_to_news_content(self, html_content: str) -> List[ContentItem]:
+    def parse_html_to_news_content(self, html_content: HtmlSource) -> List[ContentItem]:
         """解析新闻详情页内容，保持段落结构
 
         Args:
-            html_content (str): 新闻详情页内容
+            html_content (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             List[ContentItem]: 新闻详情页内容，每个段落作为独立的ContentItem
         """
         self._contents = []
-        selector = Selector(text=html_content)
+        selector = ParseContext.of(html_content).selector
 
         content_node = selector.xpath("//div[@class='available-content']")
         if not content_node:
@@ -59,7 +63,7 @@ class LennysNewsletterContentParser:
         contents = [item for item in self._contents if item.content.strip()]
         return self._remove_duplicate_contents(contents)
 
-    def parse(self, html_content: str) -> List[ContentItem]:
+    def parse(self, html_content: HtmlSource) -> List[ContentItem]:
         return self.parse_html_to_news_content(html_content)
 
     def _remove_duplicate_contents(
@@ -237,15 +241,24 @@ class LennysNewsletterContentParser:
 
 
 class LennysNewsletterCrawler(BaseNewsCrawler):
+    platform = "lenny"
     headers_model = RequestHeaders
 
     def __init__(
         self,
         new_url: str,
-        save_path: str = "data/",
+        save_path: Optional[str] = "data/",
         headers: Optional[RequestHeaders] = None,
+        fetcher: Optional[FetchStrategy] = None,
+        async_fetcher: Optional[AsyncFetchStrategy] = None,
     ):
-        super().__init__(new_url, save_path, headers=headers)
+        super().__init__(
+            new_url,
+            save_path,
+            headers=headers,
+            fetcher=fetcher,
+            async_fetcher=async_fetcher,
+        )
         self._content_parser = LennysNewsletterContentParser()
 
     @property
@@ -273,11 +286,11 @@ class LennysNewsletterCrawler(BaseNewsCrawler):
             raise ValueError("解析文章ID失败，请检查URL是否正确") from exc
 
 
-    def parse_html_to_news_meta(self, html_content: str) -> NewsMetaInfo:
+    def parse_html_to_news_meta(self, html_content: HtmlSource) -> NewsMetaInfo:
         """解析新闻详情页元信息
 
         Args:
-            html_content (str): 新闻详情页内容
+            html_content (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             NewsMetaInfo: 新闻元信息
@@ -285,7 +298,7 @@ class LennysNewsletterCrawler(BaseNewsCrawler):
         self.logger.info(
             "Start to parse html to news meta, news_url: %s", self.new_url
         )
-        sel = Selector(text=html_content)
+        sel = ParseContext.of(html_content).selector
 
         author_xpath = "//div[@class='post-header']//div[contains(@class, 'profile-hover-card-target')]/a"
         publish_time = (
@@ -303,27 +316,28 @@ class LennysNewsletterCrawler(BaseNewsCrawler):
             author_url=author_url.strip(),
         )
 
-    def parse_html_to_news_content(self, html_content: str) -> List[ContentItem]:
+    def parse_html_to_news_content(self, html_content: HtmlSource) -> List[ContentItem]:
         """解析新闻详情页内容
 
         Args:
-            html_content (str): 新闻详情页内容
+            html_content (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             List[ContentItem]: 新闻内容
         """
         return self._content_parser.parse(html_content)
 
-    def parse_content(self, html: str) -> NewsItem:
+    def parse_content(self, html: HtmlSource) -> NewsItem:
         """解析新闻详情页内容
 
         Args:
-            html (str): 新闻详情页内容
+            html (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             NewsItem: 新闻详情
         """
-        selector = Selector(text=html)
+        ctx = ParseContext.of(html)
+        selector = ctx.selector
 
         title = selector.xpath("//h1/text()").get()
         if not title:
@@ -331,8 +345,8 @@ class LennysNewsletterCrawler(BaseNewsCrawler):
 
         subtitle = selector.xpath("//h3/text()").get() or ""
 
-        meta_info = self.parse_html_to_news_meta(html)
-        contents = self.parse_html_to_news_content(html)
+        meta_info = self.parse_html_to_news_meta(ctx)
+        contents = self.parse_html_to_news_content(ctx)
 
         return self.compose_news_item(
             title=title,
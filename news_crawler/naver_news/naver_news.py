@@ -6,18 +6,22 @@ from __future__ import annotations
 # description: naver news 采集器
 
 from typing import List, Optional
+from urllib.parse import parse_qs, urlsplit
 
-import requests
 from parsel import Selector
 from pydantic import Field
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import AsyncRetrying, Retrying
 
 from news_crawler.core import (
+    AsyncFetchStrategy,
     BaseNewsCrawler,
     ContentItem,
     ContentType,
+    FetchStrategy,
+    HtmlSource,
     NewsItem,
     NewsMetaInfo,
+    ParseContext,
     RequestHeaders as BaseRequestHeaders,
 )
 from news_crawler.core.fetchers import FetchRequest
@@ -45,9 +49,9 @@ class NaverNewsContentParser:
     def __init__(self) -> None:
         self._contents: List[ContentItem] = []
 
-    def parse(self, html_content: str) -> List[ContentItem]:
+    def parse(self, html_content: HtmlSource) -> List[ContentItem]:
         self._contents = []
-        selector = Selector(text=html_content)
+        selector = ParseContext.of(html_content).selector
         content_node = selector.xpath("//div[@class='se-main-container']")
         if not content_node:
             return []
@@ -154,25 +158,52 @@ class NaverNewsContentParser:
 
 
 class NaverNewsCrawler(BaseNewsCrawler):
+    platform = "naver"
     headers_model = RequestHeaders
 
     def __init__(
         self,
         new_url: str,
-        save_path: str = "data/",
+        save_path: Optional[str] = "data/",
         headers: Optional[RequestHeaders] = None,
+        fetcher: Optional[FetchStrategy] = None,
+        async_fetcher: Optional[AsyncFetchStrategy] = None,
     ):
-        super().__init__(new_url, save_path, headers=headers)
+        super().__init__(
+            new_url,
+            save_path,
+            headers=headers,
+            fetcher=fetcher,
+            async_fetcher=async_fetcher,
+        )
         self._content_parser = NaverNewsContentParser()
-        self.iframe_url = self.get_iframe_url_path()
+        self._iframe_url: Optional[str] = None
+
+    @property
+    def iframe_url(self) -> str:
+        """正文所在 iframe 的地址，首次访问时解析"""
+        if self._iframe_url is None:
+            self._iframe_url = self.get_iframe_url_path()
+        return self._iframe_url
 
     @property
     def get_base_url(self) -> str:
         return "https://blog.naver.com"
 
     def get_article_id(self) -> str:
+        """获取博客文章id: <blogId>_<logNo>，logNo 只在同一个博客内唯一
+            eg: https://blog.naver.com/sjh_0312/223456789012
+                return: sjh_0312_223456789012
+            eg: https://blog.naver.com/PostView.naver?blogId=sjh_0312&logNo=223456789012
+                return: sjh_0312_223456789012
+        """
         try:
-            return self.new_url.split("?")[0].split("/")[-1].rstrip("/")
+            parts = urlsplit(self.new_url)
+            query = parse_qs(parts.query)
+            if "blogId" in query and "logNo" in query:
+                return f"{query['blogId'][0]}_{query['logNo'][0]}"
+            blog_id, log_no = [segment for segment in parts.path.split("/") if segment][-2:]
+            return f"{blog_id}_{log_no}"
         except Exception as exc:  # pragma: no cover - defensive branch
             raise ValueError("解析文章ID失败，请检查URL是否正确") from exc
 
@@ -181,24 +212,42 @@ class NaverNewsCrawler(BaseNewsCrawler):
         request.url = self.iframe_url
         return request
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
-    def get_iframe_url_path(self) -> str:
-        response = requests.get(self.new_url, headers=self.headers)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch content: {response.status_code}")
-        response.encoding = "utf-8"
-        selector = Selector(text=response.text)
+    def _build_iframe_lookup_request(self) -> FetchRequest:
+        return FetchRequest(
+            url=self.new_url,
+            headers=self.headers,
+            timeout=self.fetch_timeout,
+        )
+
+    def _extract_iframe_url(self, html: str) -> str:
+        selector = Selector(text=html)
         iframe_url = selector.xpath("//iframe[@id='mainFrame']/@src").get("")
         if not iframe_url:
             raise RuntimeError("Failed to get iframe url")
         self.logger.info("Success to get iframe url: %s", iframe_url)
         return self.get_base_url + iframe_url
 
-    def parse_html_to_news_meta(self, html_content: str) -> NewsMetaInfo:
+    def get_iframe_url_path(self) -> str:
+        # 与正文抓取相同的重试策略：只重试可恢复的错误，遵守 Retry-After 和共享的重试预算
+        retryer = Retrying(**self._retry_options())
+        html = retryer(self.fetcher.fetch, self._build_iframe_lookup_request())
+        return self._extract_iframe_url(html)
+
+    async def aget_iframe_url_path(self) -> str:
+        retryer = AsyncRetrying(**self._retry_options())
+        html = await retryer(self.async_fetcher.afetch, self._build_iframe_lookup_request())
+        return self._extract_iframe_url(html)
+
+    async def afetch_content(self) -> str:
+        if self._iframe_url is None:
+            self._iframe_url = await self.aget_iframe_url_path()
+        return await super().afetch_content()
+
+    def parse_html_to_news_meta(self, html_content: HtmlSource) -> NewsMetaInfo:
         self.logger.info(
             "Start to parse html to news meta, news_url: %s", self.new_url
         )
-        sel = Selector(text=html_content)
+        sel = ParseContext.of(html_content).selector
 
         publish_time = (
             sel.xpath("//span[@class='se_publishDate pcol2']/text()").get() or ""
@@ -212,11 +261,12 @@ class NaverNewsCrawler(BaseNewsCrawler):
             author_url=author_url.strip(),
         )
 
-    def parse_html_to_news_content(self, html_content: str) -> List[ContentItem]:
+    def parse_html_to_news_content(self, html_content: HtmlSource) -> List[ContentItem]:
         return self._content_parser.parse(html_content)
 
-    def parse_content(self, html: str) -> NewsItem:
-        selector = Selector(text=html)
+    def parse_content(self, html: HtmlSource) -> NewsItem:
+        ctx = ParseContext.of(html)
+        selector = ctx.selector
         title = (
             selector.xpath(
                 "string(//div[@class='se-module se-module-text se-title-text']//span)"
@@ -226,8 +276,8 @@ class NaverNewsCrawler(BaseNewsCrawler):
         if not title:
             raise ValueError("Failed to get title")
 
-        meta_info = self.parse_html_to_news_meta(html)
-        contents = self.parse_html_to_news_content(html)
+        meta_info = self.parse_html_to_news_meta(ctx)
+        contents = self.parse_html_to_news_content(ctx)
 
         return self.compose_news_item(
             title=title,
@@ -7,18 +7,25 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from parsel import Selector
 from pydantic import Field
 
 from news_crawler.core import (
+    AsyncFetchStrategy,
     BaseNewsCrawler,
     ContentItem,
     ContentType,
+    FetchStrategy,
+    HtmlSource,
     NewsItem,
     NewsMetaInfo,
+    ParseContext,
     RequestHeaders as BaseRequestHeaders,
 )
-from news_crawler.core.fetchers import CurlCffiFetcher, FetchRequest
+from news_crawler.core.fetchers import (
+    AsyncCurlCffiFetcher,
+    CurlCffiFetcher,
+    FetchRequest,
+)
 
 ## 网易的cookies不需要登录态，随便打开一个网易新闻提取cookies即可
 FIXED_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36'
@@ -31,23 +38,34 @@ class RequestHeaders(BaseRequestHeaders):
 
 
 class NeteaseNewsCrawler(BaseNewsCrawler):
+    platform = "netease"
     fetch_strategy = CurlCffiFetcher
+    async_fetch_strategy = AsyncCurlCffiFetcher
 
     def __init__(
         self,
         new_url: str,
-        save_path: str = "data/",
+        save_path: Optional[str] = "data/",
         headers: Optional[RequestHeaders] = None,
-        fetcher: Optional[CurlCffiFetcher] = None,
+        fetcher: Optional[FetchStrategy] = None,
+        async_fetcher: Optional[AsyncFetchStrategy] = None,
     ):
         """初始化网易新闻详情爬虫
 
         Args:
             new_url (str): 新闻详情页url
-            save_path (str, optional): 保存路径. Defaults to "data/".
+            save_path (Optional[str]): 保存路径，为 None 时不落盘. Defaults to "data/".
             headers (RequestHeaders, optional): 请求头. Defaults to RequestHeaders().
+            fetcher (FetchStrategy, optional): 同步抓取策略. Defaults to fetch_strategy().
+            async_fetcher (AsyncFetchStrategy, optional): 异步抓取策略. Defaults to async_fetch_strategy().
         """
-        super().__init__(new_url, save_path, headers=headers, fetcher=fetcher)
+        super().__init__(
+            new_url,
+            save_path,
+            headers=headers,
+            fetcher=fetcher,
+            async_fetcher=async_fetcher,
+        )
 
     @property
     def get_base_url(self) -> str:
@@ -77,11 +95,11 @@ class NeteaseNewsCrawler(BaseNewsCrawler):
         request.impersonate = "chrome"
         return request
 
-    def parse_html_to_news_meta(self, html_content: str) -> NewsMetaInfo:
+    def parse_html_to_news_meta(self, html_content: HtmlSource) -> NewsMetaInfo:
         """解析新闻详情页元信息
 
         Args:
-            html_content (str): 新闻详情页内容
+            html_content (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             NewsMetaInfo: 新闻元信息
@@ -89,7 +107,7 @@ class NeteaseNewsCrawler(BaseNewsCrawler):
         self.logger.info(
             "Start to parse html to news meta, news_url: %s", self.new_url
         )
-        sel = Selector(text=html_content)
+        sel = ParseContext.of(html_content).selector
 
         # Extract publish time from meta tag or post_info
         publish_time = sel.xpath("//html/@data-publishtime").get() or ""
@@ -109,17 +127,17 @@ class NeteaseNewsCrawler(BaseNewsCrawler):
             author_url="",
         )
 
-    def parse_html_to_news_content(self, html_content: str) -> List[ContentItem]:
+    def parse_html_to_news_content(self, html_content: HtmlSource) -> List[ContentItem]:
         """解析新闻详情页内容
 
         Args:
-            html_content (str): 新闻详情页内容
+            html_content (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             List[ContentItem]: 新闻内容
         """
         contents = []
-        selector = Selector(text=html_content)
+        selector = ParseContext.of(html_content).selector
 
         # NetEase news content is in div.post_body
         elements = selector.xpath('//div[@class="post_body"]/*')
@@ -150,24 +168,25 @@ class NeteaseNewsCrawler(BaseNewsCrawler):
 
         return contents
 
-    def parse_content(self, html: str) -> NewsItem:
+    def parse_content(self, html: HtmlSource) -> NewsItem:
         """解析新闻详情页内容
 
         Args:
-            html (str): 新闻详情页内容
+            html (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             NewsItem: 新闻详情
         """
-        selector = Selector(text=html)
+        ctx = ParseContext.of(html)
+        selector = ctx.selector
 
         # Get title from h1.post_title
         title = selector.xpath('//h1[@class="post_title"]/text()').get("")
         if not title:
             raise ValueError("Failed to get title")
 
-        meta_info = self.parse_html_to_news_meta(html)
-        contents = self.parse_html_to_news_content(html)
+        meta_info = self.parse_html_to_news_meta(ctx)
+        contents = self.parse_html_to_news_content(ctx)
 
         return self.compose_news_item(
             title=title.strip(),
@@ -11,11 +11,15 @@ from typing import Any, Dict, List, Optional
 from pydantic import Field
 
 from news_crawler.core import (
+    AsyncFetchStrategy,
     BaseNewsCrawler,
     ContentItem,
     ContentType,
+    FetchStrategy,
+    HtmlSource,
     NewsItem,
     NewsMetaInfo,
+    ParseContext,
     RequestHeaders as BaseRequestHeaders,
 )
 
@@ -40,15 +44,24 @@ def timestamp_to_date(timestamp: int) -> str:
 
 
 class QuoraAnswerCrawler(BaseNewsCrawler):
+    platform = "quora"
     headers_model = RequestHeaders
 
     def __init__(
         self,
         answer_url: str,
-        save_path: str = "data/",
+        save_path: Optional[str] = "data/",
         headers: RequestHeaders | None = None,
+        fetcher: FetchStrategy | None = None,
+        async_fetcher: AsyncFetchStrategy | None = None,
     ):
-        super().__init__(answer_url, save_path, headers=headers)
+        super().__init__(
+            answer_url,
+            save_path,
+            headers=headers,
+            fetcher=fetcher,
+            async_fetcher=async_fetcher,
+        )
 
     @property
     def answer_url(self) -> str:
@@ -155,8 +168,8 @@ class QuoraAnswerCrawler(BaseNewsCrawler):
 
         return contents
 
-    def parse_content(self, html: str) -> NewsItem:
-        answer_json = self.extract_answer_json(html)
+    def parse_content(self, html: HtmlSource) -> NewsItem:
+        answer_json = self.extract_answer_json(ParseContext.of(html).html)
         if not answer_json:
             raise ValueError("提取回答数据失败")
 
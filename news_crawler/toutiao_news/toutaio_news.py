@@ -7,15 +7,18 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from parsel import Selector
 from pydantic import Field
 
 from news_crawler.core import (
+    AsyncFetchStrategy,
     BaseNewsCrawler,
     ContentItem,
     ContentType,
+    FetchStrategy,
+    HtmlSource,
     NewsItem,
     NewsMetaInfo,
+    ParseContext,
     RequestHeaders as BaseRequestHeaders,
 )
 
@@ -29,20 +32,32 @@ class RequestHeaders(BaseRequestHeaders):
 
 
 class ToutiaoNewsCrawler(BaseNewsCrawler):
+    platform = "toutiao"
+
     def __init__(
         self,
         new_url: str,
-        save_path: str = "data/",
+        save_path: Optional[str] = "data/",
         headers: Optional[RequestHeaders] = None,
+        fetcher: Optional[FetchStrategy] = None,
+        async_fetcher: Optional[AsyncFetchStrategy] = None,
     ):
         """初始化头条新闻详情爬虫
 
         Args:
             new_url (str): 新闻详情页url
-            save_path (str, optional): 保存路径. Defaults to "".
+            save_path (Optional[str]): 保存路径，为 None 时不落盘. Defaults to "data/".
             headers (RequestHeaders, optional): 请求头. Defaults to RequestHeaders().
+            fetcher (FetchStrategy, optional): 同步抓取策略. Defaults to fetch_strategy().
+            async_fetcher (AsyncFetchStrategy, optional): 异步抓取策略. Defaults to async_fetch_strategy().
         """
-        super().__init__(new_url, save_path, headers=headers)
+        super().__init__(
+            new_url,
+            save_path,
+            headers=headers,
+            fetcher=fetcher,
+            async_fetcher=async_fetcher,
+        )
 
     @property
     def get_base_url(self) -> str:
@@ -68,11 +83,11 @@ class ToutiaoNewsCrawler(BaseNewsCrawler):
         except Exception as exc:  # pragma: no cover - defensive branch
             raise ValueError("解析文章ID失败，请检查URL是否正确") from exc
 
-    def parse_html_to_news_meta(self, html_content: str) -> NewsMetaInfo:
+    def parse_html_to_news_meta(self, html_content: HtmlSource) -> NewsMetaInfo:
         """解析新闻详情页元信息
 
         Args:
-            html_content (str): 新闻详情页内容
+            html_content (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             NewsMetaInfo: 新闻元信息
@@ -80,7 +95,7 @@ class ToutiaoNewsCrawler(BaseNewsCrawler):
         self.logger.info(
             "Start to parse html to news meta, news_url: %s", self.new_url
         )
-        sel = Selector(text=html_content)
+        sel = ParseContext.of(html_content).selector
 
         publish_time = sel.xpath("//div[@class='article-meta']/span[1]/text()").get() or ""
         author_name = sel.xpath("//div[@class='article-meta']/span[@class='name']/a/text()").get() or ""
@@ -92,17 +107,17 @@ class ToutiaoNewsCrawler(BaseNewsCrawler):
             author_url=(self.get_base_url + author_url.strip()) if author_url else "",
         )
 
-    def parse_html_to_news_content(self, html_content: str) -> List[ContentItem]:
+    def parse_html_to_news_content(self, html_content: HtmlSource) -> List[ContentItem]:
         """解析新闻详情页内容
 
         Args:
-            html_content (str): 新闻详情页内容
+            html_content (HtmlSource): 新闻详情页内容或解析上下文
 
         Returns:
             List[ContentItem]: 新闻内容
         """
         contents = []
-        selector = Selector(text=html_content)
+        selector = ParseContext.of(html_content).selector
 
         elements = selector.xpath('//article/*')
         for element in elements:
@@ -130,14 +145,14 @@ class ToutiaoNewsCrawler(BaseNewsCrawler):
 
         return contents
 
-    def parse_content(self, html: str) -> NewsItem:
-        selector = Selector(text=html)
-        title = selector.xpath("//h1/text()").get("") or ""
+    def parse_content(self, html: HtmlSource) -> NewsItem:
+        ctx = ParseContext.of(html)
+        title = ctx.selector.xpath("//h1/text()").get("") or ""
         if not title:
             raise ValueError("Failed to get title")
 
-        meta_info = self.parse_html_to_news_meta(html)
-        contents = self.parse_html_to_news_content(html)
+        meta_info = self.parse_html_to_news_meta(ctx)
+        contents = self.parse_html_to_news_content(ctx)
 
         return self.compose_news_item(
             title=title.strip(),
@@ -14,14 +14,22 @@ from parsel import Selector
 from pydantic import Field
 
 from news_crawler.core import (
+    AsyncFetchStrategy,
     BaseNewsCrawler,
     ContentItem,
     ContentType,
+    FetchStrategy,
+    HtmlSource,
     NewsItem,
     NewsMetaInfo,
+    ParseContext,
     RequestHeaders as BaseRequestHeaders,
 )
-from news_crawler.core.fetchers import CurlCffiFetcher, FetchRequest
+from news_crawler.core.fetchers import (
+    AsyncCurlCffiFetcher,
+    CurlCffiFetcher,
+    FetchRequest,
+)
 
 
 FIXED_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
@@ -56,7 +64,6 @@ def _convert_js_obj_to_json(js_obj_str: str) -> str:
             # 如果直接解析失败，则使用demjson3进行转换
             js_obj_str = js_obj_str.replace(" * 1", "")
             parsed_data = demjson3.decode(js_obj_str)
-            print(parsed_data)
             return json.dumps(parsed_data, ensure_ascii=False)
         except Exception as e:
             logger.error(f"Failed to convert JS object to JSON: {str(e)}")
@@ -165,6 +172,18 @@ def _parse_ssr_data(html: str) -> Optional[dict]:
         return None
 
 
+def _get_ssr_data(ctx: ParseContext) -> Optional[dict]:
+    """获取SSR数据，同一个页面只解析一次
+
+    Args:
+        ctx (ParseContext): 页面解析上下文
+
+    Returns:
+        Optional[dict]: 解析后的SSR数据，解析失败返回None
+    """
+    return ctx.memo("ssr_data", lambda: _parse_ssr_data(ctx.html))
+
+
 def _parse_ssr_image_list(html: str) -> List[ContentItem]:
     """解析SSR渲染的图片列表
 
@@ -204,23 +223,23 @@ class WechatContentParser:
         """初始化微信公众号文章正文内容解析器"""
         self._contents: List[ContentItem] = []
 
-    def parse_html_to_news_content(self, html_content: str) -> List[ContentItem]:
+    def parse_html_to_news_content(self, html_content: HtmlSource) -> List[ContentItem]:
         """解析公众号文章详情页内容，保持段落结构
            微信公众号的由于出在多编辑器的情况，所以解析比较复杂
 
         Args:
-            html_content (str): 公众号文章内容
+            html_content (HtmlSource): 公众号文章内容或解析上下文
 
         Returns:
             List[ContentItem]: 公众号章内容，每个段落作为独立的ContentItem
         """
         self._contents = []
-        selector = Selector(text=html_content)     
-        content_node = selector.xpath('//div[@id="js_content"]')
+        ctx = ParseContext.of(html_content)
+        content_node = ctx.selector.xpath('//div[@id="js_content"]')
         
         # 检查是否是SSR渲染的页面, 如果通过xpath没有找到js_content节点, 则认为不是SSR渲染的页面, 则调用parse_ssr_content方法
         if not content_node: 
-            return self.parse_ssr_content(html_content)
+            return self.parse_ssr_content(ctx)
            
         # 处理所有直接子节点
         for node in content_node.xpath("./*"):
@@ -229,7 +248,7 @@ class WechatContentParser:
         contents = [item for item in self._contents if item.content.strip()]
         return self._remove_duplicate_contents(contents)
 
-    def parse(self, html_content: str) -> List[ContentItem]:
+    def parse(self, html_content: HtmlSource) -> List[ContentItem]:
         """兼容 ContentParser 协议。"""
         return self.parse_html_to_news_content(html_content)
 
@@ -426,18 +445,19 @@ class WechatContentParser:
                 self._contents.append(ContentItem(type=ContentType.TEXT, content=text))
             return
 
-    def parse_ssr_content(self, html_content: str) -> List[ContentItem]:
+    def parse_ssr_content(self, html_content: HtmlSource) -> List[ContentItem]:
         """解析SSR渲染的页面内容
 
         Args:
-            html_content (str): 页面HTML内容
+            html_content (HtmlSource): 页面HTML内容或解析上下文
 
         Returns:
             List[ContentItem]: 解析后的内容列表
         """
         # 提取SSR数据
         contents = []
-        ssr_data_dict = _parse_ssr_data(html_content)
+        ctx = ParseContext.of(html_content)
+        ssr_data_dict = _get_ssr_data(ctx)
 
         if ssr_data_dict:
             try:
@@ -453,7 +473,7 @@ class WechatContentParser:
 
                 # 方案2：从HTML中提取图片列表（旧版window.picture_page_info_list格式）
                 if not picture_list:
-                    contents.extend(_parse_ssr_image_list(html_content))
+                    contents.extend(_parse_ssr_image_list(ctx.html))
 
                 # 提取文本内容
                 # 有的xhs风格的公众号页面，没有desc，只有title，要兼容一下。
@@ -479,17 +499,26 @@ class WechatContentParser:
 class WeChatNewsCrawler(BaseNewsCrawler):
     """微信公众平台文章爬虫实现。"""
 
+    platform = "wechat"
     headers_model = RequestHeaders
     fetch_strategy = CurlCffiFetcher
+    async_fetch_strategy = AsyncCurlCffiFetcher
 
     def __init__(
         self,
         new_url: str,
-        save_path: str = "data/",
+        save_path: Optional[str] = "data/",
         headers: Optional[RequestHeaders] = None,
-        fetcher: Optional[CurlCffiFetcher] = None,
+        fetcher: Optional[FetchStrategy] = None,
+        async_fetcher: Optional[AsyncFetchStrategy] = None,
     ):
-        super().__init__(new_url, save_path, headers=headers, fetcher=fetcher)
+        super().__init__(
+            new_url,
+            save_path,
+            headers=headers,
+            fetcher=fetcher,
+            async_fetcher=async_fetcher,
+        )
         self._content_parser = WechatContentParser()
 
     @property
@@ -514,10 +543,11 @@ class WeChatNewsCrawler(BaseNewsCrawler):
         match = re.search(pattern, html_content)
         return match.group(1) if match else ""
 
-    def parse_html_to_news_meta(self, html_content: str) -> NewsMetaInfo:
+    def parse_html_to_news_meta(self, html_content: HtmlSource) -> NewsMetaInfo:
         self.logger.info("Start to parse html to news meta, news_url: %s", self.new_url)
 
-        ssr_data = _parse_ssr_data(html_content)
+        ctx = ParseContext.of(html_content)
+        ssr_data = _get_ssr_data(ctx)
         if ssr_data:
             author_name = ssr_data.get("nick_name", "")
 
@@ -540,8 +570,8 @@ class WeChatNewsCrawler(BaseNewsCrawler):
                 author_url="",
             )
 
-        sel = Selector(text=html_content)
-        publish_time = self._parse_publish_time(html_content)
+        sel = ctx.selector
+        publish_time = self._parse_publish_time(ctx.html)
         wechat_name = sel.xpath("string(//span[@id='profileBt'])").get("").strip() or ""
         wechat_author_url = (
             sel.xpath(
@@ -559,21 +589,21 @@ class WeChatNewsCrawler(BaseNewsCrawler):
             author_url="",
         )
 
-    def parse_content(self, html: str) -> NewsItem:
-        ssr_data = _parse_ssr_data(html)
+    def parse_content(self, html: HtmlSource) -> NewsItem:
+        ctx = ParseContext.of(html)
+        ssr_data = _get_ssr_data(ctx)
         if ssr_data:            
             title = (ssr_data.get("title") or "").strip()
         else:
-            selector = Selector(text=html)
             title = (
-                selector.xpath('//h1[@id="activity-name"]/text()').get("") or ""
+                ctx.selector.xpath('//h1[@id="activity-name"]/text()').get("") or ""
             ).strip()
 
         if not title:
             raise ValueError("Failed to get title")
 
-        meta_info = self.parse_html_to_news_meta(html)
-        contents = list[ContentItem](self._content_parser.parse(html))
+        meta_info = self.parse_html_to_news_meta(ctx)
+        contents = list[ContentItem](self._content_parser.parse(ctx))
 
         return self.compose_news_item(
             title=title,
@@ -2,12 +2,29 @@
 """
 提取 API
 """
+import json
+import math
+import time
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, List, Literal, Optional, Dict, Any
 from datetime import datetime
 
-from news_extractor_core.services import ExtractorService, to_markdown, get_supported_platforms
+from news_crawler.core import ExecutorSaturated
+from news_extractor_core import config
+from news_extractor_core.models import NewsItem, dump_news_item_json
+from news_extractor_core.services import (
+    BatchExtractor,
+    BatchResult,
+    CircuitOpenError,
+    ExtractorService,
+    ato_markdown,
+    to_markdown,
+    get_supported_platforms,
+)
+
+from . import proxy
 
 router = APIRouter()
 
@@ -29,46 +46,170 @@ class ExtractResponse(BaseModel):
     error: Optional[Dict[str, str]] = None
 
 
+class BatchExtractRequest(BaseModel):
+    """批量提取请求"""
+    urls: List[str] = Field(..., min_length=1, max_length=config.BATCH_MAX_URLS, description="新闻链接列表")
+    output_format: str = Field(default="json", description="输出格式: json 或 markdown（markdown 时每条结果附带 markdown 字段）")
+    stream_format: Literal["ndjson", "sse"] = Field(default="ndjson", description="流格式: ndjson 或 sse")
+    concurrency: int = Field(
+        default=config.BATCH_CONCURRENCY, ge=1, le=config.BATCH_MAX_CONCURRENCY, description="全局并发数"
+    )
+    per_platform_concurrency: int = Field(
+        default=config.BATCH_PER_PLATFORM_CONCURRENCY,
+        ge=1,
+        le=config.BATCH_MAX_PER_PLATFORM_CONCURRENCY,
+        description="单个平台的并发数",
+    )
+    timeout: float = Field(default=config.BATCH_TIMEOUT, gt=0, description="单个链接的超时时间（秒）")
+
+
+def _error_payload(exc: BaseException) -> Dict[str, str]:
+    """将异常映射为与单条提取接口一致的错误码"""
+    if isinstance(exc, CircuitOpenError):
+        return {"code": "CIRCUIT_OPEN", "message": str(exc)}
+    if isinstance(exc, ExecutorSaturated):
+        return {"code": "OVERLOADED", "message": "服务器繁忙，请稍后重试"}
+    if isinstance(exc, (ValueError, TimeoutError)):
+        return {"code": "EXTRACTION_FAILED", "message": str(exc)}
+    return {"code": "INTERNAL_ERROR", "message": f"服务器内部错误: {str(exc)}"}
+
+
+def _dumps_with_data(payload: Dict[str, Any], news_item: Optional[NewsItem] = None) -> bytes:
+    """
+    序列化 payload；news_item 直接由 Pydantic 序列化为 JSON 后拼接为 data 字段，
+    不再经过 model_dump -> dict -> json.dumps 的中间拷贝
+    """
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    if news_item is None:
+        return data
+    return b"".join((data[:-1], b', "data": ', dump_news_item_json(news_item), b"}"))
+
+
+async def _batch_item_payload(result: BatchResult, include_markdown: bool) -> Dict[str, Any]:
+    """构造单条批量结果（成功时 news_item 由 _encode_event 写入 data 字段）"""
+    payload: Dict[str, Any] = {
+        "type": "result",
+        "index": result.index,
+        "url": result.url,
+        "platform": result.platform,
+        "elapsed_ms": result.elapsed_ms,
+    }
+    if result.ok:
+        payload["status"] = "success"
+        payload["extracted_at"] = datetime.now().isoformat()
+        if include_markdown:
+            try:
+                payload["markdown"] = await ato_markdown(result.news_item)
+            except ExecutorSaturated:
+                # 文章已经提取成功，线程池繁忙时直接生成，不丢弃结果
+                payload["markdown"] = to_markdown(result.news_item)
+    else:
+        payload["status"] = "error"
+        payload["error"] = _error_payload(result.error)
+    return payload
+
+
+def _encode_event(
+    payload: Dict[str, Any], stream_format: str, news_item: Optional[NewsItem] = None
+) -> bytes:
+    """按流格式编码一条事件"""
+    data = _dumps_with_data(payload, news_item)
+    if stream_format == "sse":
+        return b"".join((f"event: {payload['type']}\ndata: ".encode("utf-8"), data, b"\n\n"))
+    return data + b"\n"
+
+
 @router.post("/extract", response_model=ExtractResponse)
 async def extract_news(request: ExtractRequest):
     """提取新闻内容"""
     try:
         # 提取新闻
-        news_item, platform = ExtractorService.extract_news(
+        news_item, platform = await ExtractorService.aextract_news(
             url=request.url,
             platform=request.platform
         )
 
-        # 准备响应数据
+        # 准备响应数据（结构与 ExtractResponse 一致，直接返回序列化好的 JSON）
         response_data = {
             "status": "success",
-            "data": news_item.to_dict(),
             "platform": platform,
             "extracted_at": datetime.now().isoformat(),
             # 总是生成 markdown，方便前端切换格式
-            "markdown": to_markdown(news_item)
+            "markdown": await ato_markdown(news_item)
         }
 
-        return response_data
+        return Response(
+            content=_dumps_with_data(response_data, news_item),
+            media_type="application/json",
+        )
 
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={"status": "error", "error": _error_payload(e)},
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_in)))},
+        )
+    except ExecutorSaturated as e:
+        raise HTTPException(
+            status_code=503,
+            detail={"status": "error", "error": _error_payload(e)},
+            headers={"Retry-After": "1"},
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail={
             "status": "error",
-            "error": {
-                "code": "EXTRACTION_FAILED",
-                "message": str(e)
-            }
+            "error": _error_payload(e)
         })
     except Exception as e:
         raise HTTPException(status_code=500, detail={
             "status": "error",
-            "error": {
-                "code": "INTERNAL_ERROR",
-                "message": f"服务器内部错误: {str(e)}"
-            }
+            "error": _error_payload(e)
         })
 
 
+@router.post("/extract/batch")
+async def extract_news_batch(request: BatchExtractRequest):
+    """
+    批量提取新闻，按完成顺序流式返回结果
+
+    每条结果在对应 URL 完成后立即推送（NDJSON 每行一条，或 SSE 事件），
+    最后推送一条 type 为 summary 的汇总。
+    """
+    extractor = BatchExtractor(
+        concurrency=request.concurrency,
+        per_platform_concurrency=request.per_platform_concurrency,
+        timeout=request.timeout,
+    )
+    include_markdown = request.output_format == "markdown"
+
+    async def stream() -> AsyncIterator[bytes]:
+        started = time.perf_counter()
+        successful = 0
+        async for result in extractor.iter_completed(request.urls):
+            successful += result.ok
+            yield _encode_event(
+                await _batch_item_payload(result, include_markdown),
+                request.stream_format,
+                result.news_item if result.ok else None,
+            )
+        summary = {
+            "type": "summary",
+            "status": "success",
+            "total": len(request.urls),
+            "successful": successful,
+            "failed": len(request.urls) - successful,
+            "elapsed_ms": int((time.perf_counter() - started) * 1000),
+        }
+        yield _encode_event(summary, request.stream_format)
+
+    media_type = "text/event-stream" if request.stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/platforms")
 async def list_platforms():
     """获取支持的平台列表"""
@@ -78,10 +219,20 @@ async def list_platforms():
     }
 
 
+@router.get("/stats")
+async def stats():
+    """运行时统计信息（HTTP 缓存命中率等）"""
+    return {
+        "status": "success",
+        "stats": {**ExtractorService.stats(), "image_proxy": proxy.stats()},
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 @router.get("/health")
 async def health_check():
-    """健康检查"""
+    """健康检查（有平台熔断时 status 为 degraded，服务本身仍可用）"""
     return {
-        "status": "healthy",
+        **ExtractorService.health(),
         "timestamp": datetime.now().isoformat()
     }
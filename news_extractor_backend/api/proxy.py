@@ -1,55 +1,453 @@
 # -*- coding: utf-8 -*-
 """
 图片代理 API - 解决微信公众号图片防盗链问题
+
+所有图片请求共享一个带连接池的 httpx.AsyncClient（每个事件循环一个），响应体按块异步转发，
+不会阻塞事件循环。每个上游 host 有独立的并发上限，单张图片有总耗时预算（排队 + 等待响应头
++ 传输），某个 CDN 变慢时只会让该 host 的请求排队或超时，不会拖垮整个 API。
+
+启用磁盘缓存（IMAGE_CACHE_ENABLED）时，首次请求边转发边写入缓存，之后的请求直接由本地文件
+响应：支持 If-None-Match（304）和单段 Range（206），不再访问上游。
+
+带 w / h / q / format 参数时返回缩放或转码后的图片（需要 Pillow），转换在进程池中执行，
+转换结果作为独立的变体写入同一个缓存。
 """
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import StreamingResponse
-import requests
-from typing import Optional
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, BinaryIO, Dict, Literal, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+from news_crawler.core import AsyncSessionPool, PoolConfig
+from news_extractor_core import config
+from .. import image_transform
+from ..image_cache import CachedImage, ImageCache, ImageCacheWriter
+from ..image_transform import DEFAULT_QUALITY, MAX_DIMENSION, ImageTransformer, ImageTransformError, TransformSpec
 
 router = APIRouter()
 
+# 伪装成微信公众号平台的请求
+PROXY_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Referer': 'https://mp.weixin.qq.com/',
+    'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
+    'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+}
+
+# 原样转发给客户端的上游响应头
+PASSTHROUGH_HEADERS = ("content-length", "content-encoding", "etag", "last-modified")
+
+CHUNK_SIZE = 64 * 1024
+
+# 图片磁盘缓存：由 startup() 在应用启动时创建（导入模块不会在磁盘上创建任何文件），
+# IMAGE_CACHE_ENABLED=false 时只转发不缓存
+IMAGE_CACHE: Optional[ImageCache] = None
+
+
+def _create_client(_: PoolConfig) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers=PROXY_HEADERS,
+        follow_redirects=True,
+        timeout=httpx.Timeout(
+            config.IMAGE_PROXY_READ_TIMEOUT,
+            connect=config.IMAGE_PROXY_CONNECT_TIMEOUT,
+        ),
+        limits=httpx.Limits(
+            max_connections=config.IMAGE_PROXY_MAX_CONNECTIONS,
+            max_keepalive_connections=config.IMAGE_PROXY_MAX_CONNECTIONS,
+        ),
+    )
+
+
+# 图片代理专用的客户端池（与爬虫的连接池分开，避免大图传输占满抓取连接）
+CLIENTS = AsyncSessionPool(_create_client)
+
+# 缩放 / 转码进程池（首次使用时才启动）
+TRANSFORMER = ImageTransformer(config.IMAGE_TRANSFORM_WORKERS or None)
+
+
+class _HostLimiter:
+    """单个上游 host 的并发上限及统计"""
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        # 持有该 limiter 的请求数（包括仍在排队等待名额的），为 0 时才可以淘汰
+        self.users = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.timeouts = 0
+        self.errors = 0
+
+
+# 最多跟踪的上游 host 数量，超出时按 LRU 淘汰空闲的 host（其统计一并丢弃）
+MAX_TRACKED_HOSTS = 1024
+
+_limiters: "OrderedDict[str, _HostLimiter]" = OrderedDict()
+
+
+def _limiter(host: str) -> _HostLimiter:
+    limiter = _limiters.get(host)
+    if limiter is not None:
+        _limiters.move_to_end(host)
+        return limiter
+    if len(_limiters) >= MAX_TRACKED_HOSTS:
+        idle = [name for name, item in _limiters.items() if item.users == 0]
+        for name in idle[: len(_limiters) - MAX_TRACKED_HOSTS + 1]:
+            del _limiters[name]
+    limiter = _limiters[host] = _HostLimiter(config.IMAGE_PROXY_PER_HOST_CONCURRENCY)
+    return limiter
+
+
+class _Upstream:
+    """一次进行中的上游请求：持有并发名额和响应，aclose() 可重复调用"""
+
+    def __init__(self, limiter: _HostLimiter, deadline: float):
+        self.limiter = limiter
+        limiter.users += 1
+        self.deadline = deadline
+        self.writer: Optional[ImageCacheWriter] = None
+        self.response: Optional[httpx.Response] = None
+        self.acquired = False
+        self.closed = False
+
+    async def open(self, url: str) -> httpx.Response:
+        await asyncio.wait_for(self.limiter.semaphore.acquire(), self.deadline - time.monotonic())
+        self.acquired = True
+        self.limiter.in_flight += 1
+        self.limiter.requests += 1
+        client = CLIENTS.get()
+        request = client.build_request("GET", url)
+        self.response = await asyncio.wait_for(
+            client.send(request, stream=True), self.deadline - time.monotonic()
+        )
+        return self.response
+
+    async def body(self) -> AsyncIterator[bytes]:
+        """
+        原样转发响应体（不解压，Content-Encoding 一并透传）；超过总耗时预算时中断传输。
+        设置了 writer 时同时写入缓存，完整传输后才提交
+        """
+        completed = False
+        try:
+            async for chunk in self.response.aiter_raw(CHUNK_SIZE):
+                if self.writer is not None and not self.writer.write(chunk):
+                    self.writer = None
+                yield chunk
+                if time.monotonic() > self.deadline:
+                    self.limiter.timeouts += 1
+                    break
+            else:
+                completed = True
+            expected = self.response.headers.get("content-length")
+            if completed and self.writer is not None and (expected is None or int(expected) == self.writer.size):
+                await asyncio.to_thread(self.writer.commit)
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if self.writer is not None:
+            # 未提交的缓存写入（传输中断、客户端断开）直接丢弃
+            self.writer.abort()
+        try:
+            if self.response is not None:
+                await self.response.aclose()
+        finally:
+            if self.acquired:
+                self.limiter.in_flight -= 1
+                self.limiter.semaphore.release()
+            self.limiter.users -= 1
+
+
+def startup() -> None:
+    """打开图片磁盘缓存（IMAGE_CACHE_ENABLED=true 时），在应用 lifespan 中调用"""
+    global IMAGE_CACHE
+    if config.IMAGE_CACHE_ENABLED and IMAGE_CACHE is None:
+        IMAGE_CACHE = ImageCache(
+            config.IMAGE_CACHE_DIR,
+            max_bytes=config.IMAGE_CACHE_MAX_BYTES,
+            max_object_bytes=config.IMAGE_CACHE_MAX_OBJECT_BYTES,
+        )
+
+
+async def aclose_clients() -> None:
+    """关闭当前事件循环上的图片代理客户端、转码进程池以及磁盘缓存"""
+    global IMAGE_CACHE
+    await CLIENTS.aclose()
+    TRANSFORMER.shutdown()
+    if IMAGE_CACHE is not None:
+        IMAGE_CACHE.close()
+        IMAGE_CACHE = None
+
+
+def stats() -> Dict[str, Any]:
+    """各上游 host 的并发与错误统计，以及磁盘缓存统计"""
+    return {
+        "hosts": {
+            host: {
+                "in_flight": limiter.in_flight,
+                "requests": limiter.requests,
+                "timeouts": limiter.timeouts,
+                "errors": limiter.errors,
+            }
+            for host, limiter in _limiters.items()
+        },
+        "cache": IMAGE_CACHE.stats() if IMAGE_CACHE is not None else None,
+        "transform": TRANSFORMER.stats(),
+    }
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 是否命中（弱比较）"""
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def _parse_range(value: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    解析单段 Range 头，返回闭区间 (start, end)
+
+    Returns:
+        None 表示忽略 Range（格式不支持或多段），按完整内容返回
+
+    Raises:
+        ValueError: 范围无法满足（416）
+    """
+    unit, _, spec = value.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_text, sep, end_text = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+        else:
+            # 后缀范围：最后 N 个字节
+            start = size - int(end_text)
+            end = size - 1
+    except ValueError:
+        return None
+    start = max(0, start)
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        raise ValueError(value)
+    return start, end
+
+
+async def _read_range(f: BinaryIO, start: int, end: int) -> AsyncIterator[bytes]:
+    with f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await asyncio.to_thread(f.read, min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _serve_cached(request: Request, image: CachedImage) -> Optional[Response]:
+    """
+    由缓存文件响应：304 / 206 / 416，或整个文件
+
+    文件在查到缓存后可能已被其他请求或进程淘汰，此时返回 None，由调用方按未命中处理。
+    文件在构造响应前打开，之后即使被淘汰（unlink）也能完整发送。
+    """
+    headers = {
+        'Cache-Control': 'public, max-age=86400',
+        'Access-Control-Allow-Origin': '*',
+        'ETag': image.etag,
+        'Accept-Ranges': 'bytes',
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, image.etag):
+        return Response(status_code=304, headers=headers)
+
+    start, end, status_code = 0, image.size - 1, 200
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() == image.etag):
+        try:
+            byte_range = _parse_range(range_header, image.size)
+        except ValueError:
+            headers['Content-Range'] = f"bytes */{image.size}"
+            return Response(status_code=416, headers=headers)
+        if byte_range is not None:
+            start, end = byte_range
+            status_code = 206
+            headers['Content-Range'] = f"bytes {start}-{end}/{image.size}"
+
+    try:
+        f = open(image.path, "rb")
+    except FileNotFoundError:
+        return None
+    headers['Content-Length'] = str(end - start + 1)
+    # 客户端提前断开时生成器可能不会被执行到 finally，由后台任务兜底关闭文件
+    return StreamingResponse(
+        _read_range(f, start, end),
+        status_code=status_code,
+        media_type=image.content_type,
+        headers=headers,
+        background=BackgroundTask(f.close),
+    )
+
+
+async def _open_upstream(url: str, host: str) -> Tuple[_Upstream, httpx.Response]:
+    """在该 host 的并发名额内发起上游请求，失败时转换为对应的 HTTP 错误"""
+    limiter = _limiter(host)
+    upstream = _Upstream(limiter, time.monotonic() + config.IMAGE_PROXY_TIMEOUT)
+    try:
+        response = await upstream.open(url)
+    except (asyncio.TimeoutError, httpx.TimeoutException):
+        limiter.timeouts += 1
+        await upstream.aclose()
+        raise HTTPException(status_code=504, detail="请求图片超时")
+    except httpx.HTTPError as e:
+        limiter.errors += 1
+        await upstream.aclose()
+        raise HTTPException(status_code=502, detail=f"请求图片失败: {str(e)}")
+    except BaseException:
+        await upstream.aclose()
+        raise
+
+    if response.status_code != 200:
+        limiter.errors += 1
+        await upstream.aclose()
+        raise HTTPException(status_code=404, detail="图片获取失败")
+
+    if IMAGE_CACHE is not None and 'content-encoding' not in response.headers:
+        upstream.writer = IMAGE_CACHE.writer(url, response.headers.get('content-type', 'image/jpeg'))
+    return upstream, response
+
+
+async def _load_original(url: str, host: str) -> bytes:
+    """读取完整原图：优先读缓存，否则下载（同时写入缓存）"""
+    if IMAGE_CACHE is not None:
+        cached = await asyncio.to_thread(IMAGE_CACHE.get, url)
+        if cached is not None:
+            return await asyncio.to_thread(cached.path.read_bytes)
+    upstream, response = await _open_upstream(url, host)
+    # 原图需要整体读入内存再交给转换进程，超过 IMAGE_CACHE_MAX_OBJECT_MB 的直接拒绝
+    limit = config.IMAGE_CACHE_MAX_OBJECT_BYTES
+    expected = response.headers.get("content-length")
+    if expected is not None and int(expected) > limit:
+        await upstream.aclose()
+        raise HTTPException(status_code=413, detail="图片过大，无法转换")
+    chunks = []
+    size = 0
+    body = upstream.body()
+    try:
+        async for chunk in body:
+            size += len(chunk)
+            if size > limit:
+                raise HTTPException(status_code=413, detail="图片过大，无法转换")
+            chunks.append(chunk)
+    finally:
+        await body.aclose()
+    data = b"".join(chunks)
+    if expected is not None and int(expected) != len(data):
+        raise HTTPException(status_code=504, detail="请求图片超时")
+    return data
+
+
+async def _transformed_image(request: Request, url: str, host: str, spec: TransformSpec) -> Response:
+    """返回缩放 / 转码后的图片，变体与原图一样写入缓存"""
+    if not image_transform.available():
+        raise HTTPException(status_code=501, detail="服务器未安装 Pillow，不支持图片缩放和格式转换")
+    if spec.format is not None and not image_transform.supports_format(spec.format):
+        raise HTTPException(status_code=400, detail=f"服务器不支持输出 {spec.format} 格式")
+
+    key = url + spec.cache_suffix()
+    if IMAGE_CACHE is not None:
+        cached = await asyncio.to_thread(IMAGE_CACHE.get, key)
+        served = _serve_cached(request, cached) if cached is not None else None
+        if served is not None:
+            return served
+
+    original = await _load_original(url, host)
+    try:
+        data, content_type = await TRANSFORMER.atransform(original, spec)
+    except ImageTransformError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+
+    def store() -> Optional[CachedImage]:
+        writer = IMAGE_CACHE.writer(key, content_type)
+        if not writer.write(data):
+            return None
+        return writer.commit()
+
+    cached = await asyncio.to_thread(store) if IMAGE_CACHE is not None else None
+    served = _serve_cached(request, cached) if cached is not None else None
+    if served is None:
+        return Response(
+            data,
+            media_type=content_type,
+            headers={'Cache-Control': 'public, max-age=86400', 'Access-Control-Allow-Origin': '*'},
+        )
+    return served
+
 
 @router.get("/image")
-async def proxy_image(url: str = Query(..., description="图片URL")):
+async def proxy_image(
+    request: Request,
+    url: str = Query(..., description="图片URL"),
+    w: Optional[int] = Query(default=None, ge=1, le=MAX_DIMENSION, description="最大宽度（按比例缩放，不放大）"),
+    h: Optional[int] = Query(default=None, ge=1, le=MAX_DIMENSION, description="最大高度（按比例缩放，不放大）"),
+    q: Optional[int] = Query(default=None, ge=1, le=100, description=f"编码质量，默认 {DEFAULT_QUALITY}"),
+    format: Optional[Literal["webp", "avif", "jpeg"]] = Query(default=None, description="输出格式"),
+):
     """
     代理获取图片，解决防盗链问题
 
     Args:
         url: 图片的原始URL
+        w / h: 缩放到的最大宽高（可选）
+        q: 编码质量（可选）
+        format: 输出格式 webp / avif / jpeg（可选）
 
     Returns:
-        图片的二进制流
+        图片的二进制流；带缩放或格式参数时返回转换后的图片
     """
-    try:
-        # 设置请求头，伪装成微信公众号平台的请求
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Referer': 'https://mp.weixin.qq.com/',
-            'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-            'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-        }
-
-        # 请求图片
-        response = requests.get(url, headers=headers, timeout=10, stream=True)
-
-        if response.status_code != 200:
-            raise HTTPException(status_code=404, detail="图片获取失败")
-
-        # 获取内容类型
-        content_type = response.headers.get('content-type', 'image/jpeg')
-
-        # 返回图片流
-        return StreamingResponse(
-            response.iter_content(chunk_size=8192),
-            media_type=content_type,
-            headers={
-                'Cache-Control': 'public, max-age=86400',  # 缓存1天
-                'Access-Control-Allow-Origin': '*',
-            }
-        )
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise HTTPException(status_code=400, detail="无效的图片URL")
+    host = parts.hostname.lower()
+
+    if any(value is not None for value in (w, h, q, format)):
+        spec = TransformSpec(width=w, height=h, quality=q or DEFAULT_QUALITY, format=format)
+        return await _transformed_image(request, url, host, spec)
+
+    if IMAGE_CACHE is not None:
+        cached = await asyncio.to_thread(IMAGE_CACHE.get, url)
+        served = _serve_cached(request, cached) if cached is not None else None
+        if served is not None:
+            return served
+
+    upstream, response = await _open_upstream(url, host)
+
+    headers = {
+        'Cache-Control': 'public, max-age=86400',  # 缓存1天
+        'Access-Control-Allow-Origin': '*',
+    }
+    for name in PASSTHROUGH_HEADERS:
+        if name in response.headers:
+            headers[name] = response.headers[name]
 
-    except requests.RequestException as e:
-        raise HTTPException(status_code=500, detail=f"请求图片失败: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"代理图片失败: {str(e)}")
+    # 客户端提前断开时生成器可能不会被执行到 finally，由后台任务兜底释放连接和并发名额
+    return StreamingResponse(
+        upstream.body(),
+        media_type=response.headers.get('content-type', 'image/jpeg'),
+        headers=headers,
+        background=BackgroundTask(upstream.aclose),
+    )
@@ -2,6 +2,9 @@
 """Command-line helpers for running the News Extractor backend."""
 from __future__ import annotations
 
+import os
+from typing import Optional
+
 import click
 import uvicorn
 
@@ -10,14 +13,53 @@ import uvicorn
 @click.option("--host", default="0.0.0.0", show_default=True, help="Host binding for the API server")
 @click.option("--port", default=8000, show_default=True, help="Port for the API server")
 @click.option("--reload/--no-reload", default=False, help="Enable auto-reload (development only)")
-def main(host: str, port: int, reload: bool) -> None:
+@click.option("--workers", default=1, show_default=True, type=click.IntRange(min=1), help="Number of uvicorn worker processes")
+@click.option(
+    "--executor-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Threads per worker for parsing and markdown rendering [default: EXTRACT_WORKERS or min(32, CPUs + 4)]",
+)
+@click.option(
+    "--executor-queue",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Tasks allowed to wait for a parse thread before requests get 503 [default: EXTRACT_QUEUE_LIMIT or 64]",
+)
+@click.option(
+    "--parse-processes",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Warm worker processes per uvicorn worker for HTML parsing, 0 to parse in threads [default: PARSE_PROCESSES or 0]",
+)
+def main(
+    host: str,
+    port: int,
+    reload: bool,
+    workers: int,
+    executor_workers: Optional[int],
+    executor_queue: Optional[int],
+    parse_processes: Optional[int],
+) -> None:
     """Start the FastAPI backend."""
 
+    if reload and workers > 1:
+        raise click.UsageError("--reload cannot be combined with --workers > 1")
+
+    # Worker processes read their settings from the environment at import time.
+    if executor_workers is not None:
+        os.environ["EXTRACT_WORKERS"] = str(executor_workers)
+    if executor_queue is not None:
+        os.environ["EXTRACT_QUEUE_LIMIT"] = str(executor_queue)
+    if parse_processes is not None:
+        os.environ["PARSE_PROCESSES"] = str(parse_processes)
+
     uvicorn.run(
         "news_extractor_backend.main:app",
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
         log_level="info",
     )
 
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+图片磁盘缓存
+
+- 图片内容按 SHA-256 存放在 <目录>/<前两位>/<摘要>，相同内容只存一份
+- SQLite 索引（WAL）记录 缓存键 -> 摘要、内容类型，以及每个文件的大小和最近访问时间
+- 总大小超过预算时按最近访问时间淘汰（LRU），淘汰到预算的 90%；
+  多个 worker 共用同一目录，总大小每次写入后都从索引重新统计
+- 摘要同时作为强 ETag，便于客户端条件请求
+
+写入时一边转发一边落盘到临时文件，完整下载后才重命名并登记到索引，中途中断不会留下半个文件。
+"""
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_accessed ON blobs (accessed);
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+"""
+
+# 访问时间的更新间隔：热门图片不必每次命中都写一次索引
+_TOUCH_INTERVAL = 60.0
+
+
+@dataclass(frozen=True)
+class CachedImage:
+    """一条缓存命中"""
+    path: Path
+    digest: str
+    content_type: str
+    size: int
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+
+class ImageCacheWriter:
+    """边下载边写入临时文件，commit() 后才对其他请求可见"""
+
+    def __init__(self, cache: "ImageCache", key: str, content_type: str):
+        self.cache = cache
+        self.key = key
+        self.content_type = content_type
+        self.size = 0
+        self._hash = hashlib.sha256()
+        fd, name = tempfile.mkstemp(dir=cache.tmp_dir)
+        self._file = os.fdopen(fd, "wb")
+        self._tmp_path = Path(name)
+        self._done = False
+
+    def write(self, chunk: bytes) -> bool:
+        """写入一块数据；超过单个文件上限时放弃缓存并返回 False"""
+        if self._done:
+            return False
+        self.size += len(chunk)
+        if self.size > self.cache.max_object_bytes:
+            self.abort()
+            return False
+        self._hash.update(chunk)
+        self._file.write(chunk)
+        return True
+
+    def commit(self) -> Optional[CachedImage]:
+        if self._done:
+            return None
+        self._done = True
+        self._file.close()
+        return self.cache._commit(self.key, self.content_type, self._hash.hexdigest(), self.size, self._tmp_path)
+
+    def abort(self) -> None:
+        if self._done:
+            return
+        self._done = True
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+class ImageCache:
+    """
+    内容寻址的图片磁盘缓存
+
+    Args:
+        directory: 缓存目录
+        max_bytes: 缓存总大小上限
+        max_object_bytes: 单个文件的大小上限，超过的图片只转发不缓存
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = 1024 * 1024 * 1024,
+        max_object_bytes: int = 32 * 1024 * 1024,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_object_bytes = max_object_bytes
+        self.tmp_dir = self.directory / "tmp"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_tmp()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.directory / "index.sqlite3", check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._refresh_total()
+        # 统计
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _remove_stale_tmp(self) -> None:
+        """删除异常退出遗留的临时文件（其他 worker 可能正在写入，只删除一小时前的）"""
+        cutoff = time.time() - 3600
+        for path in self.tmp_dir.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.directory / digest[:2] / digest
+
+    def get(self, key: str) -> Optional[CachedImage]:
+        """查找缓存；文件已被外部删除时清理索引并视为未命中"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT e.digest, e.content_type, b.size, b.accessed FROM entries e "
+                "JOIN blobs b ON b.digest = e.digest WHERE e.key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            digest, content_type, size, accessed = row
+            path = self._blob_path(digest)
+            if not path.exists():
+                self._drop_blob(digest, size)
+                self.misses += 1
+                return None
+            now = time.time()
+            if now - accessed > _TOUCH_INTERVAL:
+                self._db.execute("UPDATE blobs SET accessed = ? WHERE digest = ?", (now, digest))
+            self.hits += 1
+        return CachedImage(path, digest, content_type, size)
+
+    def writer(self, key: str, content_type: str) -> ImageCacheWriter:
+        """开始写入一条缓存"""
+        return ImageCacheWriter(self, key, content_type)
+
+    def _commit(self, key: str, content_type: str, digest: str, size: int, tmp_path: Path) -> CachedImage:
+        path = self._blob_path(digest)
+        now = time.time()
+        with self._lock:
+            exists = self._db.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if exists and path.exists():
+                # 相同内容已存在（例如同一张图片的不同 URL），只登记新的键
+                tmp_path.unlink(missing_ok=True)
+                self._db.execute("UPDATE blobs SET accessed = ? WHERE digest = ?", (now, digest))
+            else:
+                path.parent.mkdir(exist_ok=True)
+                os.replace(tmp_path, path)
+                if not exists:
+                    self._total += size
+                self._db.execute(
+                    "INSERT OR REPLACE INTO blobs (digest, size, accessed) VALUES (?, ?, ?)",
+                    (digest, size, now),
+                )
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, digest, content_type, created) VALUES (?, ?, ?, ?)",
+                (key, digest, content_type, now),
+            )
+            self.stores += 1
+            self._refresh_total()
+            if self._total > self.max_bytes:
+                self._evict(int(self.max_bytes * 0.9), keep=digest)
+        return CachedImage(path, digest, content_type, size)
+
+    def _refresh_total(self) -> None:
+        """从索引重新统计总大小：其他进程的写入和淘汰不会反映在本进程的计数里"""
+        self._total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def _drop_blob(self, digest: str, size: int) -> None:
+        self._db.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+        self._db.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        self._total -= size
+        self._blob_path(digest).unlink(missing_ok=True)
+
+    def _evict(self, target: int, keep: Optional[str] = None) -> None:
+        """按最近访问时间淘汰，直到总大小不超过 target（调用方持有锁）"""
+        rows = self._db.execute("SELECT digest, size FROM blobs ORDER BY accessed").fetchall()
+        self._db.execute("BEGIN")
+        try:
+            for digest, size in rows:
+                if self._total <= target:
+                    break
+                if digest == keep:
+                    continue
+                self._drop_blob(digest, size)
+                self.evictions += 1
+        finally:
+            self._db.execute("COMMIT")
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._evict(-1)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh_total()
+            entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            blobs = self._db.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "files": blobs,
+            "bytes": self._total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
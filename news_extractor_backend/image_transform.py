@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+图片缩放与格式转换
+
+解码、缩放和编码都是 CPU 密集操作，在独立的进程池中执行，不占用事件循环，也不受 GIL 限制。
+Pillow 是可选依赖（pip install "news-extractor-backend[image]"），未安装时只有带转换参数的
+请求不可用，原图代理不受影响。
+"""
+import asyncio
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# 输出格式 -> (Pillow 格式名, Content-Type)
+FORMATS = {
+    "jpeg": ("JPEG", "image/jpeg"),
+    "webp": ("WEBP", "image/webp"),
+    "avif": ("AVIF", "image/avif"),
+}
+
+DEFAULT_QUALITY = 80
+MAX_DIMENSION = 4096
+# 解码前检查的像素上限（约 8K x 6K），防止解压炸弹耗尽工作进程的内存
+MAX_PIXELS = 50_000_000
+
+
+class ImageTransformError(ValueError):
+    """无法解码或编码图片"""
+
+
+@dataclass(frozen=True)
+class TransformSpec:
+    """缩放参数：按比例缩放到 width x height 以内（不放大），再按 format / quality 编码"""
+    width: Optional[int] = None
+    height: Optional[int] = None
+    quality: int = DEFAULT_QUALITY
+    format: Optional[str] = None
+
+    @property
+    def is_identity(self) -> bool:
+        return self.width is None and self.height is None and self.format is None
+
+    def cache_suffix(self) -> str:
+        """变体在图片缓存中的键后缀"""
+        return f"#w={self.width or ''}&h={self.height or ''}&q={self.quality}&f={self.format or ''}"
+
+
+def _require_pillow():
+    try:
+        from PIL import Image
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("Pillow is required for image resizing") from exc
+    return Image
+
+
+def available() -> bool:
+    """是否安装了 Pillow"""
+    try:
+        _require_pillow()
+    except RuntimeError:
+        return False
+    return True
+
+
+def supports_format(name: str) -> bool:
+    """当前 Pillow 是否能编码该格式（avif 需要 Pillow 11.2+ 或 pillow-avif-plugin）"""
+    Image = _require_pillow()
+    pil_format = FORMATS[name][0]
+    if pil_format not in Image.SAVE:
+        Image.init()
+    if pil_format == "AVIF" and pil_format not in Image.SAVE:
+        try:
+            import pillow_avif  # noqa: F401
+        except ImportError:
+            return False
+    return pil_format in Image.SAVE
+
+
+def transform_image(data: bytes, spec: TransformSpec) -> Tuple[bytes, str]:
+    """
+    在工作进程中执行：解码、缩放、编码
+
+    Returns:
+        (图片字节, Content-Type)
+    """
+    Image = _require_pillow()
+    # 不依赖 Pillow 的默认值：超过 MAX_PIXELS 的图片在 open() 时即被拒绝
+    Image.MAX_IMAGE_PIXELS = MAX_PIXELS
+    try:
+        image = Image.open(io.BytesIO(data))
+        if image.width * image.height > MAX_PIXELS:
+            raise ImageTransformError(f"图片尺寸过大: {image.width}x{image.height}")
+        box = (spec.width or MAX_DIMENSION, spec.height or MAX_DIMENSION)
+        # JPEG 可以直接以缩小的尺寸解码，省掉大部分解码开销
+        image.draft("RGB", box)
+        image.load()
+    except ImageTransformError:
+        raise
+    except Image.DecompressionBombError:
+        raise ImageTransformError("图片尺寸过大") from None
+    except Exception:
+        raise ImageTransformError("无法解码图片") from None
+
+    if spec.width or spec.height:
+        image.thumbnail(box, Image.Resampling.LANCZOS)
+
+    # 未指定格式时：原图有透明通道输出 webp，否则输出 jpeg
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+    name = spec.format or ("webp" if has_alpha else "jpeg")
+    pil_format, content_type = FORMATS[name]
+    if pil_format == "JPEG":
+        if has_alpha:
+            # JPEG 不支持透明通道，铺白底
+            rgba = image.convert("RGBA")
+            image = Image.new("RGB", rgba.size, (255, 255, 255))
+            image.paste(rgba, mask=rgba.getchannel("A"))
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+    elif image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    output = io.BytesIO()
+    options = {"quality": spec.quality}
+    if pil_format == "JPEG":
+        options.update(optimize=True, progressive=True)
+    try:
+        image.save(output, pil_format, **options)
+    except Exception as exc:
+        raise ImageTransformError(f"无法编码为 {name}: {exc}") from None
+    return output.getvalue(), content_type
+
+
+class ImageTransformer:
+    """
+    延迟创建的进程池
+
+    Args:
+        workers: 工作进程数
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # 统计
+        self.transforms = 0
+        self.failures = 0
+        self.restarts = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # 服务进程里有事件循环和线程池，用 spawn 避免 fork 带来的锁状态问题
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """丢弃已损坏的进程池（工作进程被杀死、OOM 等），下次调用时重新创建"""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self.restarts += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def atransform(self, data: bytes, spec: TransformSpec) -> Tuple[bytes, str]:
+        """在进程池中转换图片；进程池损坏时重建并重试一次"""
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self._get_executor()
+            try:
+                result = await loop.run_in_executor(executor, transform_image, data, spec)
+            except BrokenProcessPool:
+                self._discard(executor)
+                if attempt == 0:
+                    continue
+                self.failures += 1
+                raise ImageTransformError("图片转换进程异常退出") from None
+            except Exception:
+                self.failures += 1
+                raise
+            self.transforms += 1
+            return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "started": self._executor is not None,
+            "transforms": self.transforms,
+            "failures": self.failures,
+            "restarts": self.restarts,
+        }
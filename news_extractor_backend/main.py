@@ -2,15 +2,33 @@
 """
 FastAPI 主应用
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from news_extractor_core.services import ExtractorService
 from .api import extract, proxy
+from .timing import ServerTimingMiddleware
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """应用生命周期：启动时初始化连接池和图片缓存，关闭时释放"""
+    ExtractorService.startup()
+    proxy.startup()
+    try:
+        yield
+    finally:
+        await proxy.aclose_clients()
+        await ExtractorService.ashutdown()
+
 
 # 创建 FastAPI 应用
 app = FastAPI(
     title="News Extractor API",
     description="新闻提取器后端 API",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
 # 配置 CORS
@@ -20,8 +38,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 允许前端读取 Server-Timing
+    expose_headers=["Server-Timing"],
 )
 
+# 每个响应附带 Server-Timing（总耗时、解析线程池排队和执行耗时）
+app.add_middleware(ServerTimingMiddleware)
+
 # 注册路由
 app.include_router(extract.router, prefix="/api", tags=["extract"])
 app.include_router(proxy.router, prefix="/api/proxy", tags=["proxy"])
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+请求耗时中间件
+
+为每个 HTTP 响应添加 Server-Timing 头：
+- total: 从收到请求到开始发送响应的耗时
+- queue: 在解析线程池中排队的耗时
+- parse: 在解析线程池中执行（解析、Markdown 生成）的耗时
+
+浏览器开发者工具的 Timing 面板可以直接展示这些值。
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from news_crawler.core import start_timing
+
+
+class ServerTimingMiddleware:
+    """纯 ASGI 中间件，不会像 BaseHTTPMiddleware 那样缓冲流式响应"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        timing = start_timing()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - started) * 1000
+                value = (
+                    f"total;dur={total_ms:.1f}, "
+                    f"queue;dur={timing.queued * 1000:.1f}, "
+                    f"parse;dur={timing.running * 1000:.1f}"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", value.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
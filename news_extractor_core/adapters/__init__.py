@@ -1,21 +1,34 @@
 # -*- coding: utf-8 -*-
 """
 爬虫适配器模块
+
+各平台适配器按需导入：`from news_extractor_core.adapters import WeChatAdapter`
+仍然可用，但只有真正访问时才会加载对应的爬虫模块。
 """
+import importlib
+from typing import Any
+
 from .base import CrawlerAdapter
-from .wechat import WeChatAdapter
-from .toutiao import ToutiaoAdapter
-from .netease import NeteaseAdapter
-from .sohu import SohuAdapter
-from .tencent import TencentAdapter
-from .detik import DetikAdapter
-from .lenny import LennyAdapter
-from .naver import NaverAdapter
-from .quora import QuoraAdapter
-from .bbc import BBCAdapter
-from .cnn import CNNAdapter
+from .registry import ADAPTER_MANIFEST, AdapterRegistry
+
+_LAZY_ADAPTERS = {
+    spec.partition(":")[2]: spec.partition(":")[0]
+    for spec in ADAPTER_MANIFEST.values()
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
+    "ADAPTER_MANIFEST",
+    "AdapterRegistry",
     "CrawlerAdapter",
     "WeChatAdapter",
     "ToutiaoAdapter",
@@ -3,6 +3,10 @@
 爬虫适配器基类
 """
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from news_crawler.core import BaseNewsCrawler
+from ..fetching import install_fetchers
 from ..models import NewsItem
 
 
@@ -10,17 +14,62 @@ class CrawlerAdapter(ABC):
     """爬虫适配器抽象基类"""
 
     @abstractmethod
-    def extract(self, url: str) -> NewsItem:
+    def create_crawler(self, url: str) -> BaseNewsCrawler:
+        """
+        创建平台爬虫实例
+
+        Args:
+            url: 新闻链接
+
+        Returns:
+            BaseNewsCrawler: 对应平台的爬虫
+        """
+        pass
+
+    def build_crawler(self, url: str) -> BaseNewsCrawler:
+        """
+        创建爬虫实例，并按配置安装抓取策略（抓取模式与 HTTP 响应缓存）
+
+        Args:
+            url: 新闻链接
+
+        Returns:
+            BaseNewsCrawler: 对应平台的爬虫
+        """
+        return install_fetchers(self.create_crawler(url))
+
+    def extract(self, url: str, crawler: Optional[BaseNewsCrawler] = None) -> NewsItem:
         """
         提取新闻内容
 
         Args:
             url: 新闻链接
+            crawler: 已创建的爬虫实例（可选，默认通过 build_crawler 创建）
 
         Returns:
             NewsItem: 提取的新闻数据
         """
-        pass
+        crawler = crawler or self.build_crawler(url)
+
+        # 直接调用内部方法获取数据，爬虫返回的模型即统一格式
+        html = crawler.fetch_content()
+        return crawler.parse_content(html)
+
+    async def aextract(self, url: str, crawler: Optional[BaseNewsCrawler] = None) -> NewsItem:
+        """
+        异步提取新闻内容（抓取在事件循环上进行，解析在工作线程中进行）
+
+        Args:
+            url: 新闻链接
+            crawler: 已创建的爬虫实例（可选，默认通过 build_crawler 创建）
+
+        Returns:
+            NewsItem: 提取的新闻数据
+        """
+        crawler = crawler or self.build_crawler(url)
+
+        html = await crawler.afetch_content()
+        return await crawler.aparse_content(html)
 
     @property
     @abstractmethod
@@ -3,7 +3,6 @@
 CNN新闻爬虫适配器
 """
 from .base import CrawlerAdapter
-from ..models import NewsItem
 from news_crawler.cnn_news import CNNNewsCrawler, RequestHeaders
 
 
@@ -14,17 +13,6 @@ class CNNAdapter(CrawlerAdapter):
     def platform_name(self) -> str:
         return "cnn"
 
-    def extract(self, url: str) -> NewsItem:
-        """提取CNN新闻文章"""
-        # 创建爬虫实例（使用临时路径，不实际保存文件）
-        import tempfile
-        temp_dir = tempfile.mkdtemp()
-
-        crawler = CNNNewsCrawler(url, save_path=temp_dir, headers=RequestHeaders())
-
-        # 直接调用内部方法获取数据
-        html = crawler.fetch_content()
-        news_item = crawler.parse_content(html)
-
-        # 转换为统一格式
-        return NewsItem(news_item.model_dump())
+    def create_crawler(self, url: str) -> CNNNewsCrawler:
+        """创建CNN新闻爬虫实例（save_path=None，不访问文件系统）"""
+        return CNNNewsCrawler(url, save_path=None, headers=RequestHeaders())
@@ -3,7 +3,6 @@
 Quora 爬虫适配器
 """
 from .base import CrawlerAdapter
-from ..models import NewsItem
 from news_crawler.quora import QuoraAnswerCrawler, RequestHeaders
 
 
@@ -14,15 +13,6 @@ class QuoraAdapter(CrawlerAdapter):
     def platform_name(self) -> str:
         return "quora"
 
-    def extract(self, url: str) -> NewsItem:
-        """提取 Quora 回答"""
-        # 创建爬虫实例（使用临时路径，不实际保存文件）
-        import tempfile
-        temp_dir = tempfile.mkdtemp()
-
-        crawler = QuoraAnswerCrawler(url, save_path=temp_dir, headers=RequestHeaders())
-
-        html = crawler.fetch_content()
-        answer_item = crawler.parse_content(html)
-
-        return NewsItem(answer_item.to_dict())
+    def create_crawler(self, url: str) -> QuoraAnswerCrawler:
+        """创建 Quora 爬虫实例（save_path=None，不访问文件系统）"""
+        return QuoraAnswerCrawler(url, save_path=None, headers=RequestHeaders())
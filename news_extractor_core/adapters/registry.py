@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+适配器注册表 - 按需导入平台适配器
+
+内置适配器登记在 ADAPTER_MANIFEST 中（平台 -> "模块:类"，由 platforms.PLATFORMS 生成），
+第三方包可以通过 entry point 组 `news_extractor.adapters` 注册新的平台，例如在 pyproject.toml 中：
+
+    [project.entry-points."news_extractor.adapters"]
+    example = "example_package.adapter:ExampleAdapter"
+
+适配器模块（以及它依赖的爬虫、curl_cffi、parsel 等）只会在该平台第一次被使用时导入。
+"""
+import importlib
+import logging
+import threading
+from importlib.metadata import entry_points
+from typing import Dict, Iterable, List, Optional
+
+from ..platforms import PLATFORMS
+from .base import CrawlerAdapter
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "news_extractor.adapters"
+
+# 平台 -> 适配器类（由平台注册表生成）
+ADAPTER_MANIFEST: Dict[str, str] = {spec.id: spec.adapter for spec in PLATFORMS}
+
+
+def _entry_point_specs() -> Dict[str, str]:
+    """读取通过 entry point 注册的适配器"""
+    try:
+        return {ep.name: ep.value for ep in entry_points(group=ENTRY_POINT_GROUP)}
+    except Exception:
+        logger.warning("读取适配器 entry points 失败", exc_info=True)
+        return {}
+
+
+def _import_adapter(spec: str) -> CrawlerAdapter:
+    module_name, _, class_name = spec.partition(":")
+    adapter_class = getattr(importlib.import_module(module_name), class_name)
+    return adapter_class()
+
+
+class AdapterRegistry:
+    """
+    延迟加载的适配器注册表
+
+    Args:
+        enabled: 允许使用的平台（None 表示全部），用于将部署限制在部分平台
+        manifest: 平台 -> "模块:类"，默认为内置清单
+        use_entry_points: 是否合并 entry point 中注册的适配器
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[Iterable[str]] = None,
+        manifest: Optional[Dict[str, str]] = None,
+        use_entry_points: bool = True,
+    ):
+        self._manifest = dict(ADAPTER_MANIFEST if manifest is None else manifest)
+        self._enabled = set(enabled) if enabled is not None else None
+        self._use_entry_points = use_entry_points
+        self._specs: Optional[Dict[str, str]] = None
+        self._instances: Dict[str, CrawlerAdapter] = {}
+        self._lock = threading.Lock()
+
+    def _all_specs(self) -> Dict[str, str]:
+        if self._specs is None:
+            specs = dict(self._manifest)
+            if self._use_entry_points:
+                # 内置清单优先，entry point 只能新增平台
+                for name, spec in _entry_point_specs().items():
+                    specs.setdefault(name, spec)
+            if self._enabled is not None:
+                unknown = self._enabled - specs.keys()
+                if unknown:
+                    logger.warning("未知的平台将被忽略: %s", ", ".join(sorted(unknown)))
+                specs = {name: spec for name, spec in specs.items() if name in self._enabled}
+            self._specs = specs
+        return self._specs
+
+    def names(self) -> List[str]:
+        """已启用的平台名称"""
+        return list(self._all_specs())
+
+    def modules(self) -> List[str]:
+        """已启用适配器所在的模块（例如用于在解析进程中预先导入）"""
+        return list(dict.fromkeys(spec.partition(":")[0] for spec in self._all_specs().values()))
+
+    def loaded(self) -> List[str]:
+        """已经导入的平台名称"""
+        return list(self._instances)
+
+    def __contains__(self, platform: object) -> bool:
+        return platform in self._all_specs()
+
+    def get(self, platform: str) -> Optional[CrawlerAdapter]:
+        """获取平台适配器，首次使用时导入；平台不存在或未启用时返回 None"""
+        adapter = self._instances.get(platform)
+        if adapter is not None:
+            return adapter
+        spec = self._all_specs().get(platform)
+        if spec is None:
+            return None
+        with self._lock:
+            adapter = self._instances.get(platform)
+            if adapter is None:
+                adapter = self._instances[platform] = _import_adapter(spec)
+        return adapter
+
+    def preload(self) -> None:
+        """导入所有已启用的适配器（例如在 fork 多个 worker 之前预热）"""
+        for name in self.names():
+            self.get(name)
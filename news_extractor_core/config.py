@@ -5,6 +5,8 @@
 import os
 from pathlib import Path
 
+from .platforms import PLATFORMS
+
 # 项目根目录
 PROJECT_ROOT = Path(__file__).parent.parent
 
@@ -20,15 +22,105 @@ TEMP_DIR.mkdir(exist_ok=True)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-# 支持的平台列表
-SUPPORTED_PLATFORMS = [
-    {"id": "wechat", "name": "微信公众号", "icon": "💬"},
-    {"id": "toutiao", "name": "今日头条", "icon": "📰"},
-    {"id": "netease", "name": "网易新闻", "icon": "📰"},
-    {"id": "sohu", "name": "搜狐新闻", "icon": "📰"},
-    {"id": "tencent", "name": "腾讯新闻", "icon": "📰"},
-    {"id": "detik", "name": "Detik News", "icon": "🌏"},
-    {"id": "naver", "name": "Naver News", "icon": "🇰🇷"},
-    {"id": "lenny", "name": "Lenny's Newsletter", "icon": "📮"},
-    {"id": "quora", "name": "Quora", "icon": "❓"},
-]
+# 启用的平台（逗号分隔，如 "wechat,toutiao"），留空表示全部启用
+# 未启用平台的适配器和爬虫模块不会被导入
+ENABLED_PLATFORMS = [
+    name.strip().lower() for name in os.getenv("ENABLED_PLATFORMS", "").split(",") if name.strip()
+] or None
+
+# HTTP 连接池配置（所有爬虫实例共享）
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "16"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "32"))
+
+# 按站点限速（所有爬虫共享）：令牌桶速率/突发量、单站点最大并发；
+# 遇到 403/429 或验证码页面时自动降速并暂停该站点
+POLITENESS_ENABLED = os.getenv("POLITENESS_ENABLED", "true").lower() in ("1", "true", "yes")
+HOST_RATE_LIMIT = float(os.getenv("HOST_RATE_LIMIT", "2"))
+HOST_BURST = float(os.getenv("HOST_BURST", "4"))
+HOST_MAX_IN_FLIGHT = int(os.getenv("HOST_MAX_IN_FLIGHT", "4"))
+
+# 重试预算：10 秒窗口内重试次数不超过 请求数 × 比例 + 最小值，防止重试放大故障
+RETRY_BUDGET_RATIO = float(os.getenv("RETRY_BUDGET_RATIO", "0.2"))
+RETRY_BUDGET_MIN = int(os.getenv("RETRY_BUDGET_MIN", "10"))
+
+# 按平台熔断：统计窗口（秒）内调用数不少于 CIRCUIT_MIN_CALLS 且失败率达到 CIRCUIT_FAILURE_RATE 时打开，
+# 打开期间直接返回 503，CIRCUIT_OPEN_SECONDS 秒后放行一个探测请求，成功则恢复
+CIRCUIT_BREAKER_ENABLED = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() in ("1", "true", "yes")
+CIRCUIT_FAILURE_RATE = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_MIN_CALLS = int(os.getenv("CIRCUIT_MIN_CALLS", "10"))
+CIRCUIT_WINDOW = float(os.getenv("CIRCUIT_WINDOW", "60"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("CIRCUIT_OPEN_SECONDS", "30"))
+
+# 解析 / Markdown 生成使用的专用线程池：工作线程数（0 表示 min(32, CPU 核数 + 4)）和排队上限，
+# 排队已满时新请求直接返回 503，而不是无限堆积
+EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", "0"))
+EXTRACT_QUEUE_LIMIT = int(os.getenv("EXTRACT_QUEUE_LIMIT", "64"))
+
+# 解析进程池：大于 0 时 HTML 解析在这么多个预热的子进程中执行（不受 GIL 限制，吞吐随 CPU 核数增长），
+# 0 表示只使用上面的线程池；排队上限同 EXTRACT_QUEUE_LIMIT
+PARSE_PROCESSES = int(os.getenv("PARSE_PROCESSES", "0"))
+
+# 抓取模式（用于离线压测）
+# live: 直接请求目标站点；record: 请求并把响应录制到归档目录；replay: 只从归档目录回放，不访问网络
+FETCH_MODE = os.getenv("FETCH_MODE", "live").lower()
+FETCH_ARCHIVE_DIR = Path(os.getenv("FETCH_ARCHIVE_DIR", str(DATA_DIR / "fetch_archive")))
+# 回放延迟: none / recorded[:倍数] / fixed:秒 / lognormal:中位秒数[:sigma]
+FETCH_REPLAY_LATENCY = os.getenv("FETCH_REPLAY_LATENCY", "none")
+
+# HTTP 响应缓存（重复提取同一页面时直接复用或条件请求）
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+HTTP_CACHE_TTL = float(os.getenv("HTTP_CACHE_TTL", "300"))
+HTTP_CACHE_MAX_BYTES = int(float(os.getenv("HTTP_CACHE_MAX_MB", "64")) * 1024 * 1024)
+# 磁盘缓存目录，留空则只使用内存缓存
+HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", "") or None
+HTTP_CACHE_DISK_MAX_BYTES = int(float(os.getenv("HTTP_CACHE_DISK_MAX_MB", "512")) * 1024 * 1024)
+# 响应头没有 max-age / Expires 时是否仍按 HTTP_CACHE_TTL 缓存（默认只缓存带 ETag / Last-Modified 的响应，每次都条件请求）
+HTTP_CACHE_HEURISTIC = os.getenv("HTTP_CACHE_HEURISTIC", "false").lower() in ("1", "true", "yes")
+
+# 提取结果缓存（按 平台 + 文章ID 缓存最终结果，URL 变体也能命中）
+RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "600"))
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "1024"))
+
+# 文章库：提取结果持久化到 SQLite（按平台 + 文章ID 去重更新），作为结果缓存的第二层，
+# 重启后或多个 worker 之间复用；TTL 为 0 表示库中的结果不过期
+ARTICLE_STORE_ENABLED = os.getenv("ARTICLE_STORE_ENABLED", "false").lower() in ("1", "true", "yes")
+ARTICLE_STORE_PATH = Path(os.getenv("ARTICLE_STORE_PATH", str(DATA_DIR / "articles.sqlite3")))
+ARTICLE_STORE_TTL = float(os.getenv("ARTICLE_STORE_TTL", "86400"))
+
+# 单飞请求合并：同一篇文章的并发提取只执行一次，所有调用方共享结果或错误
+# （RESULT_CACHE_SINGLE_FLIGHT 为旧名称，未设置 EXTRACT_SINGLE_FLIGHT 时沿用）
+EXTRACT_SINGLE_FLIGHT = os.getenv(
+    "EXTRACT_SINGLE_FLIGHT", os.getenv("RESULT_CACHE_SINGLE_FLIGHT", "true")
+).lower() in ("1", "true", "yes")
+
+# 批量提取配置
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+BATCH_PER_PLATFORM_CONCURRENCY = int(os.getenv("BATCH_PER_PLATFORM_CONCURRENCY", "4"))
+# 调用方可以指定的并发上限（不低于上面的默认值）
+BATCH_MAX_CONCURRENCY = max(BATCH_CONCURRENCY, int(os.getenv("BATCH_MAX_CONCURRENCY", "32")))
+BATCH_MAX_PER_PLATFORM_CONCURRENCY = max(
+    BATCH_PER_PLATFORM_CONCURRENCY, int(os.getenv("BATCH_MAX_PER_PLATFORM_CONCURRENCY", "8"))
+)
+BATCH_TIMEOUT = float(os.getenv("BATCH_TIMEOUT", "60"))
+BATCH_MAX_URLS = int(os.getenv("BATCH_MAX_URLS", "5000"))
+
+# 图片代理（/api/proxy/image）：共享连接池大小、单个上游 host 的并发上限，
+# 连接 / 读取超时以及单张图片的总耗时预算（排队 + 响应头 + 传输，秒）
+IMAGE_PROXY_MAX_CONNECTIONS = int(os.getenv("IMAGE_PROXY_MAX_CONNECTIONS", "64"))
+IMAGE_PROXY_PER_HOST_CONCURRENCY = int(os.getenv("IMAGE_PROXY_PER_HOST_CONCURRENCY", "16"))
+IMAGE_PROXY_CONNECT_TIMEOUT = float(os.getenv("IMAGE_PROXY_CONNECT_TIMEOUT", "5"))
+IMAGE_PROXY_READ_TIMEOUT = float(os.getenv("IMAGE_PROXY_READ_TIMEOUT", "10"))
+IMAGE_PROXY_TIMEOUT = float(os.getenv("IMAGE_PROXY_TIMEOUT", "30"))
+
+# 图片磁盘缓存：内容寻址存储 + SQLite 索引，超过总大小后按最近访问淘汰
+IMAGE_CACHE_ENABLED = os.getenv("IMAGE_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+IMAGE_CACHE_DIR = Path(os.getenv("IMAGE_CACHE_DIR", str(DATA_DIR / "image_cache")))
+IMAGE_CACHE_MAX_BYTES = int(float(os.getenv("IMAGE_CACHE_MAX_MB", "1024")) * 1024 * 1024)
+IMAGE_CACHE_MAX_OBJECT_BYTES = int(float(os.getenv("IMAGE_CACHE_MAX_OBJECT_MB", "32")) * 1024 * 1024)
+
+# 图片缩放 / 转码的工作进程数（需要安装 Pillow），0 表示 min(4, CPU 核数)
+IMAGE_TRANSFORM_WORKERS = int(os.getenv("IMAGE_TRANSFORM_WORKERS", "0"))
+
+# 支持的平台列表（由平台注册表生成）
+SUPPORTED_PLATFORMS = [spec.to_dict() for spec in PLATFORMS]
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+抓取层配置 - 抓取模式（live/record/replay）、HTTP 响应缓存与按站点限速统计
+"""
+from typing import Any, Dict, Optional
+
+from news_crawler.core import (
+    BaseNewsCrawler,
+    CachingFetcher,
+    FetchArchive,
+    RecordingFetcher,
+    ReplayFetcher,
+    ResponseCache,
+    get_politeness,
+    get_retry_budget,
+)
+from . import config
+
+_fetch_archive: Optional[FetchArchive] = None
+_replay_fetcher: Optional[ReplayFetcher] = None
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """获取进程内共享的 HTTP 响应缓存，未启用时返回 None"""
+    global _response_cache
+    if not config.HTTP_CACHE_ENABLED:
+        return None
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            max_bytes=config.HTTP_CACHE_MAX_BYTES,
+            ttl=config.HTTP_CACHE_TTL,
+            disk_dir=config.HTTP_CACHE_DIR,
+            disk_max_bytes=config.HTTP_CACHE_DISK_MAX_BYTES,
+            heuristic=config.HTTP_CACHE_HEURISTIC,
+        )
+    return _response_cache
+
+
+def install_fetch_mode(crawler: BaseNewsCrawler, mode: Optional[str] = None) -> BaseNewsCrawler:
+    """
+    按 FETCH_MODE 替换爬虫的抓取策略
+
+    - live: 保持爬虫自身的抓取策略
+    - record: 包装爬虫自身的抓取策略，把响应录制到 FETCH_ARCHIVE_DIR
+    - replay: 从 FETCH_ARCHIVE_DIR 回放响应（按 FETCH_REPLAY_LATENCY 模拟延迟）
+
+    Args:
+        crawler: 爬虫实例
+        mode: 抓取模式，默认读取 config.FETCH_MODE
+
+    Returns:
+        BaseNewsCrawler: 传入的爬虫实例
+    """
+    global _fetch_archive, _replay_fetcher
+    mode = mode or config.FETCH_MODE
+    if mode == "live":
+        return crawler
+    if mode not in ("record", "replay"):
+        raise ValueError(f"不支持的抓取模式: {mode}")
+
+    # 所有爬虫共享同一个归档对象，回放时可以复用已加载的响应
+    if _fetch_archive is None:
+        _fetch_archive = FetchArchive(config.FETCH_ARCHIVE_DIR)
+    if mode == "record":
+        crawler.fetcher = RecordingFetcher(_fetch_archive, crawler.fetcher)
+        crawler.async_fetcher = RecordingFetcher(_fetch_archive, crawler.async_fetcher)
+    else:
+        if _replay_fetcher is None:
+            _replay_fetcher = ReplayFetcher(_fetch_archive, config.FETCH_REPLAY_LATENCY)
+        crawler.fetcher = _replay_fetcher
+        crawler.async_fetcher = _replay_fetcher
+    return crawler
+
+
+def install_response_cache(crawler: BaseNewsCrawler) -> BaseNewsCrawler:
+    """
+    用共享的 HTTP 响应缓存包装爬虫的抓取策略（回放模式下不需要缓存）
+
+    Args:
+        crawler: 爬虫实例
+
+    Returns:
+        BaseNewsCrawler: 传入的爬虫实例
+    """
+    cache = get_response_cache()
+    if cache is None or config.FETCH_MODE == "replay":
+        return crawler
+    crawler.fetcher = CachingFetcher(crawler.fetcher, cache)
+    crawler.async_fetcher = CachingFetcher(crawler.async_fetcher, cache)
+    return crawler
+
+
+def install_fetchers(crawler: BaseNewsCrawler) -> BaseNewsCrawler:
+    """按配置为爬虫安装抓取模式和响应缓存"""
+    return install_response_cache(install_fetch_mode(crawler))
+
+
+def fetch_stats() -> Dict[str, Any]:
+    """抓取层统计信息"""
+    cache = get_response_cache()
+    return {
+        "fetch_mode": config.FETCH_MODE,
+        "http_cache": cache.stats() if cache is not None else None,
+        "politeness": get_politeness().stats(),
+        "retry_budget": get_retry_budget().stats(),
+    }
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+平台注册表 - 所有支持平台的唯一定义
+
+平台检测、支持平台列表（/api/platforms、MCP）、config.SUPPORTED_PLATFORMS 以及
+适配器清单都由这里的 PLATFORMS 生成。
+
+检测流程：解析 URL 的 host，先按完整 host 查找，再按域名后缀（由长到短）查找，
+最后用预编译的路径正则确认。匹配顺序只取决于 host 的具体程度，与平台的登记顺序无关。
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True)
+class PlatformSpec:
+    """单个平台的定义"""
+    id: str
+    name: str
+    icon: str
+    # 适配器类 "模块:类"
+    adapter: str
+    # 精确匹配的 host
+    hosts: Tuple[str, ...] = ()
+    # 匹配其任意子域名的域名后缀（不含开头的点），如 "naver.com" 匹配 "n.news.naver.com"
+    host_suffixes: Tuple[str, ...] = ()
+    # 路径需满足的正则（从路径开头匹配），None 表示任意路径
+    path: Optional[str] = None
+    path_re: Optional[Pattern[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "path_re", re.compile(self.path) if self.path else None)
+
+    def matches_path(self, path: str) -> bool:
+        return self.path_re is None or self.path_re.match(path) is not None
+
+    def to_dict(self) -> Dict[str, str]:
+        """对外展示的平台信息"""
+        return {"id": self.id, "name": self.name, "icon": self.icon}
+
+
+PLATFORMS: Tuple[PlatformSpec, ...] = (
+    PlatformSpec(
+        id="toutiao", name="今日头条", icon="📰",
+        adapter="news_extractor_core.adapters.toutiao:ToutiaoAdapter",
+        hosts=("www.toutiao.com",), path=r"/article/",
+    ),
+    PlatformSpec(
+        id="wechat", name="微信公众号", icon="💬",
+        adapter="news_extractor_core.adapters.wechat:WeChatAdapter",
+        hosts=("mp.weixin.qq.com",), path=r"/s/",
+    ),
+    PlatformSpec(
+        id="netease", name="网易新闻", icon="📰",
+        adapter="news_extractor_core.adapters.netease:NeteaseAdapter",
+        hosts=("www.163.com",), path=r"/(news|dy)/article/",  # 支持news和dy两种路径
+    ),
+    PlatformSpec(
+        id="sohu", name="搜狐新闻", icon="📰",
+        adapter="news_extractor_core.adapters.sohu:SohuAdapter",
+        hosts=("www.sohu.com",), path=r"/a/",
+    ),
+    PlatformSpec(
+        id="tencent", name="腾讯新闻", icon="📰",
+        adapter="news_extractor_core.adapters.tencent:TencentAdapter",
+        hosts=("news.qq.com",), path=r"/rain/a/",
+    ),
+    PlatformSpec(
+        id="detik", name="Detik News", icon="🌏",
+        adapter="news_extractor_core.adapters.detik:DetikAdapter",
+        hosts=("news.detik.com",),
+    ),
+    PlatformSpec(
+        id="naver", name="Naver News", icon="🇰🇷",
+        adapter="news_extractor_core.adapters.naver:NaverAdapter",
+        host_suffixes=("naver.com",),
+    ),
+    PlatformSpec(
+        id="lenny", name="Lenny's Newsletter", icon="📮",
+        adapter="news_extractor_core.adapters.lenny:LennyAdapter",
+        hosts=("www.lennysnewsletter.com",),
+    ),
+    PlatformSpec(
+        id="quora", name="Quora", icon="❓",
+        adapter="news_extractor_core.adapters.quora:QuoraAdapter",
+        host_suffixes=("quora.com",),
+    ),
+    PlatformSpec(
+        id="bbc", name="BBC News", icon="🇬🇧",
+        adapter="news_extractor_core.adapters.bbc:BBCAdapter",
+        hosts=("www.bbc.com",), path=r"/news/articles/",
+    ),
+    PlatformSpec(
+        id="cnn", name="CNN News", icon="🇺🇸",
+        adapter="news_extractor_core.adapters.cnn:CNNAdapter",
+        hosts=("cnn.com", "www.cnn.com", "edition.cnn.com"), path=r"/\d{4}/\d{2}/\d{2}/",
+    ),
+)
+
+PLATFORMS_BY_ID: Dict[str, PlatformSpec] = {spec.id: spec for spec in PLATFORMS}
+
+
+def _build_index(attr: str) -> Dict[str, Tuple[PlatformSpec, ...]]:
+    index: Dict[str, List[PlatformSpec]] = {}
+    for spec in PLATFORMS:
+        for host in getattr(spec, attr):
+            index.setdefault(host.lower(), []).append(spec)
+    return {host: tuple(specs) for host, specs in index.items()}
+
+
+_EXACT_HOSTS = _build_index("hosts")
+_SUFFIX_HOSTS = _build_index("host_suffixes")
+
+
+def _candidates(host: str) -> Tuple[PlatformSpec, ...]:
+    """按具体程度返回 host 对应的候选平台：完整 host，其次是由长到短的域名后缀"""
+    candidates = _EXACT_HOSTS.get(host, ())
+    start = host.find(".")
+    while start != -1:
+        suffix = host[start + 1:]
+        if suffix in _SUFFIX_HOSTS:
+            candidates += _SUFFIX_HOSTS[suffix]
+        start = host.find(".", start + 1)
+    return candidates
+
+
+def _split(url: str) -> Optional[Tuple[str, str]]:
+    """解析出 (host, path)；不是 http(s) 链接时返回 None"""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return None
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return None
+    return parts.hostname.rstrip("."), parts.path or "/"
+
+
+def detect_platform(url: str) -> Optional[str]:
+    """
+    根据 URL 检测平台类型
+
+    Args:
+        url: 新闻链接
+
+    Returns:
+        平台名称，如果无法识别则返回 None
+    """
+    split = _split(url)
+    if split is None:
+        return None
+    host, path = split
+    for spec in _candidates(host):
+        if spec.matches_path(path):
+            return spec.id
+    return None
+
+
+def detect_platforms(urls: Iterable[str]) -> List[Optional[str]]:
+    """
+    批量检测平台类型，同一个 host 的候选平台只查找一次
+
+    Args:
+        urls: 新闻链接列表
+
+    Returns:
+        与输入顺序一致的平台名称列表，无法识别的位置为 None
+    """
+    host_cache: Dict[str, Tuple[PlatformSpec, ...]] = {}
+    results: List[Optional[str]] = []
+    for url in urls:
+        split = _split(url) if isinstance(url, str) else None
+        if split is None:
+            results.append(None)
+            continue
+        host, path = split
+        candidates = host_cache.get(host)
+        if candidates is None:
+            candidates = host_cache[host] = _candidates(host)
+        results.append(next((spec.id for spec in candidates if spec.matches_path(path)), None))
+    return results
@@ -2,13 +2,28 @@
 """
 核心服务模块
 """
-from .detector import detect_platform, get_supported_platforms
+from .detector import detect_platform, detect_platforms, get_supported_platforms
 from .extractor import ExtractorService
-from .formatter import to_markdown
+from .batch import BatchDeadlineExceeded, BatchExtractor, BatchResult
+from .breaker import CircuitBreaker, CircuitBreakers, CircuitOpenError
+from .cache import ResultCache
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .formatter import ato_markdown, to_markdown
 
 __all__ = [
     "detect_platform",
+    "detect_platforms",
     "get_supported_platforms",
     "ExtractorService",
+    "BatchDeadlineExceeded",
+    "BatchExtractor",
+    "BatchResult",
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "CircuitOpenError",
+    "ResultCache",
+    "SingleFlight",
+    "AsyncSingleFlight",
     "to_markdown",
+    "ato_markdown",
 ]
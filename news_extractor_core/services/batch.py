@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+批量提取服务 - 有界并发、单条超时与整体截止时间
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .. import config
+from ..models import NewsItem
+from .detector import detect_platforms
+from .extractor import ExtractorService
+
+ExtractFunc = Callable[[str], Awaitable[tuple[NewsItem, str]]]
+
+
+class BatchDeadlineExceeded(TimeoutError):
+    """批量任务整体截止时间已到"""
+
+
+@dataclass
+class BatchResult:
+    """单个 URL 的批量提取结果"""
+    index: int
+    url: str
+    platform: Optional[str] = None
+    news_item: Optional[NewsItem] = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def elapsed_ms(self) -> int:
+        return int(self.elapsed * 1000)
+
+
+class BatchExtractor:
+    """
+    批量提取器
+
+    - 全局并发上限 + 每个平台的并发上限（先占平台名额再占全局名额，
+      避免等待某个平台时白白占用全局名额）
+    - 每个 URL 的提取超时，以及整个批次的截止时间
+    - 结果可以按输入顺序一次性返回，也可以按完成顺序流式返回
+    """
+
+    def __init__(
+        self,
+        concurrency: int = config.BATCH_CONCURRENCY,
+        per_platform_concurrency: int = config.BATCH_PER_PLATFORM_CONCURRENCY,
+        timeout: Optional[float] = config.BATCH_TIMEOUT,
+        deadline: Optional[float] = None,
+        extract: Optional[ExtractFunc] = None,
+    ):
+        if concurrency < 1 or per_platform_concurrency < 1:
+            raise ValueError("并发数必须大于 0")
+        self.concurrency = concurrency
+        self.per_platform_concurrency = per_platform_concurrency
+        self.timeout = timeout
+        self.deadline = deadline
+        self._extract = extract or ExtractorService.aextract_news
+
+    async def run(self, urls: Iterable[str]) -> List[BatchResult]:
+        """执行批量提取，结果保持输入顺序"""
+        results = [result async for result in self.iter_completed(urls)]
+        results.sort(key=lambda item: item.index)
+        return results
+
+    async def iter_completed(self, urls: Iterable[str]) -> AsyncIterator[BatchResult]:
+        """执行批量提取，按完成顺序逐条返回结果"""
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + self.deadline if self.deadline else None
+        global_slots = asyncio.Semaphore(self.concurrency)
+        platform_slots: Dict[Optional[str], asyncio.Semaphore] = {}
+
+        async def run_one(index: int, url: str, platform: Optional[str]) -> BatchResult:
+            slots = platform_slots.setdefault(
+                platform, asyncio.Semaphore(self.per_platform_concurrency)
+            )
+            result = BatchResult(index=index, url=str(url), platform=platform)
+            async with slots, global_slots:
+                started = time.perf_counter()
+                try:
+                    timeout = self._remaining_timeout(loop, deadline_at)
+                    news_item, result.platform = await asyncio.wait_for(
+                        self._extract(url), timeout
+                    )
+                    result.news_item = news_item
+                except asyncio.TimeoutError:
+                    result.error = self._timeout_error(loop, deadline_at)
+                except Exception as exc:
+                    result.error = exc
+                result.elapsed = time.perf_counter() - started
+            return result
+
+        urls = list(urls)
+        tasks = [
+            asyncio.ensure_future(run_one(index, url, platform))
+            for index, (url, platform) in enumerate(zip(urls, detect_platforms(urls)))
+        ]
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _remaining_timeout(
+        self, loop: asyncio.AbstractEventLoop, deadline_at: Optional[float]
+    ) -> Optional[float]:
+        if deadline_at is None:
+            return self.timeout
+        remaining = deadline_at - loop.time()
+        if remaining <= 0:
+            raise BatchDeadlineExceeded(f"超出批量截止时间（{self.deadline}s）")
+        return remaining if self.timeout is None else min(self.timeout, remaining)
+
+    def _timeout_error(
+        self, loop: asyncio.AbstractEventLoop, deadline_at: Optional[float]
+    ) -> Exception:
+        if deadline_at is not None and loop.time() >= deadline_at:
+            return BatchDeadlineExceeded(f"超出批量截止时间（{self.deadline}s）")
+        return TimeoutError(f"提取超时（{self.timeout}s）")
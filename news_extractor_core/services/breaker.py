@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+按平台熔断
+
+每个平台维护一个熔断器，根据最近一段时间内抓取 / 解析的失败率切换状态：
+
+- closed: 正常放行，记录每次调用的成功与失败
+- open: 失败率超过阈值后打开，期间的调用直接失败（CircuitOpenError），不再访问目标站点
+- half_open: 打开一段时间后放行少量探测请求，探测成功则关闭，失败则重新打开
+
+目标站点返回 404/410 这类"文章不存在"的错误以及本机解析线程池过载不计入失败率。
+"""
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from news_crawler.core import ExecutorSaturated
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 不代表站点故障的 HTTP 状态码
+IGNORED_STATUSES = frozenset({404, 410})
+
+
+class CircuitOpenError(ValueError):
+    """平台熔断期间的快速失败"""
+
+    def __init__(self, platform: str, retry_in: float):
+        self.platform = platform
+        self.retry_in = retry_in
+        super().__init__(f"平台 '{platform}' 近期失败率过高，已暂停提取，请 {max(1, math.ceil(retry_in))} 秒后重试")
+
+
+def counts_as_failure(exc: BaseException) -> bool:
+    """异常是否计入失败率（文章不存在、本机过载、任务取消等不算平台故障）"""
+    if not isinstance(exc, Exception) or isinstance(exc, ExecutorSaturated):
+        return False
+    return getattr(exc, "status_code", None) not in IGNORED_STATUSES
+
+
+class CircuitBreaker:
+    """
+    单个平台的熔断器
+
+    Args:
+        failure_rate: 打开熔断的失败率阈值（0~1）
+        min_calls: 窗口内至少有这么多次调用才计算失败率
+        window: 统计窗口（秒）
+        open_seconds: 打开后多久进入半开状态
+        half_open_probes: 半开状态下同时放行的探测请求数
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window: float = 60.0,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self.state = CLOSED
+        self._calls: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        # 统计
+        self.rejected = 0
+        self.opened = 0
+
+    def _trim(self, now: float) -> None:
+        while self._calls and now - self._calls[0][0] > self.window:
+            _, ok = self._calls.popleft()
+            if not ok:
+                self._failures -= 1
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self._opened_at = now
+        self._probes = 0
+        self.opened += 1
+
+    def retry_in(self) -> float:
+        """距离进入半开状态还有多少秒"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def before_call(self) -> bool:
+        """
+        调用前检查是否放行
+
+        Returns:
+            本次调用是否为半开状态下的探测请求
+
+        Raises:
+            CircuitOpenError: 熔断打开（或探测名额已用完）时，platform 由调用方填充
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN:
+                if now - self._opened_at < self.open_seconds:
+                    self.rejected += 1
+                    raise CircuitOpenError("", self._opened_at + self.open_seconds - now)
+                self.state = HALF_OPEN
+                self._probes = 0
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    self.rejected += 1
+                    raise CircuitOpenError("", self.open_seconds)
+                self._probes += 1
+                return True
+            return False
+
+    def record(self, ok: bool, probe: bool = False) -> None:
+        """记录一次调用结果"""
+        with self._lock:
+            now = time.monotonic()
+            if probe:
+                if self.state != HALF_OPEN:
+                    return
+                if ok:
+                    # 探测成功：关闭熔断，重新开始统计
+                    self.state = CLOSED
+                    self._calls.clear()
+                    self._failures = 0
+                else:
+                    self._open(now)
+                return
+            self._calls.append((now, ok))
+            if not ok:
+                self._failures += 1
+            self._trim(now)
+            if (
+                self.state == CLOSED
+                and len(self._calls) >= self.min_calls
+                and self._failures / len(self._calls) >= self.failure_rate
+            ):
+                self._open(now)
+
+    def release(self, probe: bool) -> None:
+        """调用被取消或结果与平台健康无关时归还探测名额，不记录成功或失败"""
+        if not probe:
+            return
+        with self._lock:
+            if self.state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._trim(time.monotonic())
+            calls = len(self._calls)
+            return {
+                "state": self.state,
+                "calls": calls,
+                "failures": self._failures,
+                "failure_rate": round(self._failures / calls, 3) if calls else 0.0,
+                "retry_in": round(self.retry_in(), 1),
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakers:
+    """按平台懒创建熔断器，参数见 CircuitBreaker"""
+
+    def __init__(self, **options: Any):
+        self._options = options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, platform: str) -> CircuitBreaker:
+        breaker = self._breakers.get(platform)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(platform)
+                if breaker is None:
+                    breaker = self._breakers[platform] = CircuitBreaker(**self._options)
+        return breaker
+
+    def before_call(self, platform: str) -> bool:
+        """放行返回是否为探测请求，熔断时抛出带平台名的 CircuitOpenError"""
+        try:
+            return self.get(platform).before_call()
+        except CircuitOpenError as e:
+            raise CircuitOpenError(platform, e.retry_in) from None
+
+    def record(self, platform: str, exc: Optional[BaseException], probe: bool = False) -> None:
+        """
+        记录一次调用结果，exc 为 None 表示成功
+
+        不计入失败率的异常（文章不存在、本机过载等）既不算成功也不算失败：
+        不进入统计窗口，探测请求只归还名额，不会因此关闭熔断
+        """
+        if exc is not None and not counts_as_failure(exc):
+            self.get(platform).release(probe)
+            return
+        self.get(platform).record(exc is None, probe)
+
+    def release(self, platform: str, probe: bool) -> None:
+        """调用被取消时归还探测名额"""
+        self.get(platform).release(probe)
+
+    def open_platforms(self) -> list:
+        """当前处于打开或半开状态的平台"""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return [name for name, breaker in breakers if breaker.state != CLOSED]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return {name: breaker.snapshot() for name, breaker in breakers}
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+提取结果缓存 - 按 (平台, 规范化 URL) 缓存最终的 NewsItem
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from news_crawler.core import ArticleStore
+
+from ..models import NewsItem
+
+CacheKey = Tuple[str, str]
+
+
+class ResultCache:
+    """
+    提取结果缓存
+
+    - 以 (platform, canonical_url) 为键，同一篇文章的不同 URL 变体（http/https、追踪参数等）命中同一条缓存
+    - 条目超过 TTL 后失效，超过容量时按 LRU 淘汰
+    - 并发请求的合并由 ExtractorService 的单飞层负责（见 singleflight.py）
+    - 可选的 ArticleStore（SQLite）作为第二层：内存未命中时按 store_ttl 读取持久化的结果，
+      进程重启或多个 worker 之间也能复用已提取的文章
+
+    Args:
+        max_entries: 内存中的最大条目数
+        ttl: 内存条目的有效期（秒）
+        store: 持久化的文章库（可选）
+        store_ttl: 文章库中结果的有效期（秒），None 表示不过期
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 600.0,
+        store: Optional[ArticleStore] = None,
+        store_ttl: Optional[float] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store = store
+        self.store_ttl = store_ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, NewsItem]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "store_hits": 0}
+
+    def _memory_get(self, key: Hashable) -> Optional[NewsItem]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, news_item = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return news_item
+            del self._entries[key]
+            self._stats["expired"] += 1
+            return None
+
+    def _store_get(self, key: Hashable) -> Optional[NewsItem]:
+        news_item = self.store.get(*key, max_age=self.store_ttl) if self.store is not None else None
+        with self._lock:
+            if news_item is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._stats["store_hits"] += 1
+        self._remember(key, news_item)
+        return news_item
+
+    def get(self, key: Hashable) -> Optional[NewsItem]:
+        """读取未过期的缓存条目（先查内存，再查文章库）"""
+        news_item = self._memory_get(key)
+        if news_item is not None:
+            return news_item
+        return self._store_get(key)
+
+    async def aget(self, key: Hashable) -> Optional[NewsItem]:
+        """get 的异步版本：文章库的 SQLite 读取放到线程中执行，不阻塞事件循环"""
+        news_item = self._memory_get(key)
+        if news_item is not None:
+            return news_item
+        if self.store is None:
+            return self._store_get(key)
+        return await asyncio.to_thread(self._store_get, key)
+
+    def put(self, key: Hashable, news_item: NewsItem) -> None:
+        """写入缓存条目（文章库批量异步落盘），超出容量时淘汰最久未使用的条目"""
+        if self.store is not None:
+            platform, url = key
+            self.store.put(news_item, platform, url)
+        self._remember(key, news_item)
+
+    async def aput(self, key: Hashable, news_item: NewsItem) -> None:
+        """put 的异步版本：写入文章库（可能触发一次同步的批量落盘）放到线程中执行"""
+        if self.store is not None:
+            platform, url = key
+            await asyncio.to_thread(self.store.put, news_item, platform, url)
+        self._remember(key, news_item)
+
+    def _remember(self, key: Hashable, news_item: NewsItem) -> None:
+        if self.max_entries <= 0 or self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, news_item)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.store is not None:
+            self.store.delete(*key)
+
+    def clear(self) -> None:
+        """清空内存中的条目（文章库不受影响）"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["store"] = self.store.stats() if self.store is not None else None
+        return stats
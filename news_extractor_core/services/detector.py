@@ -1,54 +1,17 @@
 # -*- coding: utf-8 -*-
 """
-平台检测服务
+平台检测服务（平台定义见 news_extractor_core.platforms）
 """
-import re
-from typing import Optional
+from .. import config
+from ..platforms import PLATFORMS, detect_platform, detect_platforms
 
-
-PLATFORM_PATTERNS = {
-    "toutiao": r"https?://www\.toutiao\.com/article/",
-    "wechat": r"https?://mp\.weixin\.qq\.com/s/",
-    "netease": r"https?://www\.163\.com/(news|dy)/article/",  # 支持news和dy两种路径
-    "sohu": r"https?://www\.sohu\.com/a/",
-    "tencent": r"https?://news\.qq\.com/rain/a/",
-    "detik": r"https?://news\.detik\.com/",
-    "naver": r"https?://.*\.naver\.com/",
-    "lenny": r"https?://www\.lennysnewsletter\.com/",
-    "quora": r"https?://.*\.quora\.com/",
-    "bbc": r"https?://www\.bbc\.com/news/articles/",
-    "cnn": r"https?://(edition\.|www\.)?cnn\.com/\d{4}/\d{2}/\d{2}/"
-}
-
-
-def detect_platform(url: str) -> Optional[str]:
-    """
-    根据 URL 检测平台类型
-
-    Args:
-        url: 新闻链接
-
-    Returns:
-        平台名称，如果无法识别则返回 None
-    """
-    for platform, pattern in PLATFORM_PATTERNS.items():
-        if re.match(pattern, url):
-            return platform
-    return None
+__all__ = ["detect_platform", "detect_platforms", "get_supported_platforms"]
 
 
 def get_supported_platforms() -> list[dict]:
-    """获取支持的平台列表"""
+    """获取支持的平台列表（设置了 ENABLED_PLATFORMS 时只返回已启用的平台）"""
     return [
-        {"id": "toutiao", "name": "今日头条", "icon": "📰"},
-        {"id": "wechat", "name": "微信公众号", "icon": "💬"},
-        {"id": "netease", "name": "网易新闻", "icon": "📰"},
-        {"id": "sohu", "name": "搜狐新闻", "icon": "📰"},
-        {"id": "tencent", "name": "腾讯新闻", "icon": "📰"},
-        {"id": "detik", "name": "Detik News", "icon": "🌏"},
-        {"id": "naver", "name": "Naver News", "icon": "🇰🇷"},
-        {"id": "lenny", "name": "Lenny's Newsletter", "icon": "📮"},
-        {"id": "quora", "name": "Quora", "icon": "❓"},
-        {"id": "bbc", "name": "BBC News", "icon": "🇬🇧"},
-        {"id": "cnn", "name": "CNN News", "icon": "🇺🇸"}
+        spec.to_dict()
+        for spec in PLATFORMS
+        if config.ENABLED_PLATFORMS is None or spec.id in config.ENABLED_PLATFORMS
     ]
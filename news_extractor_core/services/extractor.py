@@ -2,42 +2,232 @@
 """
 新闻提取服务
 """
-from typing import Optional
+import asyncio
+from typing import Any, Dict, Optional
+from news_crawler.core import (
+    ArticleStore,
+    BaseNewsCrawler,
+    BoundedExecutor,
+    ExecutorSaturated,
+    HostPolicy,
+    PoolConfig,
+    ProcessParsePool,
+    aclose_pools,
+    close_pools,
+    configure_parse_executor,
+    configure_parse_pool,
+    configure_politeness,
+    configure_pools,
+    get_parse_executor,
+    get_parse_pool,
+    configure_retry_budget,
+    canonical_url,
+)
+from .. import config
+from ..fetching import fetch_stats
 from ..adapters.base import CrawlerAdapter
+from ..adapters.registry import ADAPTER_MANIFEST, AdapterRegistry
 from ..models import NewsItem
-from ..adapters.wechat import WeChatAdapter
-from ..adapters.toutiao import ToutiaoAdapter
-from ..adapters.netease import NeteaseAdapter
-from ..adapters.sohu import SohuAdapter
-from ..adapters.tencent import TencentAdapter
-from ..adapters.detik import DetikAdapter
-from ..adapters.lenny import LennyAdapter
-from ..adapters.naver import NaverAdapter
-from ..adapters.quora import QuoraAdapter
-from ..adapters.bbc import BBCAdapter
-from ..adapters.cnn import CNNAdapter
+from .cache import CacheKey, ResultCache
+from .breaker import CircuitBreakers, CircuitOpenError
+from .singleflight import AsyncSingleFlight, SingleFlight
 from .detector import detect_platform
 
 
-# 适配器注册表
-ADAPTERS = {
-    "wechat": WeChatAdapter(),
-    "toutiao": ToutiaoAdapter(),
-    "netease": NeteaseAdapter(),
-    "sohu": SohuAdapter(),
-    "tencent": TencentAdapter(),
-    "detik": DetikAdapter(),
-    "lenny": LennyAdapter(),
-    "naver": NaverAdapter(),
-    "quora": QuoraAdapter(),
-    "bbc": BBCAdapter(),
-    "cnn": CNNAdapter(),
-}
+# 适配器注册表（首次使用某个平台时才导入对应适配器，ENABLED_PLATFORMS 限制可用平台）
+ADAPTERS = AdapterRegistry(enabled=config.ENABLED_PLATFORMS)
+
+# 文章库（ARTICLE_STORE_ENABLED=true 时作为结果缓存的持久化层）
+ARTICLE_STORE: Optional[ArticleStore] = (
+    ArticleStore(config.ARTICLE_STORE_PATH) if config.RESULT_CACHE_ENABLED and config.ARTICLE_STORE_ENABLED else None
+)
+
+# 提取结果缓存（RESULT_CACHE_ENABLED=false 时不缓存）
+RESULT_CACHE: Optional[ResultCache] = (
+    ResultCache(
+        max_entries=config.RESULT_CACHE_MAX_ENTRIES,
+        ttl=config.RESULT_CACHE_TTL,
+        store=ARTICLE_STORE,
+        store_ttl=config.ARTICLE_STORE_TTL or None,
+    )
+    if config.RESULT_CACHE_ENABLED
+    else None
+)
+
+# 单飞请求合并：同一篇文章的并发提取共享一次抓取和解析（EXTRACT_SINGLE_FLIGHT=false 时关闭）
+SINGLE_FLIGHT: Optional[SingleFlight] = SingleFlight() if config.EXTRACT_SINGLE_FLIGHT else None
+ASYNC_SINGLE_FLIGHT: Optional[AsyncSingleFlight] = (
+    AsyncSingleFlight() if config.EXTRACT_SINGLE_FLIGHT else None
+)
+
+# 按平台熔断：近期抓取 / 解析失败率过高时快速失败（CIRCUIT_BREAKER_ENABLED=false 时关闭）
+CIRCUIT_BREAKERS: Optional[CircuitBreakers] = (
+    CircuitBreakers(
+        failure_rate=config.CIRCUIT_FAILURE_RATE,
+        min_calls=config.CIRCUIT_MIN_CALLS,
+        window=config.CIRCUIT_WINDOW,
+        open_seconds=config.CIRCUIT_OPEN_SECONDS,
+    )
+    if config.CIRCUIT_BREAKER_ENABLED
+    else None
+)
 
 
 class ExtractorService:
     """新闻提取服务"""
 
+    @staticmethod
+    def startup() -> None:
+        """按配置初始化共享的 HTTP 连接池、按站点限速、重试预算、解析线程池和解析进程池"""
+        configure_pools(
+            PoolConfig(
+                pool_connections=config.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=config.HTTP_POOL_MAXSIZE,
+            )
+        )
+        configure_politeness(
+            HostPolicy(
+                rate=config.HOST_RATE_LIMIT,
+                burst=config.HOST_BURST,
+                max_in_flight=config.HOST_MAX_IN_FLIGHT,
+            ),
+            enabled=config.POLITENESS_ENABLED,
+        )
+        configure_retry_budget(config.RETRY_BUDGET_RATIO, config.RETRY_BUDGET_MIN)
+        configure_parse_executor(
+            BoundedExecutor(max_workers=config.EXTRACT_WORKERS or None, max_queue=config.EXTRACT_QUEUE_LIMIT)
+        )
+        if config.PARSE_PROCESSES > 0:
+            # 启动时即创建全部子进程并导入已启用平台的适配器和爬虫模块
+            pool = ProcessParsePool(
+                workers=config.PARSE_PROCESSES,
+                preload=ADAPTERS.modules(),
+                max_queue=config.EXTRACT_QUEUE_LIMIT,
+            )
+            pool.start()
+            configure_parse_pool(pool)
+
+    @staticmethod
+    def shutdown() -> None:
+        """关闭共享的 HTTP 连接池、解析线程池和解析进程池，并把文章库中缓冲的结果写入磁盘"""
+        close_pools()
+        configure_parse_executor(None)
+        configure_parse_pool(None)
+        if ARTICLE_STORE is not None:
+            ARTICLE_STORE.flush()
+
+    @staticmethod
+    async def ashutdown() -> None:
+        """关闭当前事件循环上的异步连接池、同步连接池以及解析线程池和解析进程池，并写入文章库"""
+        await aclose_pools()
+        close_pools()
+        configure_parse_executor(None)
+        configure_parse_pool(None)
+        if ARTICLE_STORE is not None:
+            await asyncio.to_thread(ARTICLE_STORE.flush)
+
+    @staticmethod
+    def stats() -> Dict[str, Any]:
+        """运行时统计信息（缓存命中率等）"""
+        stats = fetch_stats()
+        stats["adapters"] = {"enabled": ADAPTERS.names(), "loaded": ADAPTERS.loaded()}
+        stats["result_cache"] = RESULT_CACHE.stats() if RESULT_CACHE is not None else None
+        stats["single_flight"] = (
+            {"sync": SINGLE_FLIGHT.stats(), "async": ASYNC_SINGLE_FLIGHT.stats()}
+            if SINGLE_FLIGHT is not None and ASYNC_SINGLE_FLIGHT is not None
+            else None
+        )
+        executor = get_parse_executor()
+        stats["executor"] = executor.stats() if isinstance(executor, BoundedExecutor) else None
+        parse_pool = get_parse_pool()
+        stats["parse_pool"] = parse_pool.stats() if parse_pool is not None else None
+        stats["circuits"] = CIRCUIT_BREAKERS.stats() if CIRCUIT_BREAKERS is not None else None
+        return stats
+
+    @staticmethod
+    def health() -> Dict[str, Any]:
+        """健康状态：有平台处于熔断时为 degraded，并附带各平台熔断器状态"""
+        if CIRCUIT_BREAKERS is None:
+            return {"status": "healthy", "circuits": None}
+        open_platforms = CIRCUIT_BREAKERS.open_platforms()
+        return {
+            "status": "degraded" if open_platforms else "healthy",
+            "open_circuits": open_platforms,
+            "circuits": CIRCUIT_BREAKERS.stats(),
+        }
+
+    @staticmethod
+    def _cache_key(url: str, platform: str) -> CacheKey:
+        """
+        结果缓存和单飞合并的键：(平台, 规范化 URL)
+
+        各平台的 get_article_id 只取 URL 的一部分（最后一段路径等），不同文章可能得到相同的ID，
+        因此这里使用完整的规范化 URL：协议和域名统一小写（http 归并为 https），去掉追踪参数、
+        锚点和末尾的斜杠，路径的每一段都保留。
+        """
+        return platform, canonical_url(url)
+
+    @staticmethod
+    def _load(adapter: CrawlerAdapter, crawler: BaseNewsCrawler, url: str, key: CacheKey) -> NewsItem:
+        """真正执行一次提取（经过平台熔断器），并写入结果缓存"""
+        if CIRCUIT_BREAKERS is None:
+            news_item = adapter.extract(url, crawler)
+        else:
+            probe = CIRCUIT_BREAKERS.before_call(key[0])
+            try:
+                news_item = adapter.extract(url, crawler)
+            except Exception as e:
+                CIRCUIT_BREAKERS.record(key[0], e, probe)
+                raise
+            except BaseException:
+                # 取消 / 退出不代表平台故障，只归还探测名额
+                CIRCUIT_BREAKERS.release(key[0], probe)
+                raise
+            CIRCUIT_BREAKERS.record(key[0], None, probe)
+        if RESULT_CACHE is not None:
+            RESULT_CACHE.put(key, news_item)
+        return news_item
+
+    @staticmethod
+    async def _aload(adapter: CrawlerAdapter, crawler: BaseNewsCrawler, url: str, key: CacheKey) -> NewsItem:
+        """异步执行一次提取（经过平台熔断器），并写入结果缓存"""
+        if CIRCUIT_BREAKERS is None:
+            news_item = await adapter.aextract(url, crawler)
+        else:
+            probe = CIRCUIT_BREAKERS.before_call(key[0])
+            try:
+                news_item = await adapter.aextract(url, crawler)
+            except Exception as e:
+                CIRCUIT_BREAKERS.record(key[0], e, probe)
+                raise
+            except BaseException:
+                # 取消 / 退出不代表平台故障，只归还探测名额
+                CIRCUIT_BREAKERS.release(key[0], probe)
+                raise
+            CIRCUIT_BREAKERS.record(key[0], None, probe)
+        if RESULT_CACHE is not None:
+            await RESULT_CACHE.aput(key, news_item)
+        return news_item
+
+    @staticmethod
+    def _resolve_adapter(url: str, platform: Optional[str]) -> tuple[CrawlerAdapter, str]:
+        """根据 URL 或指定的平台名称获取适配器"""
+        # 自动检测平台
+        if platform is None:
+            platform = detect_platform(url)
+
+        if platform is None:
+            raise ValueError("无法识别该平台，请检查 URL 是否正确")
+
+        # 获取适配器
+        adapter = ADAPTERS.get(platform)
+        if adapter is None:
+            if platform in ADAPTER_MANIFEST:
+                raise ValueError(f"平台 '{platform}' 未在当前部署中启用")
+            raise ValueError(f"平台 '{platform}' 暂不支持")
+
+        return adapter, platform
+
     @staticmethod
     def extract_news(url: str, platform: Optional[str] = None) -> tuple[NewsItem, str]:
         """
@@ -52,22 +242,55 @@ class ExtractorService:
 
         Raises:
             ValueError: 如果平台不支持或 URL 无效
+            CircuitOpenError: 平台处于熔断状态
         """
-        # 自动检测平台
-        if platform is None:
-            platform = detect_platform(url)
+        adapter, platform = ExtractorService._resolve_adapter(url, platform)
 
-        if platform is None:
-            raise ValueError("无法识别该平台，请检查 URL 是否正确")
+        # 提取数据（优先读取结果缓存，并发的相同请求合并为一次提取）
+        try:
+            crawler = adapter.build_crawler(url)
+            key = ExtractorService._cache_key(url, platform)
+            news_item = RESULT_CACHE.get(key) if RESULT_CACHE is not None else None
+            if news_item is None:
+                load = lambda: ExtractorService._load(adapter, crawler, url, key)
+                news_item = SINGLE_FLIGHT.do(key, load) if SINGLE_FLIGHT is not None else load()
+            return news_item, platform
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            raise ValueError(f"提取失败: {str(e)}")
 
-        # 获取适配器
-        adapter = ADAPTERS.get(platform)
-        if adapter is None:
-            raise ValueError(f"平台 '{platform}' 暂不支持")
+    @staticmethod
+    async def aextract_news(url: str, platform: Optional[str] = None) -> tuple[NewsItem, str]:
+        """
+        异步提取新闻内容，语义与 extract_news 相同，但不会阻塞事件循环
+
+        Args:
+            url: 新闻链接
+            platform: 指定平台（可选，如果不指定则自动检测）
+
+        Returns:
+            (NewsItem, platform_name): 提取的新闻数据和平台名称
+
+        Raises:
+            ValueError: 如果平台不支持或 URL 无效
+            CircuitOpenError: 平台处于熔断状态
+            ExecutorSaturated: 解析线程池排队已满
+        """
+        adapter, platform = ExtractorService._resolve_adapter(url, platform)
 
-        # 提取数据
         try:
-            news_item = adapter.extract(url)
+            crawler = adapter.build_crawler(url)
+            key = ExtractorService._cache_key(url, platform)
+            news_item = await RESULT_CACHE.aget(key) if RESULT_CACHE is not None else None
+            if news_item is None:
+                load = lambda: ExtractorService._aload(adapter, crawler, url, key)
+                if ASYNC_SINGLE_FLIGHT is not None:
+                    news_item = await ASYNC_SINGLE_FLIGHT.do(key, load)
+                else:
+                    news_item = await load()
             return news_item, platform
+        except (CircuitOpenError, ExecutorSaturated):
+            raise
         except Exception as e:
             raise ValueError(f"提取失败: {str(e)}")
@@ -2,7 +2,9 @@
 """
 格式化服务 - 将 NewsItem 转换为 Markdown
 """
-from ..models import NewsItem
+from news_crawler.core import run_in_parse_executor
+
+from ..models import ContentType, NewsItem
 
 
 def to_markdown(news_item: NewsItem) -> str:
@@ -23,24 +25,24 @@ def to_markdown(news_item: NewsItem) -> str:
     # 元信息
     meta = news_item.meta_info
     md_lines.append("## 文章信息\n")
-    if meta.get("author_name"):
-        md_lines.append(f"**作者**: {meta['author_name']}  ")
-    if meta.get("publish_time"):
-        md_lines.append(f"**发布时间**: {meta['publish_time']}  ")
+    if meta.author_name:
+        md_lines.append(f"**作者**: {meta.author_name}  ")
+    if meta.publish_time:
+        md_lines.append(f"**发布时间**: {meta.publish_time}  ")
     md_lines.append(f"**原文链接**: [{news_item.news_url}]({news_item.news_url})\n")
     md_lines.append("---\n")
 
     # 正文内容
     md_lines.append("## 正文内容\n")
     for content in news_item.contents:
-        content_type = content.get("type", "text")
-        content_text = content.get("content", "")
+        content_type = content.type
+        content_text = content.content
 
-        if content_type == "text":
+        if content_type == ContentType.TEXT:
             md_lines.append(f"{content_text}\n")
-        elif content_type == "image":
+        elif content_type == ContentType.IMAGE:
             md_lines.append(f"![图片]({content_text})\n")
-        elif content_type == "video":
+        elif content_type == ContentType.VIDEO:
             md_lines.append(f"[🎬 视频]({content_text})\n")
 
     # 媒体资源统计
@@ -59,3 +61,8 @@ def to_markdown(news_item: NewsItem) -> str:
                 md_lines.append(f"{idx}. {video_url}\n")
 
     return "\n".join(md_lines)
+
+
+async def ato_markdown(news_item: NewsItem) -> str:
+    """在解析线程池中生成 Markdown，长文章不会阻塞事件循环"""
+    return await run_in_parse_executor(to_markdown, news_item)
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+单飞（single-flight）请求合并 - 同一个键的并发调用只执行一次，所有调用方共享结果或异常
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _FlightStats:
+    """合并统计：leaders 为真正执行的次数，coalesced 为被合并的等待者数量"""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+        self.max_waiters = 0
+
+    def snapshot(self, inflight: int) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "max_waiters": self.max_waiters,
+                "inflight": inflight,
+            }
+
+
+class SingleFlight:
+    """同步版本：适用于线程池中的并发调用"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "tuple[Future, list[int]]"] = {}
+        self._stats = _FlightStats()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """执行 fn；若同一个键已有调用在进行中，则等待并返回它的结果"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = (Future(), [0])
+            future, waiters = call
+            if not leader:
+                waiters[0] += 1
+                with self._stats.lock:
+                    self._stats.coalesced += 1
+                    self._stats.max_waiters = max(self._stats.max_waiters, waiters[0])
+        if not leader:
+            return future.result()
+
+        with self._stats.lock:
+            self._stats.leaders += 1
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._stats.snapshot(len(self._calls))
+
+
+class AsyncSingleFlight:
+    """
+    异步版本：适用于同一个事件循环上的并发协程
+
+    真正的执行放在独立的任务中，某个调用方被取消（如批量超时）不会中断其他等待者共享的执行。
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self._stats = _FlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """执行 fn；若同一个键已有调用在进行中，则等待并返回它的结果"""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done: self._release(key, done))
+            with self._stats.lock:
+                self._stats.leaders += 1
+        else:
+            self._waiters[key] += 1
+            with self._stats.lock:
+                self._stats.coalesced += 1
+                self._stats.max_waiters = max(self._stats.max_waiters, self._waiters[key])
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+            self._waiters.pop(key, None)
+        if not task.cancelled():
+            # 所有等待者都已取消时，避免 "exception was never retrieved" 警告
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._stats.snapshot(len(self._tasks))
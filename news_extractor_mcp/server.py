@@ -3,22 +3,26 @@
 Streamable HTTP entry-point for the News Extractor MCP server.
 """
 
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Literal, Sequence
 from urllib.parse import urlparse
 
 import click
-from anyio import to_thread
 from mcp.server.fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 import uvicorn
 
 try:
-    from news_extractor_core.models import NewsItem
+    from news_extractor_core import config as core_config
+    from news_extractor_core.models import NewsItem, dump_news_item
     from news_extractor_core.services import (
+        BatchExtractor,
         ExtractorService,
         detect_platform,
+        ato_markdown,
         get_supported_platforms,
         to_markdown,
     )
@@ -26,10 +30,13 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for local runs
     import sys
 
     sys.path.append(str(Path(__file__).resolve().parents[1]))
-    from news_extractor_core.models import NewsItem
+    from news_extractor_core import config as core_config
+    from news_extractor_core.models import NewsItem, dump_news_item
     from news_extractor_core.services import (
+        BatchExtractor,
         ExtractorService,
         detect_platform,
+        ato_markdown,
         get_supported_platforms,
         to_markdown,
     )
@@ -65,10 +72,7 @@ def _normalize_output_format(value: str | None) -> str:
 
 
 async def _extract(url: str) -> tuple[NewsItem, str]:
-    def run() -> tuple[NewsItem, str]:
-        return ExtractorService.extract_news(url)
-
-    return await to_thread.run_sync(run)
+    return await ExtractorService.aextract_news(url)
 
 
 def _build_news_payload(
@@ -82,7 +86,7 @@ def _build_news_payload(
         "status": "success",
         "url": url,
         "platform": platform,
-        "data": news.to_dict(),
+        "data": dump_news_item(news),
     }
     if include_markdown:
         payload["markdown"] = to_markdown(news)
@@ -105,8 +109,8 @@ async def extract_news(url: str, output_format: str = "json") -> str | dict[str,
     news, platform = await _extract(normalized_url)
 
     if normalized_format == "markdown":
-        # 直接返回 markdown 文本
-        return to_markdown(news)
+        # 直接返回 markdown 文本（在解析线程池中生成）
+        return await ato_markdown(news)
     else:
         # 返回 JSON 结构
         return _build_news_payload(
@@ -121,30 +125,64 @@ async def extract_news(url: str, output_format: str = "json") -> str | dict[str,
     name="batch_extract_news",
     title="批量提取新闻",
     description=(
-        "依次抓取多个新闻链接，返回成功/失败统计。\n"
+        "并发抓取多个新闻链接，结果保持输入顺序，并返回成功/失败统计及每个链接的耗时。\n"
         "参数：\n"
         "- urls: 新闻链接列表\n"
-        "- output_format: 输出格式，'json'（返回结构化JSON数据）或 'markdown'（返回合并的Markdown文本），默认为 'json'"
+        "- output_format: 输出格式，'json'（返回结构化JSON数据）或 'markdown'（返回合并的Markdown文本），默认为 'json'\n"
+        f"- max_concurrency: 全局最大并发数，默认 {core_config.BATCH_CONCURRENCY}，最大 {core_config.BATCH_MAX_CONCURRENCY}\n"
+        f"- per_platform_concurrency: 单个平台最大并发数，默认 {core_config.BATCH_PER_PLATFORM_CONCURRENCY}，"
+        f"最大 {core_config.BATCH_MAX_PER_PLATFORM_CONCURRENCY}\n"
+        "- max_concurrency/per_platform_concurrency 小于 1 时按 1 处理\n"
+        f"- timeout: 单个链接的超时时间（秒），须大于 0，默认 {core_config.BATCH_TIMEOUT:g}\n"
+        "- deadline: 整个批次的截止时间（秒），须大于 0，超时后未完成的链接记为失败，默认不限制"
     ),
 )
-async def batch_extract_news(urls: list, output_format: str = "json") -> str | dict[str, Any]:
+async def batch_extract_news(
+    urls: list,
+    output_format: str = "json",
+    max_concurrency: int = core_config.BATCH_CONCURRENCY,
+    per_platform_concurrency: int = core_config.BATCH_PER_PLATFORM_CONCURRENCY,
+    timeout: float = core_config.BATCH_TIMEOUT,
+    deadline: float | None = None,
+) -> str | dict[str, Any]:
     if not urls:
         raise ValueError("请提供至少一个 URL")
 
+    if timeout <= 0:
+        raise ValueError("timeout 必须大于 0 秒")
+    if deadline is not None and deadline <= 0:
+        raise ValueError("deadline 必须大于 0 秒")
+
     normalized_format = _normalize_output_format(output_format)
 
+    async def extract(raw: Any) -> tuple[NewsItem, str]:
+        return await _extract(_normalize_url(raw))
+
+    # 并发数限制在 1 到配置上限之间
+    extractor = BatchExtractor(
+        concurrency=max(1, min(max_concurrency, core_config.BATCH_MAX_CONCURRENCY)),
+        per_platform_concurrency=max(
+            1, min(per_platform_concurrency, core_config.BATCH_MAX_PER_PLATFORM_CONCURRENCY)
+        ),
+        timeout=timeout,
+        deadline=deadline,
+        extract=extract,
+    )
+    started = time.perf_counter()
+    batch = await extractor.run(urls)
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+
     results: list[dict[str, Any]] = []
     markdown_parts: list[str] = []
     success = 0
 
-    for raw in urls:
-        try:
-            normalized_url = _normalize_url(raw)
-            news, platform = await _extract(normalized_url)
-
+    for item in batch:
+        if item.ok:
+            news, platform = item.news_item, item.platform
+            normalized_url = item.url.strip()
             if normalized_format == "markdown":
                 # 收集 markdown 内容
-                markdown_parts.append(f"## {news.title}\n\n**来源**: {normalized_url}\n**平台**: {platform}\n\n{to_markdown(news)}\n\n---\n")
+                markdown_parts.append(f"## {news.title}\n\n**来源**: {normalized_url}\n**平台**: {platform}\n**耗时**: {item.elapsed_ms} ms\n\n{to_markdown(news)}\n\n---\n")
             else:
                 # 收集 JSON 数据
                 payload = _build_news_payload(
@@ -153,23 +191,25 @@ async def batch_extract_news(urls: list, output_format: str = "json") -> str | d
                     url=normalized_url,
                     include_markdown=False,
                 )
+                payload["elapsed_ms"] = item.elapsed_ms
                 results.append(payload)
             success += 1
-        except Exception as exc:
+        else:
             if normalized_format == "markdown":
-                markdown_parts.append(f"## ❌ 提取失败\n\n**URL**: {raw}\n**错误**: {str(exc)}\n\n---\n")
+                markdown_parts.append(f"## ❌ 提取失败\n\n**URL**: {item.url}\n**错误**: {str(item.error)}\n**耗时**: {item.elapsed_ms} ms\n\n---\n")
             else:
                 results.append(
                     {
                         "status": "error",
-                        "url": str(raw),
-                        "message": str(exc),
+                        "url": item.url,
+                        "message": str(item.error),
+                        "elapsed_ms": item.elapsed_ms,
                     }
                 )
 
     if normalized_format == "markdown":
         # 返回合并的 markdown 文本
-        header = f"# 批量提取结果\n\n总计: {len(urls)} | 成功: {success} | 失败: {len(urls) - success}\n\n---\n\n"
+        header = f"# 批量提取结果\n\n总计: {len(urls)} | 成功: {success} | 失败: {len(urls) - success} | 耗时: {elapsed_ms} ms\n\n---\n\n"
         return header + "\n".join(markdown_parts)
     else:
         # 返回 JSON 结构
@@ -178,6 +218,7 @@ async def batch_extract_news(urls: list, output_format: str = "json") -> str | d
             "total": len(results),
             "successful": success,
             "failed": len(results) - success,
+            "elapsed_ms": elapsed_ms,
             "results": results,
         }
 
@@ -230,7 +271,30 @@ def platforms_resource() -> str:
 
 @mcp.custom_route("/health", methods=["GET"])
 async def health(_: Request) -> Response:
-    return JSONResponse({"status": "ok", "name": SERVER_NAME})
+    # 有平台熔断时 status 为 degraded，但仍返回 200：服务本身可用，其他平台不受影响
+    health = ExtractorService.health()
+    status = "ok" if health.pop("status") == "healthy" else "degraded"
+    return JSONResponse({"status": status, "name": SERVER_NAME, **health})
+
+
+@mcp.custom_route("/stats", methods=["GET"])
+async def stats(_: Request) -> Response:
+    return JSONResponse({"status": "ok", "stats": ExtractorService.stats()})
+
+
+def _with_extractor_lifespan(inner):
+    """在 MCP 自身的 lifespan 外层管理提取服务的连接池"""
+
+    @asynccontextmanager
+    async def lifespan(app):
+        ExtractorService.startup()
+        try:
+            async with inner(app):
+                yield
+        finally:
+            await ExtractorService.ashutdown()
+
+    return lifespan
 
 
 @click.command()
@@ -248,6 +312,7 @@ def main(host: str, port: int, path: str) -> None:
     """
     mcp.settings.streamable_http_path = path
     app = mcp.streamable_http_app()
+    app.router.lifespan_context = _with_extractor_lifespan(app.router.lifespan_context)
     uvicorn.run(app, host=host, port=port, log_level="info")
 
 
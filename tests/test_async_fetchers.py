@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from news_crawler.core import AsyncCurlCffiFetcher, AsyncRequestsFetcher, AsyncSessionPool, FetchRequest, PoolConfig
+from news_crawler.core.fetchers import _create_async_curl_session, _create_httpx_client
+
+
+def test_shared_async_client_does_not_leak_cookies_between_requests():
+    seen = {}
+
+    def handler(request):
+        name = request.url.path.strip("/")
+        seen[name] = request.headers.get("cookie")
+        return httpx.Response(200, text=name, headers={"set-cookie": f"session={name}; Path=/"})
+
+    def factory(config: PoolConfig):
+        client = _create_httpx_client(config)
+        client._transport = httpx.MockTransport(handler)
+        return client
+
+    fetcher = AsyncRequestsFetcher()
+    fetcher.pool = AsyncSessionPool(factory)
+
+    async def main():
+        await fetcher.afetch(FetchRequest(url="https://cookies.example/first", cookies={"token": "abc"}))
+        await asyncio.gather(
+            *(fetcher.afetch(FetchRequest(url=f"https://cookies.example/{name}")) for name in ("a", "b", "c"))
+        )
+        jar = list(fetcher.pool.get().cookies.jar)
+        await fetcher.pool.aclose()
+        return jar
+
+    assert asyncio.run(main()) == []
+    assert seen == {"first": "token=abc", "a": None, "b": None, "c": None}
+
+
+def test_shared_curl_session_does_not_leak_cookies_between_requests():
+    pytest.importorskip("curl_cffi")
+    seen = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.append(self.headers.get("Cookie"))
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=leak; Path=/")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    fetcher = AsyncCurlCffiFetcher()
+    fetcher.pool = AsyncSessionPool(_create_async_curl_session)
+
+    async def main():
+        await fetcher.afetch(FetchRequest(url=url, cookies={"token": "abc"}))
+        await asyncio.gather(*(fetcher.afetch(FetchRequest(url=url)) for _ in range(3)))
+        jar = list(fetcher.pool.get().cookies.jar)
+        await fetcher.pool.aclose()
+        return jar
+
+    try:
+        assert asyncio.run(main()) == []
+    finally:
+        server.shutdown()
+    assert seen == ["token=abc", None, None, None]
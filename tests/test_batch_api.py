@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+import pytest
+from pydantic import ValidationError
+
+from news_extractor_backend.api.extract import BatchExtractRequest
+from news_extractor_core import config
+
+
+def test_concurrency_is_capped_by_config():
+    request = BatchExtractRequest(urls=["https://example.com/a"], concurrency=config.BATCH_MAX_CONCURRENCY)
+    assert request.concurrency == config.BATCH_MAX_CONCURRENCY
+    with pytest.raises(ValidationError):
+        BatchExtractRequest(urls=["https://example.com/a"], concurrency=config.BATCH_MAX_CONCURRENCY + 1)
+    with pytest.raises(ValidationError):
+        BatchExtractRequest(
+            urls=["https://example.com/a"],
+            per_platform_concurrency=config.BATCH_MAX_PER_PLATFORM_CONCURRENCY + 1,
+        )
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from news_crawler.core import ExecutorSaturated
+from news_extractor_core.services.breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreakers,
+    CircuitOpenError,
+    counts_as_failure,
+)
+
+
+class _HttpError(Exception):
+    def __init__(self, status_code):
+        super().__init__(status_code)
+        self.status_code = status_code
+
+
+def _open_breakers() -> CircuitBreakers:
+    breakers = CircuitBreakers(min_calls=2, failure_rate=0.5, open_seconds=0.0)
+    for _ in range(2):
+        probe = breakers.before_call("p")
+        breakers.record("p", RuntimeError("boom"), probe)
+    assert breakers.get("p").state == OPEN
+    return breakers
+
+
+def test_failures_open_the_circuit():
+    breakers = CircuitBreakers(min_calls=2, failure_rate=0.5, open_seconds=60.0)
+    for _ in range(2):
+        breakers.record("p", RuntimeError("boom"), breakers.before_call("p"))
+    with pytest.raises(CircuitOpenError) as info:
+        breakers.before_call("p")
+    assert info.value.platform == "p"
+
+
+def test_ignored_errors_do_not_count():
+    assert not counts_as_failure(_HttpError(404))
+    assert not counts_as_failure(ExecutorSaturated("parse", 1))
+    assert not counts_as_failure(asyncio.CancelledError())
+    assert not counts_as_failure(KeyboardInterrupt())
+    assert counts_as_failure(_HttpError(503))
+
+
+def test_successful_probe_closes_the_circuit():
+    breakers = _open_breakers()
+    probe = breakers.before_call("p")
+    assert probe and breakers.get("p").state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breakers.before_call("p")
+    breakers.record("p", None, probe)
+    assert breakers.get("p").state == CLOSED
+
+
+def test_cancelled_probe_releases_its_slot():
+    breakers = _open_breakers()
+    probe = breakers.before_call("p")
+    breakers.release("p", probe)
+    assert breakers.get("p").state == HALF_OPEN
+    # The slot is free again and the cancellation was not recorded as a failure.
+    assert breakers.before_call("p") is True
+
+
+def test_cancelled_extraction_is_not_a_platform_failure(monkeypatch):
+    from news_extractor_core.services import extractor
+
+    breakers = _open_breakers()
+    monkeypatch.setattr(extractor, "CIRCUIT_BREAKERS", breakers)
+    monkeypatch.setattr(extractor, "RESULT_CACHE", None)
+
+    class _SlowAdapter:
+        async def aextract(self, url, crawler):
+            await asyncio.sleep(60)
+
+    async def main():
+        task = asyncio.create_task(extractor.ExtractorService._aload(_SlowAdapter(), None, "u", ("p", "u")))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert breakers.get("p").state == HALF_OPEN
+    assert breakers.before_call("p") is True
+
+
+def test_overload_on_a_half_open_probe_is_neutral():
+    breakers = _open_breakers()
+    probe = breakers.before_call("p")
+    assert probe and breakers.get("p").state == HALF_OPEN
+    breakers.record("p", ExecutorSaturated("parse", 4), probe)
+    # Local load shedding says nothing about the platform: still half open,
+    # and the probe slot is free for the next call.
+    assert breakers.get("p").state == HALF_OPEN
+    probe = breakers.before_call("p")
+    assert probe
+    breakers.record("p", None, probe)
+    assert breakers.get("p").state == CLOSED
+
+
+def test_neutral_outcomes_do_not_dilute_the_failure_rate():
+    breakers = CircuitBreakers(min_calls=4, failure_rate=0.5, open_seconds=60.0)
+    for exc in (_HttpError(404), ExecutorSaturated("parse", 4), _HttpError(410)):
+        breakers.record("p", exc, breakers.before_call("p"))
+    assert breakers.get("p").snapshot()["calls"] == 0
+    for _ in range(2):
+        breakers.record("p", None, breakers.before_call("p"))
+    for _ in range(2):
+        breakers.record("p", RuntimeError("boom"), breakers.before_call("p"))
+    assert breakers.get("p").state == OPEN
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from news_crawler.core import canonical_url
+from news_crawler.detik_news import DetikNewsCrawler
+from news_crawler.naver_news import NaverNewsCrawler
+from news_extractor_core.services.extractor import ExtractorService
+
+
+def test_scheme_host_and_tracking_params_are_normalized():
+    assert canonical_url("http://News.Detik.com/internasional/d-7626006/slug/?utm_source=x#top") == (
+        "https://news.detik.com/internasional/d-7626006/slug"
+    )
+    assert canonical_url("https://www.toutiao.com/article/7404384826024935990/?log_from=abc") == canonical_url(
+        "https://www.toutiao.com/article/7404384826024935990"
+    )
+
+
+def test_significant_query_params_are_kept_and_sorted():
+    first = canonical_url("https://mp.weixin.qq.com/s?mid=2&__biz=MzA&idx=1&sn=abc")
+    second = canonical_url("https://mp.weixin.qq.com/s?__biz=MzA&idx=1&mid=2&sn=abc&spm=1")
+    assert first == second
+    assert canonical_url("https://mp.weixin.qq.com/s?__biz=MzA&mid=3") != first
+
+
+def test_http_and_https_share_a_key():
+    http = ExtractorService._cache_key("http://news.detik.com/berita/d-1/a", "detik")
+    https = ExtractorService._cache_key("https://news.detik.com/berita/d-1/a", "detik")
+    assert http == https
+
+
+def test_distinct_articles_do_not_collide():
+    urls = [
+        "http://news.detik.com/berita/d-1/a",
+        "http://news.detik.com/berita/d-2/b",
+        "https://n.news.naver.com/mnews/article/001/0014567890",
+        "https://n.news.naver.com/mnews/article/023/0014567890",
+        "https://blog.naver.com/alice/223456789012",
+        "https://blog.naver.com/bob/223456789012",
+    ]
+    keys = {ExtractorService._cache_key(url, "any") for url in urls}
+    assert len(keys) == len(urls)
+
+
+def test_detik_article_id_ignores_scheme():
+    for url in (
+        "http://news.detik.com/internasional/d-7626006/5-pernyataan",
+        "https://news.detik.com/internasional/d-7626006/5-pernyataan/?tag=x",
+    ):
+        assert DetikNewsCrawler(url, save_path=None).get_article_id() == "d-7626006"
+
+
+def test_naver_article_id_keeps_blog_id():
+    alice = NaverNewsCrawler("https://blog.naver.com/alice/223456789012", save_path=None)
+    bob = NaverNewsCrawler("https://blog.naver.com/PostView.naver?blogId=bob&logNo=223456789012", save_path=None)
+    assert alice.get_article_id() == "alice_223456789012"
+    assert bob.get_article_id() == "bob_223456789012"
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import importlib
+
+from news_extractor_core import config
+
+
+def test_image_cache_is_created_in_the_lifespan_only(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "IMAGE_CACHE_ENABLED", True)
+    monkeypatch.setattr(config, "IMAGE_CACHE_DIR", str(tmp_path / "image_cache"))
+    proxy = importlib.import_module("news_extractor_backend.api.proxy")
+    assert proxy.IMAGE_CACHE is None
+    assert list(tmp_path.iterdir()) == []
+
+    proxy.startup()
+    try:
+        assert proxy.IMAGE_CACHE is not None
+        assert (tmp_path / "image_cache").is_dir()
+    finally:
+        asyncio.run(proxy.aclose_clients())
+    assert proxy.IMAGE_CACHE is None
+
+
+def test_transform_source_larger_than_the_limit_is_rejected(monkeypatch):
+    import httpx
+    import pytest
+    from fastapi import HTTPException
+
+    from news_crawler.core import AsyncSessionPool
+
+    proxy = importlib.import_module("news_extractor_backend.api.proxy")
+
+    async def chunks():
+        for _ in range(8):
+            yield b"x" * 1024
+
+    def handler(request):
+        # Chunked response without Content-Length: the limit is enforced while streaming.
+        return httpx.Response(200, content=chunks(), headers={"content-type": "image/png"})
+
+    clients = AsyncSessionPool(lambda _: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(proxy, "CLIENTS", clients)
+    monkeypatch.setattr(proxy, "IMAGE_CACHE", None)
+    monkeypatch.setattr(config, "IMAGE_CACHE_MAX_OBJECT_BYTES", 4096)
+
+    async def main():
+        try:
+            with pytest.raises(HTTPException) as info:
+                await proxy._load_original("https://img.example.com/a.png", "img.example.com")
+            assert proxy._limiter("img.example.com").in_flight == 0
+            return info.value.status_code
+        finally:
+            await clients.aclose()
+
+    assert asyncio.run(main()) == 413
+
+
+def test_host_limiters_are_bounded_and_only_idle_hosts_are_evicted(monkeypatch):
+    proxy = importlib.import_module("news_extractor_backend.api.proxy")
+    monkeypatch.setattr(proxy, "MAX_TRACKED_HOSTS", 4)
+    monkeypatch.setattr(proxy, "_limiters", type(proxy._limiters)())
+
+    busy = proxy._Upstream(proxy._limiter("busy.example"), deadline=0.0)
+    for index in range(10):
+        upstream = proxy._Upstream(proxy._limiter(f"img{index}.example"), deadline=0.0)
+        asyncio.run(upstream.aclose())
+
+    assert len(proxy._limiters) == 4
+    assert "busy.example" in proxy._limiters
+    assert "img9.example" in proxy._limiters
+
+    asyncio.run(busy.aclose())
+    assert proxy._limiters["busy.example"].users == 0
+
+
+def test_cached_image_evicted_before_send_is_treated_as_a_miss(tmp_path):
+    from starlette.requests import Request
+
+    from news_extractor_backend.image_cache import ImageCache
+
+    proxy = importlib.import_module("news_extractor_backend.api.proxy")
+    cache = ImageCache(tmp_path / "image_cache")
+    writer = cache.writer("https://img.example.com/a.png", "image/png")
+    writer.write(b"png")
+    writer.commit()
+    request = Request({"type": "http", "method": "GET", "headers": []})
+    try:
+        cached = cache.get("https://img.example.com/a.png")
+        cached.path.unlink()
+        assert proxy._serve_cached(request, cached) is None
+
+        writer = cache.writer("https://img.example.com/b.png", "image/png")
+        writer.write(b"png!")
+        served = proxy._serve_cached(request, writer.commit())
+        assert served.status_code == 200
+        assert served.headers["content-length"] == "4"
+        asyncio.run(served.background())
+    finally:
+        cache.close()
+
+
+def test_image_cache_budget_counts_blobs_written_by_other_processes(tmp_path):
+    from news_extractor_backend.image_cache import ImageCache
+
+    first = ImageCache(tmp_path / "image_cache", max_bytes=100)
+    second = ImageCache(tmp_path / "image_cache", max_bytes=100)
+    try:
+        for index, cache in enumerate((first, second, first, second)):
+            writer = cache.writer(f"https://img.example.com/{index}.png", "image/png")
+            writer.write(bytes([index]) * 40)
+            writer.commit()
+        assert first.stats()["bytes"] <= 100
+        assert second.stats()["bytes"] <= 100
+    finally:
+        first.close()
+        second.close()
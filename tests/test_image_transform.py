@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import io
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from news_extractor_backend import image_transform
+from news_extractor_backend.image_transform import ImageTransformer, ImageTransformError, TransformSpec
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png(width: int, height: int) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (width, height)).save(output, "PNG")
+    return output.getvalue()
+
+
+def test_oversized_images_are_rejected_before_decoding(monkeypatch):
+    monkeypatch.setattr(image_transform, "MAX_PIXELS", 100)
+    with pytest.raises(ImageTransformError):
+        image_transform.transform_image(_png(20, 20), TransformSpec(width=5))
+    data, content_type = image_transform.transform_image(_png(10, 10), TransformSpec(width=5))
+    assert content_type == "image/jpeg" and data
+
+
+class _BrokenExecutor:
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_broken_pool_is_replaced():
+    transformer = ImageTransformer(workers=1)
+    broken = transformer._executor = _BrokenExecutor()
+    try:
+        data, _ = asyncio.run(transformer.atransform(_png(10, 10), TransformSpec(width=5)))
+    finally:
+        transformer.shutdown()
+    assert data
+    assert broken.shut_down
+    assert transformer.stats()["restarts"] == 1
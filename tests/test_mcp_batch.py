@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from news_extractor_mcp import server
+
+
+class _RecordingExtractor:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        _RecordingExtractor.last = self
+
+    async def run(self, urls):
+        return []
+
+
+def test_batch_concurrency_is_clamped_to_at_least_one(monkeypatch):
+    monkeypatch.setattr(server, "BatchExtractor", _RecordingExtractor)
+    asyncio.run(server.batch_extract_news(["https://example.com/a"], max_concurrency=0, per_platform_concurrency=-3))
+    assert _RecordingExtractor.last.kwargs["concurrency"] == 1
+    assert _RecordingExtractor.last.kwargs["per_platform_concurrency"] == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"timeout": 0}, {"timeout": -1}, {"deadline": 0}])
+def test_batch_rejects_non_positive_timeouts(monkeypatch, kwargs):
+    monkeypatch.setattr(server, "BatchExtractor", _RecordingExtractor)
+    with pytest.raises(ValueError, match="必须大于 0"):
+        asyncio.run(server.batch_extract_news(["https://example.com/a"], **kwargs))
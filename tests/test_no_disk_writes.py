@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""The API path (adapter.build_crawler + extract) must not touch the filesystem."""
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from benchmarks.parse_benchmark import load_manifest
+from news_extractor_core.adapters.registry import AdapterRegistry
+
+FIXTURES = {platform: fixtures[0] for platform, fixtures in load_manifest().items()}
+NAVER_FRAME = '<iframe id="mainFrame" src="/PostView.naver?blogId=sample&logNo=1"></iframe>'
+
+
+class _StubFetcher:
+    """Serves the recorded fixture; Naver first asks for the page hosting the iframe."""
+
+    def __init__(self, html: str):
+        self.html = html
+        self.requests = []
+
+    def fetch(self, request):
+        self.requests.append(request.url)
+        if "blog.naver.com" in request.url and "PostView" not in request.url:
+            return NAVER_FRAME
+        return self.html
+
+    async def afetch(self, request):
+        return self.fetch(request)
+
+
+def _forbid(*args, **kwargs):
+    raise AssertionError(f"filesystem write during extraction: {args}")
+
+
+@pytest.fixture
+def no_disk(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tempfile, "mkdtemp", _forbid)
+    monkeypatch.setattr(tempfile, "mkstemp", _forbid)
+    monkeypatch.setattr(os, "makedirs", _forbid)
+    monkeypatch.setattr(os, "mkdir", _forbid)
+    monkeypatch.setattr(Path, "mkdir", _forbid)
+    monkeypatch.setattr(Path, "write_text", _forbid)
+    monkeypatch.setattr(Path, "write_bytes", _forbid)
+    yield tmp_path
+    assert list(tmp_path.iterdir()) == []
+
+
+def _crawler(platform: str):
+    fixture = FIXTURES[platform]
+    adapter = AdapterRegistry(use_entry_points=False).get(platform)
+    crawler = adapter.build_crawler(fixture.url)
+    assert crawler.save_path is None
+    stub = _StubFetcher(fixture.path.read_text(encoding="utf-8"))
+    crawler.fetcher = crawler.async_fetcher = stub
+    return adapter, crawler, fixture, stub
+
+
+@pytest.mark.parametrize("platform", sorted(FIXTURES))
+def test_extract_creates_nothing_on_disk(platform, no_disk):
+    adapter, crawler, fixture, stub = _crawler(platform)
+    news_item = adapter.extract(fixture.url, crawler)
+    assert news_item.title and stub.requests
+
+
+@pytest.mark.parametrize("platform", sorted(FIXTURES))
+def test_aextract_creates_nothing_on_disk(platform, no_disk):
+    adapter, crawler, fixture, stub = _crawler(platform)
+    news_item = asyncio.run(adapter.aextract(fixture.url, crawler))
+    assert news_item.title and stub.requests
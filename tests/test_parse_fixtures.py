@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from benchmarks.parse_benchmark import check_expected, create_crawler, load_manifest
+
+FIXTURES = [fixture for fixtures in load_manifest().values() for fixture in fixtures]
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=[fixture.file for fixture in FIXTURES])
+def test_fixture_parses_to_the_recorded_result(fixture):
+    html = fixture.path.read_text(encoding="utf-8")
+    news_item = create_crawler(fixture.platform, fixture.url).parse_content(html)
+    assert check_expected(fixture, news_item) is None
+    assert news_item.texts
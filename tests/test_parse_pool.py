@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import pytest
+
+from news_crawler.core import NewsItem, ProcessParsePool
+from news_crawler.detik_news import DetikNewsCrawler
+
+URL = "https://news.detik.com/berita/d-1/a"
+
+
+class _FakeExecutor:
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.submitted = []
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        if self.broken:
+            raise BrokenProcessPool("worker died")
+        future = Future()
+        future.set_running_or_notify_cancel()
+        self.submitted.append((future, args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def _pool(executor) -> ProcessParsePool:
+    pool = ProcessParsePool(workers=1, shared_memory_threshold=1)
+    pool._executor = executor
+    return pool
+
+
+def test_cancelled_caller_keeps_slot_and_shared_memory_until_the_job_ends():
+    executor = _FakeExecutor()
+    pool = _pool(executor)
+    crawler = DetikNewsCrawler(URL, save_path=None)
+
+    async def main():
+        task = asyncio.create_task(pool.aparse(crawler, "<html>" + "x" * 1024 + "</html>"))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    future, args = executor.submitted[0]
+    block_name = args[-1][0]
+    # The worker is still reading the document: nothing may be released yet.
+    assert pool.stats()["pending"] == 1
+    shared_memory.SharedMemory(name=block_name).close()
+
+    future.set_result((NewsItem(title="t", news_url=URL), 0.01))
+    assert pool.stats()["pending"] == 0
+    assert pool.stats()["completed"] == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=block_name)
+
+
+def test_broken_pool_is_recreated_on_submit(monkeypatch):
+    broken = _FakeExecutor(broken=True)
+    replacement = _FakeExecutor()
+    pool = _pool(broken)
+    monkeypatch.setattr(pool, "_get_executor", lambda: pool._executor or replacement)
+    future = pool._submit(DetikNewsCrawler(URL, save_path=None), "<html></html>")
+    assert broken.shut_down
+    assert replacement.submitted and pool.stats()["restarts"] == 1
+    future.set_result((NewsItem(title="t", news_url=URL), 0.0))
+    assert pool.stats()["pending"] == 0
+
+
+def test_worker_crash_discards_the_pool():
+    executor = _FakeExecutor()
+    pool = _pool(executor)
+    future = pool._submit(DetikNewsCrawler(URL, save_path=None), "<html></html>")
+    future.set_exception(BrokenProcessPool("worker died"))
+    assert executor.shut_down
+    assert pool._executor is None
+    assert pool.stats()["failed"] == 1 and pool.stats()["pending"] == 0
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import threading
+
+from news_crawler.core import CrawlPipeline
+
+
+class _Crawler:
+    def __init__(self, url):
+        self.url = url
+
+    async def afetch_content(self):
+        return "<html></html>"
+
+    async def aparse_content(self, html):
+        return self.url
+
+
+def test_sync_resolver_and_skip_if_run_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    threads = []
+    stored = []
+
+    def resolver(record):
+        threads.append(threading.get_ident())
+        return _Crawler(record.url)
+
+    def skip_if(crawler):
+        threads.append(threading.get_ident())
+        return crawler.url.endswith("/seen")
+
+    pipeline = CrawlPipeline(
+        resolver=resolver,
+        sink=lambda crawler, item: stored.append(item),
+        skip_if=skip_if,
+        validate=False,
+        report_interval=0,
+        politeness=None,
+    )
+    snapshot = pipeline.run(["https://news.example/a/1", "https://news.example/seen"])
+    assert loop_thread not in threads and len(threads) == 4
+    assert snapshot["stages"]["fetch"]["skipped"] == 1
+    assert stored == ["https://news.example/a/1"]
+
+
+def test_async_resolver_and_skip_if_are_awaited():
+    async def resolver(record):
+        return _Crawler(record.url)
+
+    class _SeenStore:
+        async def __call__(self, crawler):
+            return False
+
+    pipeline = CrawlPipeline(
+        resolver=resolver,
+        sink=lambda crawler, item: None,
+        skip_if=_SeenStore(),
+        validate=False,
+        report_interval=0,
+        politeness=None,
+    )
+    assert pipeline.run(["https://news.example/a/1"])["stages"]["sink"]["completed"] == 1
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import time
+
+import httpx
+import pytest
+
+from news_crawler.core import (
+    AsyncRequestsFetcher,
+    AsyncSessionPool,
+    CrawlPipeline,
+    FetchRequest,
+    FetchResponse,
+    HostPolicy,
+    PolitenessScheduler,
+    configure_politeness,
+    get_politeness,
+)
+from news_crawler.core.fetchers import _create_httpx_client
+
+
+def _response(status_code: int, text: str = "", url: str = "https://news.example/a/1") -> FetchResponse:
+    return FetchResponse(url=url, status_code=status_code, text=text)
+
+
+def test_block_detection_is_limited_to_rate_limits_and_challenges():
+    policy = HostPolicy()
+    assert policy.is_blocked(_response(429))
+    assert policy.is_blocked(_response(403, "<p>请输入验证码</p>"))
+    assert policy.is_blocked(_response(503, "Our systems have detected unusual traffic"))
+    assert policy.is_blocked(_response(200, "<form>", url="https://news.example/captcha?from=a"))
+    # Articles and plain error pages that merely mention a marker are not blocks.
+    assert not policy.is_blocked(_response(200, "<p>网站加强了安全验证措施</p>"))
+    assert not policy.is_blocked(_response(404, "<p>captcha</p>"))
+    assert not policy.is_blocked(_response(403, "Forbidden"))
+    assert not policy.is_blocked(_response(503, "Service Unavailable"))
+
+
+def test_process_wide_scheduler_is_disabled_until_configured():
+    assert get_politeness().enabled is False
+    scheduler = PolitenessScheduler(enabled=False)
+    with scheduler.slot("https://news.example/a/1") as slot:
+        slot.record(_response(429))
+    assert scheduler.stats() == {"enabled": False, "hosts": {}}
+
+
+def test_block_pauses_host_and_slows_it_down():
+    scheduler = PolitenessScheduler(HostPolicy(rate=4.0, burst=4.0))
+    with scheduler.slot("https://news.example/a/1") as slot:
+        slot.record(_response(429))
+    host = scheduler.stats()["hosts"]["news.example"]
+    assert host["blocked"] == 1
+    assert host["rate"] == 2.0
+    assert host["paused_for"] > 0
+
+
+@pytest.fixture
+def scheduler_reset():
+    yield get_politeness()
+    configure_politeness(HostPolicy(), enabled=False)
+
+
+class _Crawler:
+    def __init__(self, url, fetcher):
+        self.url = url
+        self.fetcher = fetcher
+
+    async def afetch_content(self):
+        return await self.fetcher.afetch(FetchRequest(url=self.url))
+
+    async def aparse_content(self, html):
+        return None
+
+
+def _mock_fetcher(handler):
+    fetcher = AsyncRequestsFetcher()
+
+    def factory(config):
+        client = _create_httpx_client(config)
+        client._transport = httpx.MockTransport(handler)
+        return client
+
+    fetcher.pool = AsyncSessionPool(factory)
+    return fetcher
+
+
+def test_pipeline_enables_per_host_throttling(scheduler_reset):
+    fetcher = _mock_fetcher(lambda request: httpx.Response(200, text="<html></html>"))
+    urls = [f"https://news.example/a/{index}" for index in range(5)]
+    pipeline = CrawlPipeline(
+        resolver=lambda record: _Crawler(record.url, fetcher),
+        sink=lambda crawler, item: None,
+        skip_if=lambda crawler: False,
+        validate=False,
+        report_interval=0,
+        politeness=HostPolicy(rate=20.0, burst=1.0),
+    )
+
+    started = time.perf_counter()
+    snapshot = pipeline.run(urls)
+    assert snapshot["stages"]["fetch"]["completed"] == 5
+    # One request immediately, then one every 50ms.
+    assert time.perf_counter() - started >= 0.18
+    assert scheduler_reset.stats()["hosts"]["news.example"]["requests"] == 5
+
+
+def test_pipeline_keeps_an_already_configured_scheduler(scheduler_reset):
+    configure_politeness(HostPolicy(rate=99.0), enabled=True)
+    CrawlPipeline(resolver=lambda record: None, report_interval=0).run([])
+    assert scheduler_reset.default.rate == 99.0
+
+
+def test_cli_configures_politeness_from_the_service_settings(scheduler_reset, monkeypatch, tmp_path):
+    from news_crawler import __main__ as cli
+    from news_extractor_core import config
+
+    monkeypatch.setattr(config, "HOST_RATE_LIMIT", 0.5)
+    monkeypatch.setattr(config, "HOST_MAX_IN_FLIGHT", 2)
+    captured = {}
+
+    class _Pipeline:
+        def __init__(self, **kwargs):
+            captured.update(kwargs)
+
+        def run(self, source):
+            return {"stages": {}}
+
+    monkeypatch.setattr(cli, "CrawlPipeline", _Pipeline)
+    urls = tmp_path / "urls.txt"
+    urls.write_text("https://news.example/a/1\n", encoding="utf-8")
+    assert cli.main([str(urls), "--save-path", str(tmp_path / "out"), "--report-interval", "0"]) == 0
+    assert scheduler_reset.enabled
+    assert scheduler_reset.default.rate == 0.5 and scheduler_reset.default.max_in_flight == 2
+    assert captured["politeness"] == scheduler_reset.default
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import time
+from email.utils import formatdate
+
+from news_crawler.core import CachingFetcher, FetchRequest, FetchResponse, ResponseCache
+
+
+class _Origin:
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+        self.requests = []
+
+    def fetch_response(self, request: FetchRequest) -> FetchResponse:
+        self.requests.append(request)
+        if self.headers.get("ETag") and (request.headers or {}).get("If-None-Match") == self.headers["ETag"]:
+            return FetchResponse(url=request.url, status_code=304, text="")
+        return FetchResponse(url=request.url, status_code=200, text=f"body {len(self.requests)}", headers=self.headers)
+
+
+def test_key_varies_with_headers_cookies_and_impersonation():
+    base = FetchRequest(url="https://news.example/a/1", headers={"User-Agent": "a"})
+    key = ResponseCache.key_for(base)
+    assert key == ResponseCache.key_for(FetchRequest(url="https://news.example/a/1", headers={"user-agent": "a"}))
+    assert key == ResponseCache.key_for(
+        FetchRequest(url="https://news.example/a/1", headers={"User-Agent": "a", "If-None-Match": '"v1"'})
+    )
+    assert key != ResponseCache.key_for(FetchRequest(url="https://news.example/a/1", headers={"User-Agent": "b"}))
+    assert key != ResponseCache.key_for(
+        FetchRequest(url="https://news.example/a/1", headers={"User-Agent": "a"}, cookies={"sid": "1"})
+    )
+    assert key != ResponseCache.key_for(
+        FetchRequest(url="https://news.example/a/1", headers={"User-Agent": "a"}, impersonate="chrome")
+    )
+
+
+def test_responses_without_freshness_are_not_reused_by_default():
+    origin = _Origin()
+    fetcher = CachingFetcher(origin, ResponseCache())
+    request = FetchRequest(url="https://news.example/a/1")
+    assert fetcher.fetch(request) == "body 1"
+    assert fetcher.fetch(request) == "body 2"
+    assert fetcher.cache.stats()["stores"] == 0
+
+    heuristic = CachingFetcher(_Origin(), ResponseCache(heuristic=True))
+    assert heuristic.fetch(request) == heuristic.fetch(request) == "body 1"
+
+
+def test_freshness_comes_from_max_age_or_expires():
+    request = FetchRequest(url="https://news.example/a/1")
+    cases = [
+        ({"Cache-Control": "max-age=60"}, 1),
+        ({"Expires": formatdate(time.time() + 120, usegmt=True)}, 1),
+        ({"Expires": formatdate(time.time() - 120, usegmt=True)}, 2),
+        ({"Cache-Control": "max-age=60, no-cache"}, 2),
+    ]
+    for headers, fetches in cases:
+        origin = _Origin(headers)
+        fetcher = CachingFetcher(origin, ResponseCache())
+        fetcher.fetch(request)
+        fetcher.fetch(request)
+        assert len(origin.requests) == fetches, headers
+
+
+def test_validators_without_freshness_are_revalidated_every_time():
+    origin = _Origin({"ETag": '"v1"'})
+    fetcher = CachingFetcher(origin, ResponseCache())
+    request = FetchRequest(url="https://news.example/a/1")
+    assert fetcher.fetch(request) == "body 1"
+    assert fetcher.fetch(request) == "body 1"
+    assert origin.requests[-1].headers["If-None-Match"] == '"v1"'
+    assert fetcher.cache.stats()["revalidated"] == 1
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from news_crawler.core import FetchError, RetryBudget, RetryPolicy, is_retryable
+
+
+def test_budget_allows_min_retries_plus_ratio_of_requests():
+    budget = RetryBudget(ratio=0.5, min_retries=2, window=60.0)
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+    for _ in range(4):
+        budget.record_request()
+    # 2 + 0.5 * 4 = 4 retries allowed in the window, 2 already spent.
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+    stats = budget.stats()
+    assert stats["retries"] == 4 and stats["exhausted"] == 2
+
+
+def test_budget_window_slides():
+    budget = RetryBudget(ratio=0.0, min_retries=1, window=0.0)
+    assert budget.try_spend()
+    # With a zero-length window the previous retry has already expired.
+    assert budget.try_spend()
+
+
+def test_retry_classification():
+    assert is_retryable(TimeoutError())
+    assert is_retryable(FetchError("503", status_code=503, retryable=True))
+    assert not is_retryable(FetchError("404", status_code=404))
+    assert not is_retryable(ValueError("bad url"))
+
+
+def test_policy_honours_retry_after():
+    policy = RetryPolicy(base_delay=0.1, jitter=False, max_retry_after=30.0)
+    assert policy.delay(3) == 0.4
+    slow_down = FetchError("429", status_code=429, retryable=True, retry_after=5.0)
+    assert policy.delay(1, slow_down) == 5.0
+    too_long = FetchError("429", status_code=429, retryable=True, retry_after=120.0)
+    assert not policy.should_retry(too_long)
+
+
+class _FlakyFetcher:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def fetch(self, request):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    async def afetch(self, request):
+        return self.fetch(request)
+
+
+FRAME = '<iframe id="mainFrame" src="/PostView.naver?blogId=sample&logNo=1"></iframe>'
+
+
+def _naver(fetcher):
+    from news_crawler.naver_news.naver_news import NaverNewsCrawler
+
+    crawler = NaverNewsCrawler("https://blog.naver.com/sample/1", save_path=None, fetcher=fetcher, async_fetcher=fetcher)
+    crawler.retry_policy = RetryPolicy(base_delay=0.0, jitter=False)
+    return crawler
+
+
+def test_naver_iframe_lookup_uses_the_retry_policy():
+    gone = _FlakyFetcher(FetchError("404", status_code=404))
+    with pytest.raises(FetchError):
+        _naver(gone).get_iframe_url_path()
+    assert gone.calls == 1
+
+    flaky = _FlakyFetcher(FetchError("503", status_code=503, retryable=True), FRAME)
+    url = asyncio.run(_naver(flaky).aget_iframe_url_path())
+    assert url == "https://blog.naver.com/PostView.naver?blogId=sample&logNo=1"
+    assert flaky.calls == 2
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import threading
+
+from news_crawler.core import PoolConfig, SessionPool
+
+
+class _Session:
+    def __init__(self, config: PoolConfig):
+        self.config = config
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_sessions_of_exited_threads_are_retired():
+    created = []
+
+    def factory(config):
+        created.append(_Session(config))
+        return created[-1]
+
+    pool = SessionPool(factory)
+    for _ in range(10):
+        worker = threading.Thread(target=pool.get)
+        worker.start()
+        worker.join()
+
+    session = pool.get()
+    assert pool.get() is session
+    assert len(pool) == 1
+    assert len(created) == 11
+    assert all(stale.closed for stale in created[:-1])
+    assert not session.closed
+
+    pool.close()
+    assert session.closed and len(pool) == 0
+
+
+def test_retired_requests_sessions_keep_the_shared_adapter_open():
+    from news_crawler.core.fetchers import (
+        _close_requests_adapter,
+        _create_requests_session,
+        _retire_requests_session,
+    )
+
+    pool = SessionPool(_create_requests_session, retire=_retire_requests_session)
+    try:
+        worker = threading.Thread(target=pool.get)
+        worker.start()
+        worker.join()
+        adapter = _create_requests_session(pool.config).get_adapter("https://news.example/")
+        adapter.poolmanager.connection_from_url("https://news.example/")
+
+        pool.get()
+        assert len(pool) == 1
+        # Retiring the exited thread's session left the shared connections alone.
+        assert len(adapter.poolmanager.pools) == 1
+    finally:
+        pool.close()
+        _close_requests_adapter()
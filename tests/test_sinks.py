@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+
+import pytest
+
+from news_crawler.core import JsonFileSink, JsonlSink, NewsItem, open_sink
+
+
+def _items(count: int):
+    return [
+        NewsItem(title=f"title {i}", news_url=f"https://example.com/a/{i}", news_id=f"a{i}", texts=["x" * 200])
+        for i in range(count)
+    ]
+
+
+def test_json_file_sink_writes_one_file_per_article(tmp_path):
+    with JsonFileSink(tmp_path) as sink:
+        sink.write_many(_items(3))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a0.json", "a1.json", "a2.json"]
+    assert json.loads((tmp_path / "a1.json").read_text(encoding="utf-8"))["title"] == "title 1"
+
+
+def test_jsonl_sink_rotates_and_only_publishes_complete_files(tmp_path):
+    sink = JsonlSink(tmp_path, max_bytes=4096, compress=False)
+    sink.write_many(_items(100))
+    sink.close()
+    files = sorted(tmp_path.iterdir())
+    assert len(files) > 1
+    assert all(path.name.endswith(".jsonl") for path in files)
+    lines = [line for path in files for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [json.loads(line)["news_id"] for line in lines] == [f"a{i}" for i in range(100)]
+
+
+def test_jsonl_sink_gzip_round_trip(tmp_path):
+    with JsonlSink(tmp_path) as sink:
+        sink.write_many(_items(20))
+    (path,) = tmp_path.iterdir()
+    assert path.name.endswith(".jsonl.gz")
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        assert [json.loads(line)["title"] for line in handle] == [f"title {i}" for i in range(20)]
+
+
+def test_parquet_sink_round_trip(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    with open_sink("parquet", tmp_path, row_group_size=50) as sink:
+        sink.write_many(_items(120))
+    (path,) = tmp_path.iterdir()
+    table = pq.read_table(path)
+    assert table.num_rows == 120
+    assert pq.ParquetFile(path).num_row_groups == 3
+
+
+def test_open_sink_rejects_unknown_formats(tmp_path):
+    with pytest.raises(ValueError):
+        open_sink("xml", tmp_path)
+    with pytest.raises(ValueError):
+        open_sink("jsonl")
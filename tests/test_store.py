@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+
+from news_crawler.core import ArticleStore, NewsItem
+from news_crawler.detik_news import DetikNewsCrawler
+from news_crawler.naver_news import NaverNewsCrawler
+from news_extractor_core.services.cache import ResultCache
+
+
+def _item(url: str, news_id: str, title: str = "title") -> NewsItem:
+    return NewsItem(title=title, news_url=url, news_id=news_id, texts=[title])
+
+
+def test_articles_with_the_same_url_id_are_stored_separately(tmp_path):
+    with ArticleStore(tmp_path / "articles.sqlite3", flush_interval=0) as store:
+        first = DetikNewsCrawler("http://news.detik.com/berita/d-1/a", save_path=None)
+        second = DetikNewsCrawler("http://news.detik.com/berita/d-2/b", save_path=None)
+        store.write(_item(first.new_url, "x", "first"), first)
+        assert store.seen(first)
+        assert not store.seen(second)
+        store.write(_item(second.new_url, "x", "second"), second)
+        assert store.count() == 2
+
+
+def test_seen_matches_url_variants(tmp_path):
+    with ArticleStore(tmp_path / "articles.sqlite3", flush_interval=0) as store:
+        crawler = NaverNewsCrawler("https://blog.naver.com/alice/223456789012", save_path=None)
+        store.write(_item(crawler.new_url, crawler.get_article_id()), crawler)
+        store.flush()
+        assert store.seen(NaverNewsCrawler("http://blog.naver.com/alice/223456789012/?utm_source=x", save_path=None))
+        assert not store.seen(NaverNewsCrawler("https://blog.naver.com/bob/223456789012", save_path=None))
+
+
+def test_result_cache_reads_through_the_store_off_the_event_loop(tmp_path):
+    with ArticleStore(tmp_path / "articles.sqlite3", flush_interval=0) as store:
+        key = ("detik", "https://news.detik.com/berita/d-1/a")
+        cache = ResultCache(max_entries=0, ttl=0, store=store)
+
+        async def main():
+            assert await cache.aget(key) is None
+            await cache.aput(key, _item(key[1], "d-1"))
+            return await cache.aget(key)
+
+        assert asyncio.run(main()).news_id == "d-1"
+        assert cache.stats()["store_hits"] == 1
+
+
+def test_seen_id_finds_pending_and_flushed_articles(tmp_path):
+    with ArticleStore(tmp_path / "articles.sqlite3", flush_interval=0) as store:
+        crawler = DetikNewsCrawler("http://news.detik.com/berita/d-1/a", save_path=None)
+        store.write(_item(crawler.new_url, "x", "first"), crawler)
+        assert store.seen_id("detik", "x")
+        store.flush()
+        assert store.seen_id("detik", "x")
+        assert store.get_by_id("detik", "x").title == "first"
+        assert not store.seen_id("detik", "y")
+        assert not store.seen_id("naver", "x")
+
+
+def test_reader_connections_stay_bounded_across_threads(tmp_path):
+    with ArticleStore(tmp_path / "articles.sqlite3", flush_interval=0, readers=2) as store:
+        threads = [threading.Thread(target=store.count) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(store._readers) <= 2